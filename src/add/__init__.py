@@ -2,10 +2,18 @@
 
 from __future__ import annotations
 
-from .utils import add_business_logic, read_project_config, validate_project
+from .utils import (
+    add_business_logic,
+    add_business_logic_batch,
+    load_entity_names,
+    read_project_config,
+    validate_project,
+)
 
 __all__ = [
     "add_business_logic",
+    "add_business_logic_batch",
+    "load_entity_names",
     "read_project_config",
     "validate_project",
 ]
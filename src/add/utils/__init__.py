@@ -3,8 +3,14 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Callable, Iterable
 
-from ._entity import _format_comment, _normalize_entity_name
+from ._entity import (
+    _format_comment,
+    _normalize_entity_name,
+    _validate_entity_name,
+    load_entity_names,
+)
 from ._injection import (
     _add_table_to_module_package,
     _add_table_to_tables_py,
@@ -15,6 +21,7 @@ from ._injection import (
     _register_routes_ddd,
     _register_routes_mvc,
     _update_init_file,
+    injection_session,
 )
 from ._paths import (
     DDDAddPaths,
@@ -40,8 +47,11 @@ from ._templates import (
 
 __all__ = [
     "add_business_logic",
+    "add_business_logic_batch",
+    "load_entity_names",
     "read_project_config",
     "validate_project",
+    "injection_session",
     "_normalize_entity_name",
     "_format_comment",
     "_ensure_import_from",
@@ -73,29 +83,52 @@ __all__ = [
 
 def add_business_logic(project_path: Path, name: str) -> list[str]:
     """Add business logic templates to an existing project."""
+    return add_business_logic_batch(project_path, [name])
+
+
+def add_business_logic_batch(
+    project_path: Path, names: Iterable[str]
+) -> list[str]:
+    """Add business logic for several entities in a single pass.
+
+    The project config and add paths are resolved once and all shared-file
+    edits are queued on one injection session, so every ``__init__.py`` is
+    parsed and written once however many entities are added. Names are
+    validated up front; duplicates (after normalization) are skipped.
+    """
+    entities: dict[str, str] = {}
+    for name in names:
+        name_lower, name_capitalized = _validate_entity_name(name)
+        entities.setdefault(name_lower, name_capitalized)
+    if not entities:
+        raise ValueError("No entity names given.")
+
     config = read_project_config(project_path)
     design, orm = _extract_design_orm(config)
     uid = config.get("uid", "none")
     add_paths = _load_add_paths(project_path, design, config)
-    name_lower, name_capitalized = _normalize_entity_name(name)
-
+    add_templates: Callable[..., list[str]]
     if design == "ddd":
-        return _add_ddd_templates(
-            project_path,
-            add_paths,  # type: ignore[arg-type]
-            name_lower,
-            name_capitalized,
-            orm,
-            uid,
-        )
+        add_templates = _add_ddd_templates
     elif design == "mvc":
-        return _add_mvc_templates(
-            project_path,
-            add_paths,  # type: ignore[arg-type]
-            name_lower,
-            name_capitalized,
-            orm,
-            uid,
-        )
+        add_templates = _add_mvc_templates
     else:
         raise ValueError(f"Unsupported design pattern: {design}")
+
+    created_files: dict[str, None] = {}
+    # Queue every source edit and write each touched file once at the end.
+    with injection_session():
+        for name_lower, name_capitalized in entities.items():
+            created_files.update(
+                dict.fromkeys(
+                    add_templates(
+                        project_path,
+                        add_paths,  # type: ignore[arg-type]
+                        name_lower,
+                        name_capitalized,
+                        orm,
+                        uid,
+                    )
+                )
+            )
+    return list(created_files)
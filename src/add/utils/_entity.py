@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import keyword
+from pathlib import Path
+
 
 def _normalize_entity_name(name: str) -> tuple[str, str]:
     """Normalize entity name to snake_case and PascalCase variants."""
@@ -10,6 +13,27 @@ def _normalize_entity_name(name: str) -> tuple[str, str]:
     return normalized, capitalized
 
 
+def _validate_entity_name(name: str) -> tuple[str, str]:
+    """Normalize name, rejecting ones that are not valid Python modules."""
+    name_lower, name_capitalized = _normalize_entity_name(name.strip())
+    if not name_lower.isidentifier() or keyword.iskeyword(name_lower):
+        raise ValueError(f"Invalid entity name '{name}'.")
+    return name_lower, name_capitalized
+
+
+def load_entity_names(path: Path) -> list[str]:
+    """Read entity names from a file, one per line.
+
+    Blank lines and ``#`` comments are ignored.
+    """
+    names = []
+    for line in path.read_text().splitlines():
+        name = line.split("#", 1)[0].strip()
+        if name:
+            names.append(name)
+    return names
+
+
 def _format_comment(comment: str) -> str:
     """Normalize inline comment formatting (adds leading space and #)."""
     if not comment:
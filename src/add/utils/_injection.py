@@ -2,81 +2,399 @@
 
 from __future__ import annotations
 
+import ast
 import re
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Iterator, Sequence, TypeGuard
 
 from ._entity import _format_comment
-from ._templates import _render_template_string
+from ._templates import _render_template_path, _render_template_string
 
 ADD_MODULE_ROOT = Path(__file__).resolve().parent.parent
+MAX_LINE_LENGTH = 79
+
+
+_ACTIVE_SESSION: _InjectionSession | None = None
+
+
+@dataclass(slots=True)
+class _PendingEdits:
+    """Edits queued for one Python source file, applied in a single pass."""
+
+    path: Path
+    imports: list[tuple[str, str, str]] = field(default_factory=list)
+    all_names: list[str] = field(default_factory=list)
+    create_all: bool = False
+    register_calls: list[str] = field(default_factory=list)
+    appends: list[tuple[str, str, str]] = field(default_factory=list)
+
+
+class _InjectionSession:
+    """Collect source edits and write every touched file exactly once.
+
+    Each file is read once; on flush its original text is parsed once with
+    ``ast`` and all queued edits are applied from those node positions.
+    """
+
+    def __init__(self) -> None:
+        self._sources: dict[Path, str | None] = {}
+        self._edits: dict[Path, _PendingEdits] = {}
+
+    def source(self, path: Path) -> str | None:
+        """Return the on-disk text of path (None if missing), read once."""
+        if path not in self._sources:
+            self._sources[path] = path.read_text() if path.exists() else None
+        return self._sources[path]
+
+    def exists(self, path: Path) -> bool:
+        return self.source(path) is not None or path in self._edits
+
+    def edits(self, path: Path) -> _PendingEdits:
+        self.source(path)
+        if path not in self._edits:
+            self._edits[path] = _PendingEdits(path)
+        return self._edits[path]
+
+    def flush(self) -> None:
+        """Apply queued edits and write each changed file once."""
+        # Render everything first so a bad file aborts before any write.
+        updates: dict[Path, str] = {}
+        for path, edits in self._edits.items():
+            original = self._sources[path]
+            updated = _apply_edits(original or "", edits)
+            if original is None:
+                if updated and not updated.endswith("\n"):
+                    updated += "\n"
+                updates[path] = updated
+            elif updated != original:
+                updates[path] = updated
+        self._sources.clear()
+        self._edits.clear()
+
+        for path, updated in updates.items():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(updated)
+
+
+@contextmanager
+def injection_session() -> Iterator[_InjectionSession]:
+    """Batch source edits; files are written once when the block succeeds.
+
+    Nested calls share the outermost session, so helpers used on their own
+    still write immediately while a whole ``add`` run writes once.
+    """
+    global _ACTIVE_SESSION
+    if _ACTIVE_SESSION is not None:
+        yield _ACTIVE_SESSION
+        return
 
-
-def _update_init_file(
-    init_path: Path, import_line: str, export_name: str
-) -> None:
-    """Add import (and optionally __all__ export) to a module file."""
-    init_path.parent.mkdir(parents=True, exist_ok=True)
-    content = init_path.read_text() if init_path.exists() else ""
-
-    if import_line not in content:
-        lines = content.split("\n") if content else []
-        insert_pos = 0
-        for i, line in enumerate(lines):
-            if line.startswith("from ") or line.startswith("import "):
-                insert_pos = i + 1
-        lines.insert(insert_pos, import_line)
-        content = "\n".join(lines)
-        init_path.write_text(content)
-
-    if export_name:
-        content = init_path.read_text()
-        if "__all__" in content:
-            _add_to_all_list(init_path, export_name)
+    session = _InjectionSession()
+    _ACTIVE_SESSION = session
+    try:
+        yield session
+    finally:
+        _ACTIVE_SESSION = None
+    session.flush()
+
+
+def _end(node: ast.stmt | ast.expr) -> tuple[int, int]:
+    """Return a parsed node's end line and column (set by ``ast.parse``)."""
+    assert node.end_lineno is not None and node.end_col_offset is not None
+    return node.end_lineno, node.end_col_offset
+
+
+def _split_at(line: str, byte_offset: int) -> tuple[str, str]:
+    """Split a source line at an ``ast`` (UTF-8 byte) column offset."""
+    encoded = line.encode()
+    return encoded[:byte_offset].decode(), encoded[byte_offset:].decode()
+
+
+def _leading_indent(line: str) -> str:
+    return line[: len(line) - len(line.lstrip())]
+
+
+def _with_trailing_comma(line: str) -> str:
+    """Ensure the code part of a collection item line ends with a comma."""
+    code, hash_mark, comment = line.partition("#")
+    stripped = code.rstrip()
+    if stripped.endswith((",", "(", "[")):
+        return line
+    spacing = code[len(stripped) :]
+    return f"{stripped},{spacing}{hash_mark}{comment}"
+
+
+def _extend_collection(
+    lines: list[str], node: ast.expr | ast.ImportFrom, items: list[str]
+) -> list[str]:
+    """Return node's source lines with items appended before its closer."""
+    end_lineno, end_col_offset = _end(node)
+    first = node.lineno - 1
+    last = end_lineno - 1
+    closing_line = lines[last]
+    head, tail = _split_at(closing_line, end_col_offset - 1)
+
+    if last > first and not head.strip():
+        # Closer on its own line: add one indented item per line.
+        body = lines[first:last]
+        indent = _leading_indent(body[-1]) if len(body) > 1 else head + "    "
+        body[-1] = _with_trailing_comma(body[-1])
+        return body + [f"{indent}{item}," for item in items] + [closing_line]
+
+    head = head.rstrip()
+    joined = ", ".join(items)
+    if head.endswith(("(", "[")):
+        separator = ""
+        if isinstance(node, ast.Tuple) and len(items) == 1:
+            joined += ","
+    elif head.endswith(","):
+        separator = " "
+    else:
+        separator = ", "
+    updated = f"{head}{separator}{joined}{tail}"
+    if len(updated) <= MAX_LINE_LENGTH or not isinstance(
+        node, (ast.Tuple, ast.List)
+    ):
+        return lines[first:last] + [updated]
+
+    # Too long for one line: explode into one item per line, black-style.
+    line = lines[first].encode()
+    opener = line[: node.col_offset + 1].decode()
+    indent = _leading_indent(opener) + "    "
+    existing = [
+        line[elt.col_offset : elt.end_col_offset].decode() for elt in node.elts
+    ]
+    body = [f"{indent}{item}," for item in [*existing, *items]]
+    return [opener, *body, f"{_leading_indent(opener)}{tail}"]
+
+
+def _extend_import(
+    lines: list[str], node: ast.ImportFrom, names: list[str], comment: str
+) -> list[str]:
+    """Return an import statement's lines with names appended."""
+    end_lineno, end_col_offset = _end(node)
+    code, rest = _split_at(lines[end_lineno - 1], end_col_offset)
+    if code.endswith(")"):
+        return _extend_collection(lines, node, names)
+
+    if not rest.strip():
+        rest = _format_comment(comment)
+    start = node.lineno - 1
+    last = end_lineno - 1
+    return lines[start:last] + [f"{code}, {', '.join(names)}{rest}"]
+
+
+def _imported_names(node: ast.ImportFrom) -> set[str]:
+    return {alias.asname or alias.name for alias in node.names} | {
+        alias.name for alias in node.names
+    }
+
+
+def _find_import_from(
+    nodes: Sequence[ast.stmt], level: int, module: str | None
+) -> ast.ImportFrom | None:
+    for node in nodes:
+        if (
+            isinstance(node, ast.ImportFrom)
+            and node.level == level
+            and node.module == module
+        ):
+            return node
+    return None
+
+
+def _find_all_node(tree: ast.Module) -> ast.Tuple | ast.List | None:
+    for node in tree.body:
+        if isinstance(node, ast.Assign):
+            targets = node.targets
+        elif isinstance(node, ast.AnnAssign):
+            targets = [node.target]
         else:
-            suffix = f'\n__all__ = (\n    "{export_name}",\n)\n'
-            if content and not content.endswith("\n"):
-                suffix = "\n" + suffix.lstrip("\n")
-            init_path.write_text(f"{content}{suffix}")
-
-
-def _find_closing_parenthesis(lines: list[str], start_index: int) -> int:
-    """Locate the index of the closing parenthesis in a multiline import."""
-    for idx in range(start_index, len(lines)):
-        if ")" in lines[idx]:
-            return idx
-    return len(lines)
-
+            continue
+        if any(
+            isinstance(target, ast.Name) and target.id == "__all__"
+            for target in targets
+        ) and isinstance(node.value, (ast.Tuple, ast.List)):
+            return node.value
+    return None
+
+
+def _is_register_call(node: ast.AST) -> TypeGuard[ast.Expr]:
+    return (
+        isinstance(node, ast.Expr)
+        and isinstance(node.value, ast.Call)
+        and isinstance(node.value.func, ast.Attribute)
+        and node.value.func.attr == "register"
+        and len(node.value.args) == 1
+        and isinstance(node.value.args[0], ast.Name)
+        and node.value.args[0].id == "app"
+    )
 
-def _detect_indent(lines: list[str], closing_index: int) -> str:
-    """Detect indentation level for items inside a multiline import."""
-    if closing_index >= len(lines):
-        return "    "
 
-    closing_line = lines[closing_index]
-    match = re.match(r"(\s*)\)", closing_line)
-    if match:
-        return match.group(1) or "    "
+def _defined_names(tree: ast.Module) -> set[str]:
+    """Return names bound at module level by definitions and imports."""
+    names: set[str] = set()
+    for node in tree.body:
+        if isinstance(node, (ast.ClassDef, ast.FunctionDef)):
+            names.add(node.name)
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            names.update(
+                alias.asname or alias.name.partition(".")[0]
+                for alias in node.names
+            )
+        elif isinstance(node, ast.Assign):
+            names.update(
+                target.id
+                for target in node.targets
+                if isinstance(target, ast.Name)
+            )
+    return names
+
+
+def _apply_edits(text: str, edits: _PendingEdits) -> str:
+    """Apply every queued edit to text using a single ``ast`` parse."""
+    try:
+        tree = ast.parse(text)
+    except SyntaxError as exc:
+        raise ValueError(
+            f"Cannot update {edits.path}: invalid Python "
+            f"({exc.msg}, line {exc.lineno})."
+        ) from exc
+
+    lines = text.split("\n") if text else []
+    # Each edit replaces lines[start:stop]; insertions have start == stop.
+    changes: dict[tuple[int, int], list[str]] = {}
+
+    import_nodes = [
+        node
+        for node in tree.body
+        if isinstance(node, (ast.Import, ast.ImportFrom))
+    ]
+    if import_nodes:
+        import_end = max(_end(node)[0] for node in import_nodes)
+    elif ast.get_docstring(tree) is not None:
+        import_end = _end(tree.body[0])[0]
+    else:
+        import_end = 0
+
+    new_imports: list[str] = []
+    new_from_lines: dict[str, int] = {}
+    extended: dict[int, tuple[ast.ImportFrom, list[str], str]] = {}
+    present_lines = {line.strip() for line in lines}
+    for kind, target, comment in edits.imports:
+        if kind == "line":
+            statement = ast.parse(target).body[0]
+            if target.strip() in present_lines or target in new_imports:
+                continue
+            if isinstance(statement, ast.ImportFrom):
+                existing = _find_import_from(
+                    import_nodes, statement.level, statement.module
+                )
+                if existing is not None and all(
+                    (alias.asname or alias.name) in _imported_names(existing)
+                    for alias in statement.names
+                ):
+                    continue
+            new_imports.append(target)
+            continue
 
-    match = re.match(r"(\s*)", closing_line)
-    return (match.group(1) if match else "") or "    "
+        module, name = target.rsplit(":", 1)
+        level = len(module) - len(module.lstrip("."))
+        node = _find_import_from(import_nodes, level, module[level:] or None)
+        if node is not None:
+            if name in _imported_names(node):
+                continue
+            _, names, _ = extended.setdefault(node.lineno, (node, [], comment))
+            if name not in names:
+                names.append(name)
+        elif module in new_from_lines:
+            index = new_from_lines[module]
+            code, hash_mark, rest = new_imports[index].partition("  #")
+            if not re.search(rf"[ ,]{re.escape(name)}(,|$)", code):
+                new_imports[index] = f"{code}, {name}{hash_mark}{rest}"
+        else:
+            new_from_lines[module] = len(new_imports)
+            new_imports.append(
+                f"from {module} import {name}{_format_comment(comment)}"
+            )
 
+    for node, names, comment in extended.values():
+        changes[(node.lineno - 1, _end(node)[0])] = _extend_import(
+            lines, node, names, comment
+        )
+    if new_imports:
+        changes[(import_end, import_end)] = new_imports
+
+    all_node = _find_all_node(tree)
+    create_all: list[str] = []
+    if edits.all_names:
+        existing_all = set()
+        if all_node is not None:
+            existing_all = {
+                elt.value
+                for elt in all_node.elts
+                if isinstance(elt, ast.Constant)
+            }
+        missing = [
+            name
+            for name in dict.fromkeys(edits.all_names)
+            if name not in existing_all
+        ]
+        if all_node is not None and missing:
+            changes[(all_node.lineno - 1, _end(all_node)[0])] = (
+                _extend_collection(
+                    lines, all_node, [f'"{name}"' for name in missing]
+                )
+            )
+        elif all_node is None and edits.create_all and "__all__" not in text:
+            create_all = missing
+
+    if edits.register_calls:
+        registered = [
+            node for node in ast.walk(tree) if _is_register_call(node)
+        ]
+        pending = [
+            call
+            for call in dict.fromkeys(edits.register_calls)
+            if call.strip() not in present_lines
+        ]
+        if registered and pending:
+            after = max(_end(node)[0] for node in registered)
+            changes[(after, after)] = pending
+
+    for start, stop in sorted(changes, reverse=True):
+        lines[start:stop] = changes[(start, stop)]
+    content = "\n".join(lines)
+
+    if create_all:
+        items = "".join(f'    "{name}",\n' for name in create_all)
+        suffix = f"\n__all__ = (\n{items})\n"
+        if content and not content.endswith("\n"):
+            suffix = "\n" + suffix.lstrip("\n")
+        content += suffix
+
+    defined = _defined_names(tree)
+    for name, block, separator in edits.appends:
+        if name in defined:
+            continue
+        defined.add(name)
+        if not content.endswith("\n"):
+            content += "\n"
+        content += f"{separator}{block}\n"
+    return content
 
-def _append_inline_paren_import(
-    line: str, import_item: str, trailing_comment: str
-) -> str:
-    """Append an import item to a single-line parenthesized import."""
-    comment = ""
-    base_line = line
-    if "#" in line:
-        base_line, existing_comment = line.split("#", 1)
-        comment = "  #" + existing_comment
 
-    before_paren, after_paren = base_line.split("(", 1)
-    inside, after = after_paren.split(")", 1)
-    inside = inside.strip()
-    updated_inside = f"{inside}, {import_item}" if inside else f"{import_item}"
-    comment = comment or _format_comment(trailing_comment)
-    return f"{before_paren}({updated_inside}){after}{comment}"
+def _update_init_file(
+    init_path: Path, import_line: str, export_name: str
+) -> None:
+    """Add import (and optionally __all__ export) to a module file."""
+    with injection_session() as session:
+        edits = session.edits(init_path)
+        edits.imports.append(("line", import_line, ""))
+        if export_name:
+            edits.all_names.append(export_name)
+            edits.create_all = True
 
 
 def _ensure_import_from(
@@ -87,85 +405,17 @@ def _ensure_import_from(
     trailing_comment: str = "",
 ) -> None:
     """Ensure `from {module} import {import_item}` exists in file_path."""
-    formatted_comment = _format_comment(trailing_comment)
-
-    if not file_path.exists():
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        file_path.write_text(
-            f"from {module} import {import_item}{formatted_comment}\n"
+    with injection_session() as session:
+        session.edits(file_path).imports.append(
+            ("from", f"{module}:{import_item}", trailing_comment)
         )
-        return
-
-    lines = file_path.read_text().split("\n")
-    prefix = f"from {module} import "
-
-    for i, line in enumerate(lines):
-        stripped = line.strip()
-        if not stripped.startswith(prefix):
-            continue
-
-        if "(" in stripped and ")" in stripped:
-            inside = stripped.split("(", 1)[1].rsplit(")", 1)[0]
-            if re.search(rf"\b{re.escape(import_item)}\b", inside):
-                return
-            lines[i] = _append_inline_paren_import(
-                line, import_item, trailing_comment
-            )
-            file_path.write_text("\n".join(lines))
-            return
-
-        if "(" in stripped:
-            closing_index = _find_closing_parenthesis(lines, i)
-            block = "\n".join(lines[i : closing_index + 1])
-            if re.search(rf"\b{re.escape(import_item)}\b", block):
-                return
-            indent = _detect_indent(lines, closing_index)
-            lines.insert(closing_index, f"{indent}{import_item},")
-            file_path.write_text("\n".join(lines))
-            return
-
-        if re.search(rf"\b{re.escape(import_item)}\b", stripped):
-            return
-
-        comment = ""
-        if "#" in line:
-            base, existing_comment = line.split("#", 1)
-            line = base.rstrip()
-            comment = "  #" + existing_comment
-        elif formatted_comment:
-            comment = formatted_comment
-
-        lines[i] = f"{line.rstrip()}, {import_item}{comment}"
-        file_path.write_text("\n".join(lines))
-        return
-
-    insert_pos = 0
-    for i, line in enumerate(lines):
-        if line.startswith("from ") or line.startswith("import "):
-            insert_pos = i + 1
-    lines.insert(insert_pos, f"{prefix}{import_item}{formatted_comment}")
-    file_path.write_text("\n".join(lines))
 
 
 def _ensure_register_call(target_file: Path, register_call: str) -> None:
     """Ensure register(app) call is present after existing registrations."""
-    if not target_file.exists():
-        return
-
-    lines = target_file.read_text().split("\n")
-    stripped_call = register_call.strip()
-    if stripped_call in (line.strip() for line in lines):
-        return
-
-    inserted = False
-    for i in range(len(lines) - 1, -1, -1):
-        if lines[i].strip().endswith(".register(app)"):
-            lines.insert(i + 1, register_call)
-            inserted = True
-            break
-
-    if inserted:
-        target_file.write_text("\n".join(lines))
+    with injection_session() as session:
+        if session.exists(target_file):
+            session.edits(target_file).register_calls.append(register_call)
 
 
 def _add_table_to_tables_py(
@@ -176,16 +426,6 @@ def _add_table_to_tables_py(
     context: dict[str, str],
 ) -> None:
     """Add table class to tables.py file."""
-    if not tables_path.exists():
-        return
-
-    content = tables_path.read_text()
-    table_class_name = f"{name_capitalized}Table"
-
-    # Check if table already exists
-    if table_class_name in content:
-        return
-
     # Get the table template
     template_file = (
         ADD_MODULE_ROOT
@@ -197,42 +437,27 @@ def _add_table_to_tables_py(
     if not template_file.exists():
         return
 
-    template_content = template_file.read_text()
-    # Extract just the class definition (skip imports)
-    lines = template_content.split("\n")
-    class_start = None
-    for i, line in enumerate(lines):
-        if line.startswith("class "):
-            class_start = i
-            break
+    with injection_session() as session:
+        if not session.exists(tables_path):
+            return
+
+        table_class_name = f"{name_capitalized}Table"
+        template_content = template_file.read_text()
+        # Extract just the class definition (skip imports)
+        lines = template_content.split("\n")
+        class_start = None
+        for i, line in enumerate(lines):
+            if line.startswith("class "):
+                class_start = i
+                break
+        if class_start is None:
+            return
 
-    if class_start is not None:
         class_definition = "\n".join(lines[class_start:])
         rendered_class = _render_template_string(class_definition, context)
-
-        # Add to end of file
-        if not content.endswith("\n"):
-            content += "\n"
-        content += f"\n\n{rendered_class}\n"
-        tables_path.write_text(content)
-
-        # Update __all__ if it exists
-        if "__all__" in content:
-            # Use regex to add to __all__ tuple
-            content = tables_path.read_text()
-            all_pattern = r"(__all__\s*=\s*\(\s*)(.*?)(\s*\))"
-            match = re.search(all_pattern, content, re.DOTALL)
-            if match:
-                current_items = match.group(2).strip()
-                if current_items.endswith(","):
-                    new_items = f'{current_items}\n    "{table_class_name}",'
-                else:
-                    new_items = f'{current_items},\n    "{table_class_name}",'
-                new_all = f"{match.group(1)}{new_items}{match.group(3)}"
-                content = (
-                    content[: match.start()] + new_all + content[match.end() :]
-                )
-                tables_path.write_text(content)
+        edits = session.edits(tables_path)
+        edits.appends.append((table_class_name, rendered_class, "\n\n"))
+        edits.all_names.append(table_class_name)
 
 
 def _add_table_to_module_package(
@@ -245,46 +470,46 @@ def _add_table_to_module_package(
     """Create tables/<module_name>.py and export class from tables/__init__.py."""
     from ._templates import _render_template_file
 
-    if not tables_init_path.exists() or tables_init_path.name != "__init__.py":
+    if tables_init_path.name != "__init__.py":
         return None
     if not template_file.exists():
         return None
 
-    table_module_file = tables_init_path.parent / f"{module_name}.py"
-    if table_module_file.exists():
+    with injection_session() as session:
+        if not session.exists(tables_init_path):
+            return None
+
+        table_module_file = tables_init_path.parent / f"{module_name}.py"
+        created = not table_module_file.exists()
+        if created:
+            _render_template_file(template_file, table_module_file, context)
         _update_init_file(
             tables_init_path,
             f"from .{module_name} import {table_class_name}",
             table_class_name,
         )
-        return None
-
-    _render_template_file(template_file, table_module_file, context)
-    _update_init_file(
-        tables_init_path,
-        f"from .{module_name} import {table_class_name}",
-        table_class_name,
-    )
-    return table_module_file
+    return table_module_file if created else None
 
 
 def _register_routes_ddd(presentation_path: Path, name: str) -> None:
     """Register routes in DDD presentation/__init__.py."""
     pres_init = presentation_path / "__init__.py"
-    if not pres_init.exists():
-        return
+    with injection_session() as session:
+        if not session.exists(pres_init):
+            return
 
-    _ensure_import_from(pres_init, ".", name)
-    _ensure_register_call(pres_init, f"    {name}.register(app)")
+        _ensure_import_from(pres_init, ".", name)
+        _ensure_register_call(pres_init, f"    {name}.register(app)")
 
 
 def _register_routes_mvc(urls_path: Path, name: str) -> None:
     """Register routes in MVC urls.py."""
-    if not urls_path.exists():
-        return
+    with injection_session() as session:
+        if not session.exists(urls_path):
+            return
 
-    _ensure_import_from(urls_path, ".views", name)
-    _ensure_register_call(urls_path, f"    {name}.register(app)")
+        _ensure_import_from(urls_path, ".views", name)
+        _ensure_register_call(urls_path, f"    {name}.register(app)")
 
 
 def _append_class_to_file(
@@ -294,35 +519,19 @@ def _append_class_to_file(
     class_name: str,
 ) -> None:
     """Append a class definition from a template to a file if it doesn't exist."""
-    if not file_path.exists() or not template_path.exists():
-        return
-
-    content = file_path.read_text()
-    if class_name in content:
+    if not template_path.exists():
         return
 
-    class_def = _render_template_string(template_path.read_text(), context)
+    with injection_session() as session:
+        if not session.exists(file_path):
+            return
 
-    if not content.endswith("\n"):
-        content += "\n"
-    content += f"\n{class_def}\n"
-    file_path.write_text(content)
+        class_def = _render_template_path(template_path, context)
+        session.edits(file_path).appends.append((class_name, class_def, "\n"))
 
 
 def _add_to_all_list(file_path: Path, item_name: str) -> None:
     """Add an item to the __all__ tuple in a file."""
-    if not file_path.exists():
-        return
-
-    content = file_path.read_text()
-    all_pattern = r"(__all__\s*=\s*\(\s*)(.*?)(\s*\))"
-    match = re.search(all_pattern, content, re.DOTALL)
-    if match and item_name not in match.group(2):
-        current_items = match.group(2).strip()
-        if current_items and not current_items.endswith(","):
-            new_items = f'{current_items},\n    "{item_name}",'
-        else:
-            new_items = f'{current_items}\n    "{item_name}",'
-        new_all = f"{match.group(1)}{new_items}{match.group(3)}"
-        content = content[: match.start()] + new_all + content[match.end() :]
-        file_path.write_text(content)
+    with injection_session() as session:
+        if session.exists(file_path):
+            session.edits(file_path).all_names.append(item_name)
@@ -4,29 +4,28 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from jinja2 import Environment, StrictUndefined
+from create.utils._template_cache import (
+    _render_template_path,
+    _render_template_text,
+)
 
 from ._paths import DDDAddPaths, MVCAddPaths
 
 ADD_MODULE_ROOT = Path(__file__).resolve().parent.parent
-JINJA_ENV = Environment(undefined=StrictUndefined)
 
 
 def _render_template_file(
     source: Path, target: Path, context: dict[str, str]
 ) -> None:
     """Render a Jinja2 template file to target location."""
-    template_content = source.read_text()
-    template = JINJA_ENV.from_string(template_content)
-    rendered = template.render(**context)
+    rendered = _render_template_path(source, context)
     target.parent.mkdir(parents=True, exist_ok=True)
     target.write_text(rendered)
 
 
 def _render_template_string(template_str: str, context: dict[str, str]) -> str:
     """Render a Jinja2 template string."""
-    template = JINJA_ENV.from_string(template_str)
-    return template.render(**context)
+    return _render_template_text(template_str, context)
 
 
 def _render_templates_from_directory(
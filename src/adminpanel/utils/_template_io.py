@@ -6,9 +6,7 @@ import shutil
 from pathlib import Path
 from typing import Mapping
 
-from jinja2 import Environment, StrictUndefined
-
-JINJA_ENV = Environment(undefined=StrictUndefined)
+from create.utils._template_cache import _render_template_path
 
 
 def _resolve_variant_target_rel_path(rel_path: Path, orm: str) -> Path | None:
@@ -54,9 +52,7 @@ def _render_template_file(
     """Render a Jinja2 template file to target location if missing."""
     if target.exists():
         return False
-    template_content = source.read_text()
-    template = JINJA_ENV.from_string(template_content)
-    rendered = template.render(**context)
+    rendered = _render_template_path(source, context)
     target.parent.mkdir(parents=True, exist_ok=True)
     target.write_text(rendered)
     return True
@@ -0,0 +1,385 @@
+"""Journaled project backups for commands that modify an existing project."""
+
+from __future__ import annotations
+
+import fnmatch
+import os
+import shutil
+import sys
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterable
+
+from add import read_project_config
+from create.utils._filesystem import _remove_path
+
+__all__ = ("DEFAULT_BACKUP_EXCLUDE", "SUBPROCESS_TARGETS", "project_backup")
+
+_WRITE_OPEN_FLAGS = (
+    os.O_WRONLY | os.O_RDWR | os.O_CREAT | os.O_TRUNC | os.O_APPEND
+)
+# Linux FICLONE ioctl: share the data blocks of a file copy-on-write.
+_FICLONE = 0x40049409
+
+# Files package managers (``uv add``, ``poetry lock``...) rewrite when run
+# for the project. Child processes bypass the audit hook, so these are
+# snapshotted before any subprocess starts.
+SUBPROCESS_TARGETS: tuple[str, ...] = (
+    "pyproject.toml",
+    "uv.lock",
+    "poetry.lock",
+)
+_SUBPROCESS_EVENTS = frozenset(
+    {"subprocess.Popen", "os.system", "os.posix_spawn", "os.spawn", "os.exec"}
+)
+
+_ACTIVE_JOURNALS: list[_ProjectJournal] = []
+_JOURNAL_STATE = threading.local()
+_JOURNAL_HOOK_INSTALLED = False
+
+
+def _clone_file(
+    source: str | os.PathLike[str], target: str | os.PathLike[str]
+) -> None:
+    """Copy source to target, sharing blocks via reflink when supported."""
+    if sys.platform == "linux":
+        import fcntl
+
+        try:
+            with open(source, "rb") as src, open(target, "wb") as dst:
+                fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+            shutil.copystat(source, target)
+            return
+        except OSError:
+            Path(target).unlink(missing_ok=True)
+    shutil.copy2(source, target)
+
+
+DEFAULT_BACKUP_EXCLUDE: tuple[str, ...] = (
+    ".git/",
+    ".venv/",
+    "venv/",
+    ".uv-cache/",
+    ".poetry-cache/",
+    "__pycache__/",
+    "node_modules/",
+    ".mypy_cache/",
+    ".pytest_cache/",
+    ".ruff_cache/",
+    "logs/",
+    "*.log",
+    "*.db",
+    "*.sqlite",
+    "*.sqlite3",
+)
+
+
+class _BackupScope:
+    """Decide which project paths are never snapshotted or restored.
+
+    Patterns use the .gitignore syntax subset of ``fnmatch`` globs, a
+    trailing ``/`` for directories, a ``/`` elsewhere to anchor at the
+    project root and a leading ``!`` to re-include; the last match wins.
+    """
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        self._rules: list[tuple[str, bool, bool, bool]] = []
+        for raw in patterns:
+            pattern = raw.strip()
+            if not pattern or pattern.startswith("#"):
+                continue
+            negated = pattern.startswith("!")
+            pattern = pattern.removeprefix("!")
+            dir_only = pattern.endswith("/")
+            pattern = pattern.rstrip("/")
+            anchored = "/" in pattern
+            self._rules.append(
+                (pattern.lstrip("/"), negated, dir_only, anchored)
+            )
+
+    @classmethod
+    def for_project(cls, project_path: Path) -> _BackupScope:
+        """Build the scope from defaults, .gitignore and project config."""
+        try:
+            config = read_project_config(project_path).get("backup", {})
+        except (OSError, ValueError):
+            config = {}
+        patterns = list(config.get("exclude", DEFAULT_BACKUP_EXCLUDE))
+        gitignore = project_path / ".gitignore"
+        if config.get("respect_gitignore", True) and gitignore.is_file():
+            patterns += gitignore.read_text().splitlines()
+        patterns += config.get("extend_exclude", [])
+        return cls(patterns)
+
+    def excludes(self, rel_path: Path, is_dir: bool) -> bool:
+        """Return whether a path relative to the project root is excluded."""
+        parts = rel_path.parts
+        excluded = False
+        for pattern, negated, dir_only, anchored in self._rules:
+            for depth in range(1, len(parts) + 1):
+                if dir_only and depth == len(parts) and not is_dir:
+                    continue
+                candidate = (
+                    "/".join(parts[:depth]) if anchored else parts[depth - 1]
+                )
+                if fnmatch.fnmatchcase(candidate, pattern):
+                    excluded = not negated
+                    break
+        return excluded
+
+
+class _ProjectJournal:
+    """Capture pre-images of the project files a command touches.
+
+    Every path is captured once, before its first modification, so backup
+    cost follows the size of the change rather than the project.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        journal_dir: Path,
+        scope: _BackupScope | None = None,
+    ) -> None:
+        self.root = root
+        self._root_prefix = os.path.join(str(root), "")
+        self._journal_dir = journal_dir
+        self._scope = scope or _BackupScope(())
+        self._pre_images: dict[Path, Path | None] = {}
+        self._created_dirs: list[Path] = []
+        self._removed_dirs: list[Path] = []
+
+    def _project_path(self, raw_path: object) -> Path | None:
+        if not isinstance(raw_path, (str, bytes, os.PathLike)):
+            return None
+        path = os.path.abspath(os.fsdecode(raw_path))
+        if path == str(self.root) or not path.startswith(self._root_prefix):
+            return None
+        return Path(path)
+
+    def _excluded(self, path: Path, is_dir: bool | None = None) -> bool:
+        if is_dir is None:
+            is_dir = path.is_dir()
+        return self._scope.excludes(path.relative_to(self.root), is_dir)
+
+    def _ignore_excluded(self, directory: str, names: list[str]) -> set[str]:
+        return {
+            name
+            for name in names
+            if self._excluded(Path(directory, name).absolute())
+        }
+
+    def _clear_tree(self, path: Path) -> None:
+        """Remove a directory's contents, keeping excluded paths intact."""
+        for child in path.iterdir():
+            if self._excluded(child):
+                continue
+            if child.is_dir() and not child.is_symlink():
+                self._clear_tree(child)
+                if not any(child.iterdir()):
+                    child.rmdir()
+            else:
+                child.unlink()
+
+    def _snapshot_target(self) -> Path:
+        return self._journal_dir / str(len(self._pre_images))
+
+    def capture(self, raw_path: object, *, removing: bool = False) -> None:
+        """Record the current state of a file before it is modified."""
+        path = self._project_path(raw_path)
+        if path is None or path in self._pre_images:
+            return
+        if path.is_dir() and not path.is_symlink():
+            self.capture_tree(path)
+            return
+        if not os.path.lexists(path):
+            self._pre_images[path] = None
+            return
+        if self._excluded(path, is_dir=False):
+            return
+
+        snapshot = self._snapshot_target()
+        if removing:
+            # The inode outlives the unlink, so a hard link is a full copy.
+            try:
+                os.link(path, snapshot, follow_symlinks=False)
+            except OSError:
+                _clone_file(path, snapshot)
+        elif path.is_symlink():
+            os.symlink(os.readlink(path), snapshot)
+        else:
+            _clone_file(path, snapshot)
+        self._pre_images[path] = snapshot
+
+    def capture_tree(self, raw_path: object) -> None:
+        """Record a whole directory before it is removed or renamed."""
+        path = self._project_path(raw_path)
+        if path is None or path in self._pre_images:
+            return
+        if not path.is_dir():
+            self.capture(path)
+            return
+        if self._excluded(path, is_dir=True):
+            return
+        snapshot = self._snapshot_target()
+        shutil.copytree(
+            path,
+            snapshot,
+            symlinks=True,
+            ignore=self._ignore_excluded,
+            copy_function=_clone_file,
+        )
+        self._pre_images[path] = snapshot
+
+    def capture_subprocess_targets(self) -> None:
+        """Record the files a child process may rewrite before it starts."""
+        for name in SUBPROCESS_TARGETS:
+            self.capture(self.root / name)
+
+    def record_mkdir(self, raw_path: object) -> None:
+        path = self._project_path(raw_path)
+        if path is not None and not os.path.lexists(path):
+            self._created_dirs.append(path)
+
+    def record_rmdir(self, raw_path: object) -> None:
+        path = self._project_path(raw_path)
+        if path is not None and path.is_dir():
+            self._removed_dirs.append(path)
+
+    def rollback(self) -> None:
+        """Restore every captured pre-image and undo created paths."""
+        for path in reversed(self._removed_dirs):
+            path.mkdir(parents=True, exist_ok=True)
+        for path, snapshot in reversed(self._pre_images.items()):
+            if (
+                snapshot is not None
+                and snapshot.is_dir()
+                and not snapshot.is_symlink()
+            ):
+                if path.is_dir() and not path.is_symlink():
+                    self._clear_tree(path)
+                elif os.path.lexists(path):
+                    _remove_path(path)
+                shutil.copytree(
+                    snapshot, path, symlinks=True, dirs_exist_ok=True
+                )
+                continue
+            if os.path.lexists(path):
+                _remove_path(path)
+            if snapshot is None:
+                continue
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if snapshot.is_symlink():
+                os.symlink(os.readlink(snapshot), path)
+            else:
+                shutil.copy2(snapshot, path)
+        for path in reversed(self._created_dirs):
+            if path.is_dir():
+                shutil.rmtree(path, ignore_errors=True)
+
+
+def _journal_event(journal: _ProjectJournal, event: str, args: tuple) -> None:
+    """Capture the paths an audited file system event is about to change."""
+    if event in _SUBPROCESS_EVENTS:
+        journal.capture_subprocess_targets()
+    elif event == "open":
+        path, mode, flags = args
+        if isinstance(mode, str):
+            writing = any(char in mode for char in "wax+")
+        else:
+            writing = isinstance(flags, int) and bool(
+                flags & _WRITE_OPEN_FLAGS
+            )
+        if writing:
+            journal.capture(path)
+    elif event == "os.truncate":
+        journal.capture(args[0])
+    elif event in ("os.rename", "os.replace"):
+        if args[2] in (None, -1) and args[3] in (None, -1):
+            journal.capture(args[0])
+            journal.capture(args[1])
+    elif event in ("os.link", "os.symlink"):
+        journal.capture(args[1])
+    elif event == "shutil.rmtree":
+        # Python 3.10 audits (path,) only; later versions add dir_fd.
+        if args[1:] in ((), (None,), (-1,)):
+            journal.capture_tree(args[0])
+    elif args[-1] not in (None, -1):
+        # Paths relative to a directory descriptor (used inside
+        # shutil.rmtree) are already covered by the enclosing event;
+        # os.* events report a missing dir_fd as -1.
+        return
+    elif event == "os.remove":
+        journal.capture(args[0], removing=True)
+    elif event == "os.mkdir":
+        journal.record_mkdir(args[0])
+    elif event == "os.rmdir":
+        journal.record_rmdir(args[0])
+
+
+_JOURNAL_EVENTS = _SUBPROCESS_EVENTS | frozenset(
+    {
+        "open",
+        "os.truncate",
+        "os.rename",
+        "os.replace",
+        "os.link",
+        "os.symlink",
+        "os.remove",
+        "os.mkdir",
+        "os.rmdir",
+        "shutil.rmtree",
+    }
+)
+
+
+def _journal_audit_hook(event: str, args: tuple) -> None:
+    if not _ACTIVE_JOURNALS or getattr(_JOURNAL_STATE, "busy", False):
+        return
+    if event not in _JOURNAL_EVENTS:
+        return
+    _JOURNAL_STATE.busy = True
+    try:
+        for journal in _ACTIVE_JOURNALS:
+            _journal_event(journal, event, args)
+    finally:
+        _JOURNAL_STATE.busy = False
+
+
+def _install_journal_hook() -> None:
+    """Install the journaling audit hook once; it is inert when idle."""
+    global _JOURNAL_HOOK_INSTALLED
+    if not _JOURNAL_HOOK_INSTALLED:
+        sys.addaudithook(_journal_audit_hook)
+        _JOURNAL_HOOK_INSTALLED = True
+
+
+@contextmanager
+def project_backup(project_path: Path):
+    """Context manager for safe project mutation with automatic rollback on failure.
+
+    Instead of copying the whole project up front, file system writes made
+    inside the block are journaled (through a Python audit hook) and only
+    the touched paths are restored when the block raises. Writes made by
+    child processes are invisible to the hook, so ``SUBPROCESS_TARGETS``
+    are snapshotted whenever one is started.
+    """
+    journal_dir = Path(tempfile.mkdtemp(prefix="robyn-config-journal-"))
+    project_path = project_path.resolve()
+    journal = _ProjectJournal(
+        project_path, journal_dir, _BackupScope.for_project(project_path)
+    )
+    _install_journal_hook()
+    _ACTIVE_JOURNALS.append(journal)
+    try:
+        yield
+    except Exception:
+        _ACTIVE_JOURNALS.remove(journal)
+        journal.rollback()
+        raise
+    finally:
+        if journal in _ACTIVE_JOURNALS:
+            _ACTIVE_JOURNALS.remove(journal)
+        shutil.rmtree(journal_dir, ignore_errors=True)
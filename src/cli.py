@@ -2,19 +2,22 @@
 
 from __future__ import annotations
 
-import shutil
 import sys
-import tempfile
-from contextlib import contextmanager
 from pathlib import Path
 
 import click
 
-from add import add_business_logic, read_project_config
+from add import (
+    add_business_logic_batch,
+    load_entity_names,
+    read_project_config,
+)
 from adminpanel import add_adminpanel
+from backup import project_backup
 from create import (
     BROKER_CHOICES,
     DESIGN_CHOICES,
+    LOCK_MODE_CHOICES,
     ORM_CHOICES,
     PACKAGE_MANAGER_CHOICES,
     UID_CHOICES,
@@ -22,71 +25,23 @@ from create import (
     InteractiveCreateConfig,
     apply_package_manager,
     collect_existing_items,
+    configure_template_cache,
     copy_template,
+    create_from_manifest,
+    defer_package_manager,
     ensure_package_manager_available,
     get_generated_items,
+    load_manifest,
     prepare_destination,
     run_create_interactive,
+    run_pending_lock,
+    start_background_lock,
 )
 from create.utils._config import _normalize_nosql, _resolve_worker
+from create.utils._filesystem import _cleanup_create_failure
 from monitoring import add_monitoring
 
 
-def _remove_path(path: Path) -> None:
-    if path.is_dir():
-        shutil.rmtree(path, ignore_errors=True)
-    else:
-        path.unlink(missing_ok=True)
-
-
-def _cleanup_create_failure(
-    target_dir: Path,
-    generated_items: set[Path],
-    existing_items: set[Path],
-    created_new_dir: bool,
-) -> None:
-    """Attempt to remove files created during a failed create command."""
-    if created_new_dir and target_dir.exists():
-        shutil.rmtree(target_dir, ignore_errors=True)
-        return
-
-    for rel_path in generated_items:
-        if rel_path in existing_items:
-            continue
-        candidate = target_dir / rel_path
-        if candidate.exists():
-            _remove_path(candidate)
-
-
-def _backup_project(project_path: Path) -> tuple[Path, Path]:
-    """Create a backup of the project directory for rollback."""
-    temp_dir = Path(tempfile.mkdtemp(prefix="robyn-config-add-backup-"))
-    backup_path = temp_dir / "project"
-    shutil.copytree(project_path, backup_path, dirs_exist_ok=True)
-    return temp_dir, backup_path
-
-
-def _restore_project_backup(project_path: Path, backup_path: Path) -> None:
-    """Restore project directory from backup."""
-    if project_path.exists():
-        for child in project_path.iterdir():
-            _remove_path(child)
-    shutil.copytree(backup_path, project_path, dirs_exist_ok=True)
-
-
-@contextmanager
-def project_backup(project_path: Path):
-    """Context manager for safe project mutation with automatic rollback on failure."""
-    backup_dir, backup_path = _backup_project(project_path)
-    try:
-        yield
-    except Exception:
-        _restore_project_backup(project_path, backup_path)
-        raise
-    finally:
-        shutil.rmtree(backup_dir, ignore_errors=True)
-
-
 def _interactive_terminal_available() -> bool:
     return sys.stdin.isatty() and sys.stdout.isatty()
 
@@ -111,6 +66,57 @@ def cli() -> None:
     """Robyn configuration utilities."""
 
 
+def _create_from_manifest(
+    manifest_path: Path,
+    processes: int | None,
+    jobs: int | None,
+    template_cache: bool,
+    lock_mode: str,
+    lock_cache: bool,
+    package_cache_dir: Path | None,
+) -> None:
+    """Generate every manifest project and report per-project results."""
+    try:
+        projects = load_manifest(manifest_path)
+    except ValueError as exc:
+        raise click.ClickException(str(exc)) from exc
+
+    click.echo(f"Creating {len(projects)} Robyn projects from manifest...")
+    results = create_from_manifest(
+        projects,
+        processes,
+        jobs,
+        template_cache,
+        lock_mode=lock_mode,
+        lock_cache=lock_cache,
+        package_cache_dir=package_cache_dir,
+    )
+    for result in results:
+        if result.ok:
+            click.echo(
+                click.style(f"  ok      {result.name}", fg="green")
+                + f" -> {result.destination}"
+            )
+        else:
+            click.echo(
+                click.style(f"  failed  {result.name}", fg="red")
+                + f": {result.error}"
+            )
+
+    failed = sum(not result.ok for result in results)
+    if failed:
+        raise click.ClickException(
+            click.style(
+                f"{failed} of {len(results)} projects failed.", fg="red"
+            )
+        )
+    click.echo(
+        click.style(
+            f"Successfully created {len(results)} Robyn projects", fg="green"
+        )
+    )
+
+
 @cli.command("create")
 @click.argument("name", required=False)
 @click.option(
@@ -194,6 +200,24 @@ def cli() -> None:
     show_default=True,
     help="Enable periodic job scheduling for the selected worker.",
 )
+@click.option(
+    "--no-template-cache",
+    "no_template_cache",
+    is_flag=True,
+    default=False,
+    help="Render templates without the persistent compiled-template cache.",
+)
+@click.option(
+    "-j",
+    "--jobs",
+    "jobs",
+    type=click.IntRange(min=1),
+    default=None,
+    help=(
+        "Number of threads used to write generated files. "
+        "Defaults to a value derived from the CPU count."
+    ),
+)
 @click.option(
     "--worker-exp-mode",
     "worker_exp_mode",
@@ -202,6 +226,61 @@ def cli() -> None:
     show_default=True,
     help="Enable experimental worker mode where supported.",
 )
+@click.option(
+    "--lock",
+    "lock_mode",
+    type=click.Choice(LOCK_MODE_CHOICES, case_sensitive=False),
+    default="sync",
+    show_default=True,
+    help=(
+        "Generate the lock file now (sync), in a detached process "
+        "(background), or later with 'robyn-config lock' (defer)."
+    ),
+)
+@click.option(
+    "--no-lock-cache",
+    "no_lock_cache",
+    is_flag=True,
+    default=False,
+    help="Always resolve dependencies instead of reusing a cached lock file.",
+)
+@click.option(
+    "--package-cache-dir",
+    "package_cache_dir",
+    type=click.Path(
+        file_okay=False,
+        dir_okay=True,
+        path_type=Path,  # type: ignore[type-var]
+    ),
+    default=None,
+    help=(
+        "Share the package manager download cache in this directory "
+        "instead of a per-project cache."
+    ),
+)
+@click.option(
+    "--from-manifest",
+    "manifest_path",
+    type=click.Path(
+        exists=True,
+        file_okay=True,
+        dir_okay=False,
+        path_type=Path,  # type: ignore[type-var]
+    ),
+    default=None,
+    help="Create every project listed in a TOML manifest.",
+)
+@click.option(
+    "-P",
+    "--processes",
+    "processes",
+    type=click.IntRange(min=1),
+    default=None,
+    help=(
+        "Number of projects generated in parallel with --from-manifest. "
+        "Defaults to the CPU count."
+    ),
+)
 @click.argument(
     "destination",
     type=click.Path(
@@ -226,9 +305,34 @@ def create(
     worker: str,
     worker_exp_mode: bool,
     scheduler: bool,
+    no_template_cache: bool,
+    jobs: int | None,
+    lock_mode: str,
+    no_lock_cache: bool,
+    package_cache_dir: Path | None,
+    manifest_path: Path | None,
+    processes: int | None,
 ) -> None:
     """Copy the template into destination with specific configurations."""
     destination = destination or Path(".")
+    lock_mode = lock_mode.lower()
+    configure_template_cache(not no_template_cache)
+    if manifest_path is not None:
+        if name or interactive:
+            raise click.UsageError(
+                "--from-manifest cannot be combined with NAME or -i."
+            )
+        _create_from_manifest(
+            manifest_path,
+            processes,
+            jobs,
+            not no_template_cache,
+            lock_mode,
+            not no_lock_cache,
+            package_cache_dir,
+        )
+        return
+
     try:
         normalized_nosql = _normalize_nosql(nosql)
     except ValueError as exc:
@@ -315,7 +419,8 @@ def create(
     if uid_type == "uuidv7" and sys.version_info < (3, 13):
         raise click.ClickException("uuidv7 requires Python 3.13 or newer.")
 
-    ensure_package_manager_available(package_manager)
+    if lock_mode != "defer":
+        ensure_package_manager_available(package_manager)
 
     destination_resolved = destination.expanduser().resolve()
     destination_exists_before = destination_resolved.exists()
@@ -353,10 +458,33 @@ def create(
             worker,
             worker_exp_mode,
             scheduler,
+            jobs=jobs,
         )
 
-        click.echo("Installing dependencies...")
-        apply_package_manager(target_dir, package_manager)
+        if lock_mode == "defer":
+            defer_package_manager(target_dir)
+            click.echo(
+                "Skipped dependency locking; run 'robyn-config lock' "
+                "to generate the lock file."
+            )
+        elif lock_mode == "background":
+            status_path = start_background_lock(
+                target_dir,
+                package_manager,
+                lock_cache=not no_lock_cache,
+                package_cache_dir=package_cache_dir,
+            )
+            click.echo(
+                f"Locking dependencies in the background ({status_path})"
+            )
+        else:
+            click.echo("Installing dependencies...")
+            apply_package_manager(
+                target_dir,
+                package_manager,
+                lock_cache=not no_lock_cache,
+                package_cache_dir=package_cache_dir,
+            )
 
         click.echo(
             click.style("Successfully created Robyn template", fg="green")
@@ -369,8 +497,32 @@ def create(
         raise click.ClickException(click.style(str(e), fg="red")) from e
 
 
-@cli.command("add")
-@click.argument("name")
+@cli.command("lock")
+@click.option(
+    "--no-lock-cache",
+    "no_lock_cache",
+    is_flag=True,
+    default=False,
+    help="Always resolve dependencies instead of reusing a cached lock file.",
+)
+@click.option(
+    "--package-cache-dir",
+    "package_cache_dir",
+    type=click.Path(
+        file_okay=False,
+        dir_okay=True,
+        path_type=Path,  # type: ignore[type-var]
+    ),
+    default=None,
+    help="Share the package manager download cache in this directory.",
+)
+@click.option(
+    "--status-file",
+    "status_path",
+    type=click.Path(dir_okay=False, path_type=Path),  # type: ignore[type-var]
+    default=None,
+    hidden=True,
+)
 @click.argument(
     "project_path",
     type=click.Path(
@@ -381,15 +533,141 @@ def create(
     ),
     default=".",
 )
-def add(name: str, project_path: Path) -> None:
-    """Add new business logic to an existing robyn-config project."""
+def lock(
+    project_path: Path,
+    no_lock_cache: bool,
+    package_cache_dir: Path | None,
+    status_path: Path | None,
+) -> None:
+    """Generate the lock file for a project created with --lock=defer."""
     project_path = project_path.resolve()
+    try:
+        package_manager = read_project_config(project_path).get(
+            "package_manager", "uv"
+        )
+        run_pending_lock(
+            project_path,
+            package_manager,
+            lock_cache=not no_lock_cache,
+            package_cache_dir=package_cache_dir,
+            status_path=status_path,
+        )
+        click.echo(
+            click.style(
+                f"Successfully generated lock file with {package_manager}",
+                fg="green",
+            )
+        )
+    except Exception as e:
+        raise click.ClickException(click.style(str(e), fg="red")) from e
+
+
+def _is_robyn_config_project(path: Path) -> bool:
+    try:
+        read_project_config(path)
+    except (OSError, ValueError):
+        return False
+    return True
+
+
+def _split_add_arguments(
+    arguments: tuple[str, ...],
+    *,
+    names_from_file: bool = False,
+    project_path: Path | None = None,
+) -> tuple[list[str], Path]:
+    """Split `add` positionals into entity names and the project path.
+
+    With an explicit ``--project`` every positional is a name. Otherwise
+    the last positional is the project path when at least one name remains
+    (or names come from a file) and it is an existing directory that is a
+    robyn-config project, or the current directory is not one. Run inside
+    a project, an entity named like one of its folders (``tags/``) is
+    therefore never mistaken for the project.
+    """
+    names = list(arguments)
+    if project_path is not None:
+        return names, project_path
+    min_positionals = 1 if names_from_file else 2
+    if len(names) >= min_positionals:
+        candidate = Path(names[-1])
+        if candidate.is_dir() and (
+            _is_robyn_config_project(candidate)
+            or not _is_robyn_config_project(Path("."))
+        ):
+            return names[:-1], candidate
+    return names, Path(".")
+
+
+@cli.command("add")
+@click.argument("arguments", metavar="NAME... [PROJECT_PATH]", nargs=-1)
+@click.option(
+    "--from-file",
+    "names_file",
+    type=click.Path(
+        exists=True,
+        file_okay=True,
+        dir_okay=False,
+        path_type=Path,  # type: ignore[type-var]
+    ),
+    default=None,
+    help="Read additional entity names from a file, one per line.",
+)
+@click.option(
+    "-p",
+    "--project",
+    "project_option",
+    type=click.Path(
+        exists=True,
+        file_okay=False,
+        dir_okay=True,
+        path_type=Path,  # type: ignore[type-var]
+    ),
+    default=None,
+    help="Project directory; every positional is then an entity name.",
+)
+@click.option(
+    "--no-template-cache",
+    "no_template_cache",
+    is_flag=True,
+    default=False,
+    help="Render templates without the persistent compiled-template cache.",
+)
+def add(
+    arguments: tuple[str, ...],
+    names_file: Path | None,
+    project_option: Path | None,
+    no_template_cache: bool,
+) -> None:
+    """Add new business logic to an existing robyn-config project.
+
+    Several entities can be added at once; they share one backup and every
+    shared file is rewritten once.
+    """
+    names, project_path = _split_add_arguments(
+        arguments,
+        names_from_file=names_file is not None,
+        project_path=project_option,
+    )
+    if names_file is not None:
+        names.extend(load_entity_names(names_file))
+    if not names:
+        raise click.UsageError("Provide at least one NAME or --from-file.")
+    if not project_path.is_dir():
+        raise click.BadParameter(
+            f"Directory '{project_path}' does not exist.",
+            param_hint="PROJECT_PATH",
+        )
+
+    project_path = project_path.resolve()
+    configure_template_cache(not no_template_cache)
     try:
         with project_backup(project_path):
-            add_business_logic(project_path, name)
+            add_business_logic_batch(project_path, names)
+        label = ", ".join(f"'{name}'" for name in names)
         click.echo(
             click.style(
-                f"Successfully added '{name}' business logic!", fg="green"
+                f"Successfully added {label} business logic!", fg="green"
             )
         )
     except Exception as e:
@@ -413,6 +691,13 @@ def add(name: str, project_path: Path) -> None:
     show_default=True,
     help="Default superadmin password for generated admin panel.",
 )
+@click.option(
+    "--no-template-cache",
+    "no_template_cache",
+    is_flag=True,
+    default=False,
+    help="Render templates without the persistent compiled-template cache.",
+)
 @click.argument(
     "project_path",
     type=click.Path(
@@ -424,10 +709,14 @@ def add(name: str, project_path: Path) -> None:
     default=".",
 )
 def adminpanel(
-    admin_username: str, admin_password: str, project_path: Path
+    admin_username: str,
+    admin_password: str,
+    project_path: Path,
+    no_template_cache: bool,
 ) -> None:
     """Add admin panel scaffolding to an existing robyn-config project."""
     project_path = project_path.resolve()
+    configure_template_cache(not no_template_cache)
 
     try:
         if not admin_username.strip():
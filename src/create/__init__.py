@@ -6,7 +6,10 @@ from .utils import (
     INTERACTIVE_BROKER_CHOICES,
     INTERACTIVE_NOSQL_CHOICES,
     INTERACTIVE_WORKER_CHOICES,
+    LOCK_MODE_CHOICES,
     InteractiveCreateConfig,
+    ManifestProject,
+    ManifestResult,
     NOSQL_CHOICES,
     ORM_CHOICES,
     PACKAGE_MANAGER_CHOICES,
@@ -14,11 +17,18 @@ from .utils import (
     WORKER_CHOICES,
     apply_package_manager,
     collect_existing_items,
+    configure_template_cache,
     copy_template,
+    create_from_manifest,
+    defer_package_manager,
     ensure_package_manager_available,
     get_generated_items,
+    is_lock_pending,
+    load_manifest,
     prepare_destination,
     run_create_interactive,
+    run_pending_lock,
+    start_background_lock,
 )
 
 __all__ = [
@@ -30,6 +40,7 @@ __all__ = [
     "INTERACTIVE_WORKER_CHOICES",
     "NOSQL_CHOICES",
     "PACKAGE_MANAGER_CHOICES",
+    "LOCK_MODE_CHOICES",
     "UID_CHOICES",
     "WORKER_CHOICES",
     "ensure_package_manager_available",
@@ -37,7 +48,16 @@ __all__ = [
     "get_generated_items",
     "prepare_destination",
     "copy_template",
+    "create_from_manifest",
+    "load_manifest",
     "apply_package_manager",
+    "defer_package_manager",
+    "is_lock_pending",
+    "run_pending_lock",
+    "start_background_lock",
+    "configure_template_cache",
     "InteractiveCreateConfig",
+    "ManifestProject",
+    "ManifestResult",
     "run_create_interactive",
 ]
@@ -10,14 +10,45 @@ import shlex
 import subprocess
 import sys
 
+PROCESSES = int(os.environ.get("APP_PROCESSES", "4"))
+WORKERS = int(os.environ.get("APP_WORKERS", "3"))
+# Server-side connection limit shared by all processes (Postgres default),
+# minus headroom for migrations, workers and admin sessions.
+DATABASE_MAX_CONNECTIONS = int(
+    os.environ.get("DATABASE_MAX_CONNECTIONS", "100")
+)
+RESERVED_CONNECTIONS = int(
+    os.environ.get("DATABASE_RESERVED_CONNECTIONS", "10")
+)
+
 
 def _run(cmd: list[str]) -> None:
     subprocess.run(cmd, check=True)
 
 
+def _pool_defaults(processes: int, workers: int) -> dict[str, str]:
+    """Per-process pool sizes that keep every process under the DB limit.
+
+    Each server process holds its own pool, so the connection budget left
+    after ``RESERVED_CONNECTIONS`` is split evenly between processes: the
+    steady pool covers the worker threads and the overflow takes the rest.
+    """
+    budget = (DATABASE_MAX_CONNECTIONS - RESERVED_CONNECTIONS) // processes
+    budget = max(budget, 1)
+    size = min(max(workers * 2, 1), budget)
+    return {
+        "SETTINGS__DATABASE__POOL__SIZE": str(size),
+        "SETTINGS__DATABASE__POOL__MAX_OVERFLOW": str(budget - size),
+    }
+
+
 def main() -> None:
     _run(["alembic", "upgrade", "head"])
 
+    # Pool settings already present in the environment always win.
+    for key, value in _pool_defaults(PROCESSES, WORKERS).items():
+        os.environ.setdefault(key, value)
+
     raw_cmd = os.environ.get("APP_CMD")
     if raw_cmd:
         _run(shlex.split(raw_cmd))
@@ -30,9 +61,9 @@ def main() -> None:
             "app.server",
             "--fast",
             "--processes",
-            "4",
+            str(PROCESSES),
             "--workers",
-            "3",
+            str(WORKERS),
             "--log-level",
             "WARNING",
         ]
@@ -12,6 +12,16 @@ import sys
 
 IGNORABLE_WARNINGS = ("App 'models' is already initialized.",)
 APP_MODULE = os.environ.get("ROBYN_APP_MODULE", "app.server")
+PROCESSES = int(os.environ.get("APP_PROCESSES", "4"))
+WORKERS = int(os.environ.get("APP_WORKERS", "3"))
+# Server-side connection limit shared by all processes (Postgres default),
+# minus headroom for migrations, workers and admin sessions.
+DATABASE_MAX_CONNECTIONS = int(
+    os.environ.get("DATABASE_MAX_CONNECTIONS", "100")
+)
+RESERVED_CONNECTIONS = int(
+    os.environ.get("DATABASE_RESERVED_CONNECTIONS", "10")
+)
 
 
 def _run(cmd: list[str], *, ignore_existing: bool = False) -> None:
@@ -36,10 +46,29 @@ def _run(cmd: list[str], *, ignore_existing: bool = False) -> None:
     )
 
 
+def _pool_defaults(processes: int, workers: int) -> dict[str, str]:
+    """Per-process pool sizes that keep every process under the DB limit.
+
+    Each server process holds its own pool, so the connection budget left
+    after ``RESERVED_CONNECTIONS`` is split evenly between processes; the
+    worker threads of a process keep that many connections warm.
+    """
+    budget = (DATABASE_MAX_CONNECTIONS - RESERVED_CONNECTIONS) // processes
+    budget = max(budget, 1)
+    return {
+        "SETTINGS__DATABASE__POOL__MIN_SIZE": str(min(workers, budget)),
+        "SETTINGS__DATABASE__POOL__MAX_SIZE": str(budget),
+    }
+
+
 def main() -> None:
     _run(["aerich", "init-db"], ignore_existing=True)
     _run(["aerich", "upgrade"])
 
+    # Pool settings already present in the environment always win.
+    for key, value in _pool_defaults(PROCESSES, WORKERS).items():
+        os.environ.setdefault(key, value)
+
     raw_cmd = os.environ.get("APP_CMD")
     if raw_cmd:
         _run(shlex.split(raw_cmd))
@@ -52,9 +81,9 @@ def main() -> None:
             APP_MODULE,
             "--fast",
             "--processes",
-            "4",
+            str(PROCESSES),
             "--workers",
-            "3",
+            str(WORKERS),
             "--log-level",
             "WARNING",
         ]
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import BaseModel
 
 
@@ -14,3 +16,10 @@ class Settings(BaseModel):
     user_activation_ttl: int = 0
     password_reset_token_ttl: int = 0
     session_secret_key: str = "change-me"
+    # Where sessions live: "cookie" (signed, in the cookie itself), "redis"
+    # (cache Redis, opaque id cookie) or "memory" (this process, tests).
+    # Server-side sessions expire session_max_age seconds after the last
+    # request; the cookie is renewed whenever the session changes.
+    session_backend: Literal["cookie", "redis", "memory"] = "cookie"
+    session_max_age: int = 60 * 60 * 24 * 14
+    session_redis_prefix: str = "session"
@@ -1,10 +1,49 @@
+from typing import Literal
+
 from pydantic import BaseModel
 
 
+class PoolSettings(BaseModel):
+    """Redis connection pool of one event loop.
+
+    Each server process (and each event loop in it) owns a pool, so Redis
+    sees up to ``processes * max_connections`` clients.
+    """
+
+    max_connections: int = 20
+    # Seconds to wait for a free connection before raising.
+    timeout: float = 5.0
+    # PING connections idle for this many seconds before reusing them.
+    health_check_interval: int = 30
+    socket_keepalive: bool = True
+
+
 class Settings(BaseModel):
     host: str = "cache"
     port: int = 6379
     db: int = 0
     use_fake: bool = True
+    pool: PoolSettings = PoolSettings()
     ttl_activation_seconds: int = 3600
     ttl_password_reset_seconds: int = 3600
+    # Read-through entity cache (users by id and login). Redis keeps
+    # entries for ttl_entity_seconds (0 disables the cache); each process
+    # also keeps up to local_max_entries for at most local_ttl_seconds,
+    # which bounds how long it can miss a write made by another process.
+    ttl_entity_seconds: int = 60
+    local_max_entries: int = 10_000
+    local_ttl_seconds: int = 5
+    # Deletes are published on invalidation_channel, which every process
+    # subscribes to with one connection to drop its local copies ("" turns
+    # this off). Entries are reloaded at random shortly before they
+    # expire, earlier as early_expiration_beta grows (0 turns this off).
+    invalidation_channel: str = "cache:invalidate"
+    early_expiration_beta: float = 1.0
+    # Encoding of cache entries: "json" needs nothing extra, "orjson" and
+    # "msgpack" need their packages. Entries of at least
+    # compress_min_bytes are zstd-compressed (0 never compresses; needs
+    # zstandard). trusted_entries rebuilds cached entities without
+    # validating them again, as the application wrote them itself.
+    codec: Literal["json", "orjson", "msgpack"] = "json"
+    compress_min_bytes: int = 0
+    trusted_entries: bool = False
@@ -2,6 +2,7 @@ from . import services  # noqa: F401
 from .entities import (  # noqa: F401
     EmailChange,
     PasswordForgot,
+    UserCredentials,
     UserFlat,
     UserUncommitted,
 )
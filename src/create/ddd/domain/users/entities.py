@@ -29,6 +29,16 @@ class UserFlat(UserUncommitted, TimeStampMixin):
     id: PrimaryKey
 
 
+class UserCredentials(InternalEntity):
+    """The columns the login flow reads, without profile or timestamps."""
+
+    id: PrimaryKey
+    username: str
+    email: EmailStr
+    password: str
+    is_active: bool
+
+
 class PasswordForgot(InternalEntity):
     email: EmailStr
 
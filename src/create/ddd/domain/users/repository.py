@@ -4,7 +4,7 @@ from abc import ABC, abstractmethod
 from typing import Any, AsyncGenerator
 
 from ...infrastructure.application import PrimaryKey
-from .entities import UserFlat, UserUncommitted
+from .entities import UserCredentials, UserFlat, UserUncommitted
 
 
 class UsersRepository(ABC):
@@ -22,6 +22,10 @@ class UsersRepository(ABC):
     async def get_by_login(self, login: str) -> UserFlat:
         """Return a user matching a login credential."""
 
+    @abstractmethod
+    async def get_credentials(self, login: str) -> UserCredentials:
+        """Return only the fields needed to verify a login."""
+
     @abstractmethod
     async def create(self, schema: UserUncommitted) -> UserFlat:
         """Persist a new user from the provided schema."""
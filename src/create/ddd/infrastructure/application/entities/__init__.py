@@ -1,3 +1,4 @@
 from .base import *  # noqa: F401, F403
 from .mixins import *  # noqa: F401, F403
+from .pagination import *  # noqa: F401, F403
 from .response import *  # noqa: F401, F403
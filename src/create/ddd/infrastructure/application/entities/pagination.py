@@ -0,0 +1,36 @@
+"""Opaque cursors for keyset-paginated list endpoints."""
+
+import base64
+
+from .base import PrimaryKey, parse_primary_key
+
+__all__ = (
+    "PAGE_SIZE",
+    "MAX_PAGE_SIZE",
+    "encode_cursor",
+    "decode_cursor",
+    "parse_page_size",
+)
+
+PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def encode_cursor(id_: PrimaryKey) -> str:
+    """Token pointing just after the row with ``id_``."""
+    return base64.urlsafe_b64encode(str(id_).encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> PrimaryKey:
+    """Inverse of ``encode_cursor``; raises ``ValueError`` on bad tokens."""
+    padded = token + "=" * (-len(token) % 4)
+    return parse_primary_key(base64.urlsafe_b64decode(padded).decode())
+
+
+def parse_page_size(raw_value: str | None) -> int:
+    if raw_value is None:
+        return PAGE_SIZE
+    size = int(raw_value)
+    if not 1 <= size <= MAX_PAGE_SIZE:
+        raise ValueError(f"Page size must be between 1 and {MAX_PAGE_SIZE}")
+    return size
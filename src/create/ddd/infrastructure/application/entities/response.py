@@ -9,6 +9,7 @@ from .base import PublicEntity, _PublicEntity
 __all__ = (
     "JSON_HEADERS",
     "ResponseMulti",
+    "ResponsePage",
     "Response",
     "_Response",
     "ErrorType",
@@ -26,6 +27,13 @@ class ResponseMulti(PublicEntity, Generic[_PublicEntity]):
     result: list[_PublicEntity]
 
 
+class ResponsePage(PublicEntity, Generic[_PublicEntity]):
+    """One page of results plus the cursor of the next page, if any."""
+
+    result: list[_PublicEntity]
+    next: str | None = None
+
+
 class Response(PublicEntity, Generic[_PublicEntity]):
     """Generic response model that consist only one result."""
 
@@ -1,5 +1,5 @@
 """Robyn middleware helpers (CORS, sessions, etc.)."""
 
-from . import cors, sessions
+from . import cors, database, sessions
 
-__all__ = ("cors", "sessions")
+__all__ = ("cors", "database", "sessions")
@@ -0,0 +1,27 @@
+"""Request-scoped database unit of work for Robyn."""
+
+from __future__ import annotations
+
+from loguru import logger
+from robyn import Request, Response, Robyn
+
+from ..errors import DatabaseError, error_response
+
+
+def register(app: Robyn) -> None:
+    # Imported here: the database package itself depends on `application`.
+    from ...database import begin_unit_of_work, end_unit_of_work
+
+    @app.before_request()
+    def open_unit_of_work(request: Request):
+        begin_unit_of_work()
+        return request
+
+    @app.after_request()
+    async def close_unit_of_work(response: Response):
+        try:
+            await end_unit_of_work(commit=response.status_code < 400)
+        except Exception as exc:
+            logger.error(f"Request unit of work failed: {exc}")
+            return error_response(DatabaseError(message=str(exc)))
+        return response
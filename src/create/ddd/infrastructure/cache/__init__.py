@@ -1,2 +1,12 @@
+from .codecs import Codec, get_codec  # noqa: F401
+from .decorators import (  # noqa: F401
+    EntityCache,
+    cached,
+    read_through,
+    write_invalidate,
+)
 from .entities import *  # noqa: F401, F403
+from .invalidation import publish, stop_listener  # noqa: F401
+from .local import LocalCache  # noqa: F401
+from .pool import close_client, get_client, pool_metrics  # noqa: F401
 from .services import CacheRepository  # noqa: F401
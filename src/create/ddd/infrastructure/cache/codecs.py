@@ -0,0 +1,204 @@
+"""Byte encodings of cache entries, selected by ``settings.cache.codec``."""
+
+from __future__ import annotations
+
+import functools
+import json
+import types
+import uuid
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Callable, ClassVar, Union, get_args, get_origin
+
+from pydantic import BaseModel, EmailStr
+
+from ...config import settings
+
+# Every zstd frame starts with these bytes, and neither a JSON object nor
+# a msgpack map does, so compressed entries need no extra header.
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# Field types ``model_construct`` can rebuild from their JSON form.
+_NATIVE = (str, int, float, bool, EmailStr)
+_REVIVERS: dict[Any, Callable[[Any], Any]] = {
+    datetime: datetime.fromisoformat,
+    date: date.fromisoformat,
+    uuid.UUID: uuid.UUID,
+}
+
+
+class Codec(ABC):
+    """Turns a cache entry into bytes and back into a plain payload."""
+
+    name: ClassVar[str]
+
+    def dumps(self, entry: BaseModel) -> bytes:
+        return self.pack(entry.model_dump(mode="json"))
+
+    def loads(self, raw: bytes, model: type[BaseModel]) -> BaseModel:
+        """Decode and validate ``raw`` as ``model``."""
+        return model.model_validate(self.unpack(raw))
+
+    @abstractmethod
+    def pack(self, payload: dict[str, Any]) -> bytes: ...
+
+    @abstractmethod
+    def unpack(self, raw: bytes) -> dict[str, Any]: ...
+
+
+class JsonCodec(Codec):
+    """JSON through pydantic's own serializer and parser."""
+
+    name = "json"
+
+    def dumps(self, entry: BaseModel) -> bytes:
+        return entry.model_dump_json().encode()
+
+    def loads(self, raw: bytes, model: type[BaseModel]) -> BaseModel:
+        return model.model_validate_json(raw)
+
+    def pack(self, payload: dict[str, Any]) -> bytes:
+        return json.dumps(payload, separators=(",", ":")).encode()
+
+    def unpack(self, raw: bytes) -> dict[str, Any]:
+        return json.loads(raw)
+
+
+class OrjsonCodec(JsonCodec):
+    """The same JSON, parsed by orjson when entries are not validated."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+
+    def pack(self, payload: dict[str, Any]) -> bytes:
+        return self._orjson.dumps(payload)
+
+    def unpack(self, raw: bytes) -> dict[str, Any]:
+        return self._orjson.loads(raw)
+
+
+class MsgpackCodec(Codec):
+    """MessagePack: smaller than JSON for numbers and short strings."""
+
+    name = "msgpack"
+
+    def __init__(self) -> None:
+        import msgpack
+
+        self._msgpack = msgpack
+
+    def pack(self, payload: dict[str, Any]) -> bytes:
+        return self._msgpack.packb(payload)
+
+    def unpack(self, raw: bytes) -> dict[str, Any]:
+        return self._msgpack.unpackb(raw)
+
+
+_CODECS: dict[str, type[Codec]] = {
+    codec.name: codec for codec in (JsonCodec, OrjsonCodec, MsgpackCodec)
+}
+
+
+@functools.cache
+def _codec(name: str) -> Codec:
+    try:
+        return _CODECS[name]()
+    except ImportError as exc:
+        raise RuntimeError(
+            f"The {name!r} cache codec needs the `{name}` package;"
+            " install it or change SETTINGS__CACHE__CODEC."
+        ) from exc
+
+
+def get_codec() -> Codec:
+    """Codec named by ``settings.cache.codec``."""
+    return _codec(settings.cache.codec)
+
+
+def codec_for(raw: bytes) -> Codec:
+    """Codec able to read ``raw``, the configured one if it can.
+
+    A JSON entry is an object and a msgpack one a map, which never starts
+    with ``{``, so entries written before a codec change stay readable.
+    """
+    codec = get_codec()
+    is_json = raw.startswith(b"{")
+    if is_json == isinstance(codec, JsonCodec):
+        return codec
+    return _codec("json" if is_json else "msgpack")
+
+
+@functools.cache
+def _zstd() -> tuple[Any, Any]:
+    try:
+        import zstandard
+    except ImportError as exc:
+        raise RuntimeError(
+            "zstandard must be installed to compress cache entries"
+            " (SETTINGS__CACHE__COMPRESS_MIN_BYTES > 0)."
+        ) from exc
+    return zstandard.ZstdCompressor(), zstandard.ZstdDecompressor()
+
+
+def compress(data: bytes) -> bytes:
+    """zstd-compress ``data`` when it exceeds the configured threshold."""
+    threshold = settings.cache.compress_min_bytes
+    if threshold <= 0 or len(data) < threshold:
+        return data
+    compressor, _ = _zstd()
+    return compressor.compress(data)
+
+
+def decompress(raw: bytes) -> bytes:
+    if not raw.startswith(_ZSTD_MAGIC):
+        return raw
+    _, decompressor = _zstd()
+    try:
+        return decompressor.decompress(raw)
+    except Exception as exc:  # zstandard.ZstdError
+        raise ValueError(f"Corrupt compressed cache entry: {exc}") from exc
+
+
+@functools.cache
+def revivers(model: type[BaseModel]) -> dict[str, Callable] | None:
+    """Converters rebuilding ``model`` fields from their JSON values.
+
+    ``None`` means a field has a type ``model_construct`` cannot be fed
+    from JSON (a nested model, a container, ...), so the entry has to
+    be validated instead.
+    """
+    enum_values = model.model_config.get("use_enum_values", False)
+    converters = {}
+    for name, field in model.model_fields.items():
+        annotation = field.annotation
+        if get_origin(annotation) in (Union, types.UnionType):
+            options = [
+                arg for arg in get_args(annotation) if arg is not type(None)
+            ]
+            if len(options) != 1:
+                return None
+            annotation = options[0]
+        if annotation in _REVIVERS:
+            converters[name] = _REVIVERS[annotation]
+        elif not isinstance(annotation, type):
+            return None
+        elif issubclass(annotation, Enum):
+            if not enum_values:
+                converters[name] = annotation
+        elif not issubclass(annotation, _NATIVE):
+            return None
+    return converters
+
+
+def construct(model: type[BaseModel], payload: dict[str, Any]) -> BaseModel:
+    """Build ``model`` from trusted ``payload`` without validating it."""
+    for name, revive in revivers(model).items():  # type: ignore[union-attr]
+        value = payload.get(name)
+        if value is not None:
+            payload[name] = revive(value)
+    return model.model_construct(**payload)
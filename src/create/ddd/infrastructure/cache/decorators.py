@@ -0,0 +1,341 @@
+"""Two-tier entity caching for repository methods and operations."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import math
+import random
+import time
+from contextvars import ContextVar
+from datetime import datetime
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    ClassVar,
+    Generic,
+    Iterable,
+    TypeVar,
+    get_type_hints,
+)
+
+from loguru import logger
+from redis.exceptions import RedisError
+
+from ...config import settings
+from ..application import InternalEntity, NotFoundError
+from . import invalidation
+from .entities import CacheEntry
+from .local import LocalCache
+from .services import CacheRepository
+
+_Entity = TypeVar("_Entity", bound=InternalEntity)
+_Method = TypeVar("_Method", bound=Callable[..., Awaitable[Any]])
+
+# (namespace, key) pairs whose load runs in the current context, so a
+# cached operation reading through a cached repository does not wait on
+# its own load.
+_LOADING: ContextVar[frozenset[tuple[str, str]]] = ContextVar(
+    "cache_loading", default=frozenset()
+)
+
+
+class EntityCache(Generic[_Entity]):
+    """Entities of one type cached by key, in-process first, then Redis.
+
+    Redis keeps an entry for ``ttl`` seconds, the process-local LRU for at
+    most ``settings.cache.local_ttl_seconds``; deletes reach the local
+    tier of every process over pub/sub. Redis failures count as misses,
+    so the database stays the source of truth. A ``ttl`` of 0 disables
+    the cache. There is one cache per namespace, see ``named``.
+    """
+
+    _registry: ClassVar[dict[str, EntityCache[Any]]] = {}
+
+    def __init__(
+        self, namespace: str, entity: type[_Entity], *, ttl: int
+    ) -> None:
+        if namespace in self._registry:
+            raise ValueError(f"Cache namespace {namespace!r} already exists")
+        self.namespace = namespace
+        self.entity = entity
+        self.ttl = ttl
+        self.local = LocalCache[_Entity](
+            maxsize=settings.cache.local_max_entries,
+            ttl=min(ttl, settings.cache.local_ttl_seconds),
+        )
+        self._flights: dict[
+            tuple[asyncio.AbstractEventLoop, str], asyncio.Task[_Entity]
+        ] = {}
+        self._registry[namespace] = self
+        invalidation.register(namespace, self.local)
+
+    @classmethod
+    def named(
+        cls, namespace: str, entity: type[_Entity], *, ttl: int | None = None
+    ) -> EntityCache[_Entity]:
+        """The cache of ``namespace``, created on first use."""
+        cache = cls._registry.get(namespace)
+        if cache is None:
+            if ttl is None:
+                ttl = settings.cache.ttl_entity_seconds
+            return cls(namespace, entity, ttl=ttl)
+        if cache.entity is not entity or ttl not in (None, cache.ttl):
+            raise ValueError(
+                f"Cache namespace {namespace!r} holds {cache.entity.__name__}"
+                f" for {cache.ttl}s"
+            )
+        return cache
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def _expires_early(self, entry: CacheEntry[_Entity]) -> bool:
+        # XFetch: a reader reloads before expiry with a probability that
+        # grows as expiry nears and with how long the entry took to load,
+        # so processes do not all miss at the same moment.
+        beta = settings.cache.early_expiration_beta
+        if beta <= 0 or entry.delta <= 0:
+            return False
+        age = (datetime.utcnow() - entry.created_at).total_seconds()
+        jitter = -entry.delta * beta * math.log(1.0 - random.random())
+        return age + jitter >= self.ttl
+
+    async def get(self, key: Any) -> _Entity | None:
+        if self.local.ttl > 0:
+            invalidation.ensure_listener()
+        instance = self.local.get(str(key))
+        if instance is None:
+            try:
+                async with CacheRepository[self.entity]() as cache:
+                    entry = await cache.get(self.namespace, key)
+            except NotFoundError:
+                return None
+            except RedisError as exc:
+                logger.warning(f"Cache read failed ({self.namespace}): {exc}")
+                return None
+            if self._expires_early(entry):
+                return None
+            instance = entry.instance
+            self.local.set(str(key), instance)
+        # Callers may mutate what they get; the cached copy must not change.
+        return instance.model_copy()
+
+    async def set(
+        self, key: Any, instance: _Entity, *, delta: float = 0.0
+    ) -> None:
+        self.local.set(str(key), instance.model_copy())
+        try:
+            async with CacheRepository[self.entity]() as cache:
+                await cache.set(
+                    namespace=self.namespace,
+                    key=key,
+                    instance=instance,
+                    ttl=self.ttl,
+                    delta=delta,
+                )
+        except RedisError as exc:
+            logger.warning(f"Cache write failed ({self.namespace}): {exc}")
+
+    async def delete(self, *keys: Any) -> None:
+        for key in keys:
+            self.local.delete(str(key))
+        try:
+            async with CacheRepository[self.entity]() as cache:
+                await cache.delete_many(self.namespace, keys)
+            await invalidation.publish(self.namespace, keys)
+        except RedisError as exc:
+            logger.warning(f"Cache delete failed ({self.namespace}): {exc}")
+
+    async def invalidate(self, *keys: Any) -> None:
+        """Drop ``keys`` once the running request commits.
+
+        Until then the request reads them from the database, so no reader
+        caches rows it may still roll back. Outside a request the write
+        has already committed and the keys are dropped at once.
+        """
+        unit_of_work = _unit_of_work()
+        if unit_of_work is None:
+            await self.delete(*keys)
+            return
+        unit_of_work.written.update((self.namespace, str(key)) for key in keys)
+        unit_of_work.after_commit(functools.partial(self.delete, *keys))
+
+    async def fetch(
+        self,
+        key: Any,
+        load: Callable[[], Awaitable[_Entity]],
+        *,
+        check: Callable[[_Entity], Awaitable[_Entity | None]] | None = None,
+    ) -> _Entity:
+        """The cached entity of ``key``, else what ``load()`` returns.
+
+        ``check`` may turn a hit into the entity to return, or reject it
+        with ``None``. Concurrent misses of one key in a process share a
+        single ``load``.
+        """
+        if not self.enabled:
+            return await load()
+        token = (self.namespace, str(key))
+        if token in _LOADING.get() or _written(token):
+            return await load()
+        instance = await self.get(key)
+        if instance is not None and check is not None:
+            instance = await check(instance)
+        if instance is not None:
+            return instance
+
+        loop = asyncio.get_running_loop()
+        flight = self._flights.get((loop, token[1]))
+        if flight is None:
+            flight = loop.create_task(self._load(key, load))
+            self._flights[loop, token[1]] = flight
+            flight.add_done_callback(
+                lambda task: self._land(loop, token[1], task)
+            )
+        # Shielded: a cancelled caller must not cancel the others' load.
+        return (await asyncio.shield(flight)).model_copy()
+
+    async def _load(
+        self, key: Any, load: Callable[[], Awaitable[_Entity]]
+    ) -> _Entity:
+        _LOADING.set(_LOADING.get() | {(self.namespace, str(key))})
+        started = time.monotonic()
+        instance = await load()
+        await self.set(key, instance, delta=time.monotonic() - started)
+        return instance
+
+    def _land(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        key: str,
+        task: asyncio.Task[_Entity],
+    ) -> None:
+        self._flights.pop((loop, key), None)
+        if not task.cancelled():
+            # Mark the error as seen when every caller went away.
+            task.exception()
+
+
+def _unit_of_work() -> Any:
+    # Imported here: the database package itself depends on the cache.
+    from ..database import current_unit_of_work
+
+    return current_unit_of_work()
+
+
+def _written(token: tuple[str, str]) -> bool:
+    unit_of_work = _unit_of_work()
+    return unit_of_work is not None and token in unit_of_work.written
+
+
+def _key_of(function: Callable[..., Any]) -> Callable[..., Any]:
+    """Reads the first argument after ``self``/``cls`` of ``function``."""
+    parameters = list(inspect.signature(function).parameters)
+    index = 1 if parameters[0] in ("self", "cls") else 0
+    name = parameters[index]
+
+    def key(*args: Any, **kwargs: Any) -> Any:
+        return kwargs[name] if name in kwargs else args[index]
+
+    return key
+
+
+def cached(
+    namespace: str,
+    *,
+    ttl: int | None = None,
+    key: Callable[..., Any] | None = None,
+) -> Callable[[_Method], _Method]:
+    """Cache what an async function returns, keyed by its first argument.
+
+    The entity type is the function's return annotation. Functions that
+    name the namespace of a repository's ``EntityCache`` share its
+    entries and its invalidation; ``ttl`` defaults to
+    ``settings.cache.ttl_entity_seconds``. ``key`` builds the cache key
+    from the call's arguments instead.
+    """
+
+    def decorator(function: _Method) -> _Method:
+        cache = EntityCache.named(
+            namespace, get_type_hints(function)["return"], ttl=ttl
+        )
+        key_of = key or _key_of(function)
+
+        @functools.wraps(function)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return await cache.fetch(
+                key_of(*args, **kwargs), lambda: function(*args, **kwargs)
+            )
+
+        wrapper.cache = cache  # type: ignore[attr-defined]
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def read_through(
+    cache: EntityCache[_Entity],
+    *,
+    resolve: (
+        Callable[[Any, Any, _Entity], Awaitable[_Entity | None]] | None
+    ) = None,
+) -> Callable[[_Method], _Method]:
+    """Serve ``method(self, key)`` from ``cache`` and cache what it loads.
+
+    ``resolve(repository, key, hit)`` may turn a hit into the entity to
+    return, or reject it with ``None``; an alias entry uses it to check
+    that its target still matches. Keys written in the running request
+    (see ``write_invalidate``) skip the cache until it commits, and so
+    does a repository that has written outside a request, so uncommitted
+    rows are never cached.
+    """
+
+    def decorator(method: _Method) -> _Method:
+        key_of = _key_of(method)
+
+        @functools.wraps(method)
+        async def wrapper(self: Any, *args: Any, **kwargs: Any) -> _Entity:
+            key = key_of(self, *args, **kwargs)
+            if getattr(self, "_cache_bypass", False):
+                return await method(self, key)
+            check = None
+            if resolve is not None:
+
+                async def check(hit: _Entity) -> _Entity | None:
+                    return await resolve(self, key, hit)
+
+            return await cache.fetch(
+                key, lambda: method(self, key), check=check
+            )
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def write_invalidate(
+    cache: EntityCache[Any], *, keys: Callable[..., Iterable[Any]]
+) -> Callable[[_Method], _Method]:
+    """Drop the entries a write makes stale, in every process.
+
+    ``keys`` gets the method's result followed by its arguments and
+    returns the cache keys to delete. Inside a request they are dropped
+    after its unit of work commits, and not at all when it rolls back.
+    """
+
+    def decorator(method: _Method) -> _Method:
+        @functools.wraps(method)
+        async def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            self._cache_bypass = True
+            result = await method(self, *args, **kwargs)
+            if cache.enabled:
+                await cache.invalidate(*keys(result, *args, **kwargs))
+            return result
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
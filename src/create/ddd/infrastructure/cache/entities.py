@@ -11,3 +11,5 @@ _CacheEntryInstance = TypeVar("_CacheEntryInstance", bound=InternalEntity)
 class CacheEntry(InternalEntity, Generic[_CacheEntryInstance]):
     instance: _CacheEntryInstance
     created_at: Annotated[datetime, Field(default_factory=datetime.utcnow)]
+    # Seconds it took to load ``instance``, for early expiration.
+    delta: float = 0.0
@@ -0,0 +1,81 @@
+"""Cross-process invalidation of the in-process cache tier over pub/sub."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import weakref
+from contextlib import suppress
+from typing import Any, Iterable
+
+from loguru import logger
+from redis.exceptions import RedisError
+
+from ...config import settings
+from .local import LocalCache
+from .pool import get_client
+
+# In-process tiers by namespace; each server process subscribes once per
+# event loop and drops the keys that other processes invalidate.
+_LOCAL_TIERS: dict[str, LocalCache[Any]] = {}
+_LISTENERS: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, asyncio.Task[None]
+] = weakref.WeakKeyDictionary()
+
+
+def register(namespace: str, local: LocalCache[Any]) -> None:
+    _LOCAL_TIERS[namespace] = local
+
+
+async def publish(namespace: str, keys: Iterable[Any]) -> None:
+    """Tell every process to drop ``keys`` from its ``namespace`` tier."""
+    channel = settings.cache.invalidation_channel
+    if not channel:
+        return
+    message = {"namespace": namespace, "keys": [str(key) for key in keys]}
+    await get_client().publish(channel, json.dumps(message))
+
+
+def ensure_listener() -> None:
+    """Start this event loop's subscriber unless it already runs."""
+    channel = settings.cache.invalidation_channel
+    if not channel:
+        return
+    loop = asyncio.get_running_loop()
+    if loop not in _LISTENERS:
+        _LISTENERS[loop] = loop.create_task(_listen(channel))
+
+
+async def stop_listener() -> None:
+    task = _LISTENERS.pop(asyncio.get_running_loop(), None)
+    if task is not None:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
+
+async def _listen(channel: str) -> None:
+    # Holds one pool connection for as long as the loop runs.
+    while True:
+        pubsub = get_client().pubsub(ignore_subscribe_messages=True)
+        try:
+            await pubsub.subscribe(channel)
+            async for message in pubsub.listen():
+                _drop(message["data"])
+        except RedisError as exc:
+            logger.warning(f"Cache invalidation listener failed: {exc}")
+            await asyncio.sleep(1)
+        finally:
+            await pubsub.aclose()
+
+
+def _drop(data: bytes | str) -> None:
+    try:
+        message = json.loads(data)
+        local = _LOCAL_TIERS.get(message["namespace"])
+        keys = message["keys"]
+    except (TypeError, ValueError, KeyError):
+        return
+    if local is not None:
+        for key in keys:
+            local.delete(key)
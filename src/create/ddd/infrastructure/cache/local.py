@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, TypeVar
+
+_Value = TypeVar("_Value")
+
+
+class LocalCache(Generic[_Value]):
+    """In-process LRU mapping whose entries expire ``ttl`` seconds after set.
+
+    Each server process has its own copy, so a write made elsewhere only
+    reaches this tier once the entry expires: keep ``ttl`` short.
+    """
+
+    __slots__ = ("_entries", "maxsize", "ttl")
+
+    def __init__(self, *, maxsize: int, ttl: float) -> None:
+        self._entries: OrderedDict[Hashable, tuple[float, _Value]] = (
+            OrderedDict()
+        )
+        self.maxsize = maxsize
+        self.ttl = ttl
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> _Value | None:
+        item = self._entries.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: _Value) -> None:
+        if self.maxsize <= 0 or self.ttl <= 0:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
@@ -0,0 +1,85 @@
+"""Process-wide Redis clients shared by every ``CacheRepository``."""
+
+from __future__ import annotations
+
+import asyncio
+import weakref
+from typing import TYPE_CHECKING
+
+from redis.asyncio import BlockingConnectionPool, Redis
+
+from ...config import settings
+
+if TYPE_CHECKING:
+    from fakeredis import FakeServer  # pragma: no cover
+
+# redis-py connections belong to the event loop that opened them, so
+# every loop (Robyn runs one per worker) gets its own client and pool.
+_CLIENTS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Redis] = (
+    weakref.WeakKeyDictionary()
+)
+_fake_server: "FakeServer" | None = None
+
+
+def _build_client() -> Redis:
+    if settings.cache.use_fake:
+        try:
+            from fakeredis import FakeServer
+            from fakeredis.aioredis import FakeRedis
+        except ImportError as exc:
+            raise RuntimeError(
+                "fakeredis must be installed to use the fake cache (SETTINGS__CACHE__USE_FAKE=true);"
+                " install the `[dev]` extras or disable the flag."
+            ) from exc
+        global _fake_server
+        if _fake_server is None:
+            _fake_server = FakeServer()
+        return FakeRedis(server=_fake_server)
+
+    pool = settings.cache.pool
+    return Redis(
+        connection_pool=BlockingConnectionPool(
+            host=settings.cache.host,
+            port=settings.cache.port,
+            db=settings.cache.db,
+            max_connections=pool.max_connections,
+            timeout=pool.timeout,
+            health_check_interval=pool.health_check_interval,
+            socket_keepalive=pool.socket_keepalive,
+        )
+    )
+
+
+def get_client() -> Redis:
+    """Client of the running event loop, created on first use."""
+    loop = asyncio.get_running_loop()
+    client = _CLIENTS.get(loop)
+    if client is None:
+        client = _CLIENTS[loop] = _build_client()
+    return client
+
+
+async def close_client() -> None:
+    """Disconnect the running loop's pool, e.g. from a shutdown handler."""
+    from .invalidation import stop_listener  # it imports this module
+
+    await stop_listener()
+    client = _CLIENTS.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.connection_pool.disconnect()
+
+
+def pool_metrics() -> dict[str, int]:
+    """Connection counts summed over the pools of this process.
+
+    redis-py has no public connection counters; ``in_use`` and ``idle``
+    read its pool internals and stay 0 if a release renames them.
+    """
+    metrics = {"pools": 0, "in_use": 0, "idle": 0, "max_connections": 0}
+    for client in list(_CLIENTS.values()):
+        pool = client.connection_pool
+        metrics["pools"] += 1
+        metrics["in_use"] += len(getattr(pool, "_in_use_connections", ()))
+        metrics["idle"] += len(getattr(pool, "_available_connections", ()))
+        metrics["max_connections"] += pool.max_connections
+    return metrics
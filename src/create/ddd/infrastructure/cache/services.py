@@ -1,89 +1,157 @@
 from __future__ import annotations
 
-import json
-from typing import TYPE_CHECKING, Any, Generic, TypeVar, get_args
+import types
+from datetime import datetime
+from typing import Any, ClassVar, Generic, Mapping, Sequence, TypeVar
 
 from redis.asyncio import Redis
 from redis.asyncio.client import Pipeline
 
 from ...config import settings
 from ..application import InternalEntity, NotFoundError
+from .codecs import (
+    codec_for,
+    compress,
+    construct,
+    decompress,
+    get_codec,
+    revivers,
+)
 from .entities import CacheEntry
+from .pool import get_client
 
-if TYPE_CHECKING:
-    from fakeredis.aioredis import FakeRedis  # pragma: no cover
-    from fakeredis.aioredis import FakeServer  # pragma: no cover
+_CacheEntryInstance = TypeVar("_CacheEntryInstance", bound=InternalEntity)
 
-    CacheClient = Redis | FakeRedis
-else:
-    CacheClient = Redis  # type: ignore[assignment]
 
-_fake_server: "FakeServer" | None = None
+class CacheRepository(Generic[_CacheEntryInstance]):
+    """Typed cache entries, read and written inside an ``async with`` block.
 
-_CacheEntryInstance = TypeVar("_CacheEntryInstance", bound=InternalEntity)
+    Reads go to Redis right away. Writes (``set``, ``delete`` and their
+    ``*_many`` forms) are queued in a MULTI/EXEC pipeline and sent in one
+    round trip when the block exits, or dropped if it raises. Reads in the
+    block already see the block's queued writes.
 
+    ``CacheRepository[Entity]`` is a subclass made once per entity type,
+    so the entry type is resolved at subscription, not on every call.
+    """
+
+    entity: ClassVar[type[InternalEntity]] = InternalEntity
+    entry_model: ClassVar[type[CacheEntry]] = CacheEntry[InternalEntity]
+    _subclasses: ClassVar[dict[tuple[type, type], type[CacheRepository]]] = {}
+
+    def __class_getitem__(cls, entity: Any) -> Any:
+        alias = super().__class_getitem__(entity)  # type: ignore[misc]
+        if isinstance(entity, TypeVar):
+            return alias
+        try:
+            return cls._subclasses[cls, entity]
+        except KeyError:
+            subclass = types.new_class(
+                f"{cls.__name__}[{entity.__name__}]",
+                (alias,),
+                exec_body=lambda namespace: namespace.update(
+                    entity=entity,
+                    entry_model=CacheEntry[entity],
+                    __module__=cls.__module__,
+                ),
+            )
+            return cls._subclasses.setdefault((cls, entity), subclass)
 
-class CacheRepository(Generic[_CacheEntryInstance]):
     def __init__(self) -> None:
-        self.redis_client: CacheClient | None = None
+        self.redis_client: Redis | None = None
         self.transaction: Pipeline | None = None
+        self._pending: dict[str, bytes | None] = {}
 
     async def __aenter__(self) -> "CacheRepository[_CacheEntryInstance]":
-        if settings.cache.use_fake:
-            try:
-                from fakeredis.aioredis import FakeRedis, FakeServer
-            except ImportError as exc:
-                raise RuntimeError(
-                    "fakeredis must be installed to use the fake cache (SETTINGS__CACHE__USE_FAKE=true);"
-                    " install the `[dev]` extras or disable the flag."
-                ) from exc
-            global _fake_server
-            if _fake_server is None:
-                _fake_server = FakeServer()
-            self.redis_client = FakeRedis(server=_fake_server)
-        else:
-            self.redis_client = Redis(
-                host=settings.cache.host,
-                port=settings.cache.port,
-                db=settings.cache.db,
-            )
-
-        assert self.redis_client is not None
+        # Borrow the process-wide client: no connect or AUTH per block.
+        self.redis_client = get_client()
         self.transaction = self.redis_client.pipeline(transaction=True)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
-        assert self.redis_client is not None
         assert self.transaction is not None
-        if exc_type is None:
+        try:
+            if exc_type is None:
+                await self.flush()
+        finally:
+            await self.transaction.reset()
+            self._pending.clear()
+            self.redis_client = None
+            self.transaction = None
+
+    async def flush(self) -> None:
+        """Send the queued writes now instead of on exit."""
+        assert self.transaction is not None
+        if len(self.transaction):
             await self.transaction.execute()
-        await self.redis_client.close()
-        self.redis_client = None
-        self.transaction = None
+        self._pending.clear()
 
     def _build_key(self, namespace: str, key: Any) -> str:
         return f"{namespace}:{key}"
 
-    async def get(
-        self, namespace: str, key: Any
-    ) -> CacheEntry[_CacheEntryInstance]:
-        assert self.transaction is not None
-        built_key = self._build_key(namespace, key)
-        results = await self.transaction.get(built_key).execute()  # type: ignore[union-attr]
-        if not results or results[0] is None:
-            raise NotFoundError(message=f"Cache entry not found. Key: {key}")
+    def _encode(self, entry: CacheEntry[_CacheEntryInstance]) -> bytes:
+        return compress(get_codec().dumps(entry))
 
+    def _decode(self, key: Any, raw: bytes) -> CacheEntry[_CacheEntryInstance]:
         try:
-            payload = json.loads(results[0])
-        except (TypeError, json.JSONDecodeError) as exc:  # pragma: no cover
+            raw = decompress(raw)
+            codec = codec_for(raw)
+            if (
+                settings.cache.trusted_entries
+                and revivers(self.entity) is not None
+            ):
+                # Written by this code, so skip validation: rebuild the
+                # entry as is from the decoded payload.
+                payload = codec.unpack(raw)
+                return self.entry_model.model_construct(
+                    instance=construct(self.entity, payload["instance"]),
+                    created_at=datetime.fromisoformat(payload["created_at"]),
+                    delta=payload.get("delta", 0.0),
+                )
+            return codec.loads(raw, self.entry_model)  # type: ignore[return-value]
+        except (TypeError, ValueError, KeyError) as exc:
             raise NotFoundError(
                 message=f"Cache entry invalid. Key: {key}"
             ) from exc
 
-        struct = get_args(self.__orig_class__)[0]  # type: ignore[attr-defined]
-        return CacheEntry[_CacheEntryInstance](
-            instance=struct(**payload["instance"])
-        )
+    async def get(
+        self, namespace: str, key: Any
+    ) -> CacheEntry[_CacheEntryInstance]:
+        assert self.redis_client is not None
+        built_key = self._build_key(namespace, key)
+        if built_key in self._pending:
+            raw = self._pending[built_key]
+        else:
+            raw = await self.redis_client.get(built_key)
+        if raw is None:
+            raise NotFoundError(message=f"Cache entry not found. Key: {key}")
+        return self._decode(key, raw)
+
+    async def get_many(
+        self, namespace: str, keys: Sequence[Any]
+    ) -> dict[Any, CacheEntry[_CacheEntryInstance]]:
+        """Entries of ``keys`` read with one MGET; missing keys are left out."""
+        assert self.redis_client is not None
+        built_keys = [self._build_key(namespace, key) for key in keys]
+        values = {
+            built_key: self._pending[built_key]
+            for built_key in built_keys
+            if built_key in self._pending
+        }
+        unread = [key for key in built_keys if key not in values]
+        if unread:
+            values.update(zip(unread, await self.redis_client.mget(unread)))
+
+        entries = {}
+        for key, built_key in zip(keys, built_keys):
+            raw = values[built_key]
+            if raw is None:
+                continue
+            try:
+                entries[key] = self._decode(key, raw)
+            except NotFoundError:
+                continue
+        return entries
 
     async def set(
         self,
@@ -92,16 +160,39 @@ class CacheRepository(Generic[_CacheEntryInstance]):
         key: Any,
         instance: _CacheEntryInstance,
         ttl: int | None = None,
+        delta: float = 0.0,
     ) -> CacheEntry[_CacheEntryInstance]:
         assert self.transaction is not None
-        entry = CacheEntry[_CacheEntryInstance](instance=instance)
-        await self.transaction.set(
-            name=self._build_key(namespace, key),
-            value=entry.model_dump_json(),
-            ex=ttl,
-        ).execute()  # type: ignore[union-attr]
+        entry = self.entry_model(instance=instance, delta=delta)
+        built_key = self._build_key(namespace, key)
+        value = self._encode(entry)
+        self.transaction.set(name=built_key, value=value, ex=ttl)
+        self._pending[built_key] = value
         return entry
 
+    async def set_many(
+        self,
+        *,
+        namespace: str,
+        instances: Mapping[Any, _CacheEntryInstance],
+        ttl: int | None = None,
+    ) -> dict[Any, CacheEntry[_CacheEntryInstance]]:
+        """Queue one ``SET ... EX`` per instance, sent with the block."""
+        return {
+            key: await self.set(
+                namespace=namespace, key=key, instance=instance, ttl=ttl
+            )
+            for key, instance in instances.items()
+        }
+
     async def delete(self, namespace: str, key: Any) -> None:
+        await self.delete_many(namespace, [key])
+
+    async def delete_many(self, namespace: str, keys: Sequence[Any]) -> None:
+        """Queue a single DEL for all ``keys``."""
         assert self.transaction is not None
-        await self.transaction.delete(self._build_key(namespace, key)).execute()  # type: ignore[union-attr]
+        if not keys:
+            return
+        built_keys = [self._build_key(namespace, key) for key in keys]
+        self.transaction.delete(*built_keys)
+        self._pending.update(dict.fromkeys(built_keys))
@@ -1,7 +1,30 @@
-from typing import Any, AsyncGenerator, Generic, get_args, get_origin
+import functools
+from typing import (
+    Any,
+    AsyncGenerator,
+    Generic,
+    Iterable,
+    Iterator,
+    Sequence,
+    TypeVar,
+    get_args,
+    get_origin,
+)
 
-from sqlalchemy import asc, delete, desc, func, select, update
-from sqlalchemy.engine import Result
+from pydantic import BaseModel
+from sqlalchemy import (
+    Select,
+    asc,
+    bindparam,
+    delete,
+    desc,
+    func,
+    insert,
+    select,
+    update,
+)
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlalchemy.engine import Dialect, Result, RowMapping
 
 from ....infrastructure.application import (
     DatabaseError,
@@ -11,6 +34,38 @@ from ....infrastructure.application import (
 from ..services.session import Session
 from ..tables import ConcreteTable
 
+# Bulk statements stay under the bind parameter limit of every supported
+# driver (SQLite 32766, asyncpg 32767, MySQL 65535).
+MAX_BIND_PARAMETERS = 32_000
+_UPSERT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+    "mysql": mysql.insert,
+}
+_Item = TypeVar("_Item")
+_Entity = TypeVar("_Entity", bound=BaseModel)
+
+
+def _chunked(items: Sequence[_Item], size: int) -> Iterator[Sequence[_Item]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+@functools.lru_cache(maxsize=256)
+def _lookup(
+    schema_class: type, key: str, fields: tuple[str, ...] = ()
+) -> Select:
+    """``SELECT ... WHERE key = :value``, built once per table and key.
+
+    Reusing the statement object lets SQLAlchemy find its compiled form
+    by the memoized cache key instead of rebuilding and re-hashing the
+    query on every lookup.
+    """
+    columns = [getattr(schema_class, field) for field in fields]
+    return select(*columns or [schema_class]).where(
+        getattr(schema_class, key) == bindparam("value")
+    )
+
 
 class BaseRepository(Session, Generic[ConcreteTable]):
     schema_class: type[ConcreteTable] | None = None
@@ -49,9 +104,14 @@ class BaseRepository(Session, Generic[ConcreteTable]):
             update(self.schema_class)
             .where(getattr(self.schema_class, key) == value)
             .values(payload)
-            .returning(self.schema_class)
         )
-        result: Result = await self.execute(query)
+        if not self._dialect.update_returning:
+            result: Result = await self.execute(query)
+            if not result.rowcount:
+                raise DatabaseError
+            return await self._get(key, value)
+
+        result = await self.execute(query.returning(self.schema_class))
         await self._session.flush()
 
         schema = result.scalar_one_or_none()
@@ -60,15 +120,40 @@ class BaseRepository(Session, Generic[ConcreteTable]):
         return schema
 
     async def _get(self, key: str, value: Any) -> ConcreteTable:
-        query = select(self.schema_class).where(
-            getattr(self.schema_class, key) == value
-        )
-        result: Result = await self.execute(query)
+        query = _lookup(self.schema_class, key)
+        result: Result = await self.execute(query, {"value": value})
         schema = result.scalars().one_or_none()
         if not schema:
             raise NotFoundError
         return schema
 
+    def _columns(self, fields: Iterable[str]) -> list[Any]:
+        return [getattr(self.schema_class, field) for field in fields]
+
+    async def select_only(
+        self, fields: Sequence[str], **filters: Any
+    ) -> list[RowMapping]:
+        """Return only ``fields`` of the rows matching ``filters``.
+
+        Columns are selected instead of the mapped class, so rows come
+        back as light mappings that skip ORM instance construction and
+        the session's identity map.
+        """
+        query = select(*self._columns(fields)).filter_by(**filters)
+        result: Result = await self.execute(query)
+        return list(result.mappings().all())
+
+    async def load_only(
+        self, entity: type[_Entity], key: str, value: Any
+    ) -> _Entity:
+        """Load one row straight into ``entity``, selecting its fields only."""
+        query = _lookup(self.schema_class, key, tuple(entity.model_fields))
+        result: Result = await self.execute(query, {"value": value})
+        row = result.mappings().one_or_none()
+        if row is None:
+            raise NotFoundError
+        return entity.model_validate(dict(row))
+
     async def count(self) -> int:
         result: Result = await self.execute(func.count(self.schema_class.id))
         value = result.scalar()
@@ -95,6 +180,16 @@ class BaseRepository(Session, Generic[ConcreteTable]):
         return schema
 
     async def _save(self, payload: dict[str, Any]) -> ConcreteTable:
+        # INSERT ... RETURNING loads generated columns in the same round
+        # trip; dialects without it (MySQL) need a refresh after the flush.
+        if self._dialect.insert_returning:
+            result: Result = await self.execute(
+                insert(self.schema_class)
+                .values(payload)
+                .returning(self.schema_class)
+            )
+            return result.scalar_one()
+
         schema = self.schema_class(**payload)
         self._session.add(schema)
         await self._session.flush()
@@ -102,8 +197,46 @@ class BaseRepository(Session, Generic[ConcreteTable]):
         return schema
 
     async def _all(self) -> AsyncGenerator[ConcreteTable, None]:
-        result: Result = await self.execute(select(self.schema_class))
-        for schema in result.scalars().all():
+        async for schema in self.stream_scalars():
+            yield schema
+
+    async def paginate(
+        self, *, after: Any = None, limit: int = 50, order_by: str = "id"
+    ) -> list[ConcreteTable]:
+        """Return up to ``limit`` rows that sort after the ``after`` key.
+
+        Keyset pagination: the cursor is the last row's ``order_by`` value,
+        so every page is an index range scan however deep it is. The column
+        must be unique; prefix it with ``-`` for descending order.
+        """
+        descending = order_by.startswith("-")
+        column = getattr(self.schema_class, order_by.lstrip("-"))
+        query = (
+            select(self.schema_class)
+            .order_by(column.desc() if descending else column.asc())
+            .limit(limit)
+        )
+        if after is not None:
+            query = query.where(
+                column < after if descending else column > after
+            )
+        result: Result = await self.execute(query)
+        return list(result.scalars().all())
+
+    async def stream_scalars(
+        self, query: Select | None = None, *, batch_size: int = 500
+    ) -> AsyncGenerator[ConcreteTable, None]:
+        """Yield rows from a server-side cursor, ``batch_size`` at a time.
+
+        The session's connection stays busy until the iteration ends, so
+        do not run other queries on it from inside the loop.
+        """
+        if query is None:
+            query = select(self.schema_class)
+        result = await self._session.stream_scalars(
+            query.execution_options(yield_per=batch_size)
+        )
+        async for schema in result:
             yield schema
 
     async def delete(self, id_: int) -> None:
@@ -111,3 +244,103 @@ class BaseRepository(Session, Generic[ConcreteTable]):
             delete(self.schema_class).where(self.schema_class.id == id_)
         )
         await self._session.flush()
+
+    @property
+    def _dialect(self) -> Dialect:
+        return self._session.get_bind().dialect
+
+    def _row_chunks(
+        self, payloads: Sequence[dict[str, Any]]
+    ) -> Iterator[Sequence[dict[str, Any]]]:
+        columns = len(self.schema_class.__table__.columns)
+        return _chunked(payloads, max(1, MAX_BIND_PARAMETERS // columns))
+
+    async def bulk_create(
+        self, payloads: Sequence[dict[str, Any]]
+    ) -> list[ConcreteTable]:
+        """Insert many rows with one multi-row statement per chunk.
+
+        Rows come back from ``INSERT ... RETURNING`` where the dialect
+        supports it; elsewhere (MySQL) they are flushed as an executemany.
+        """
+        created: list[ConcreteTable] = []
+        for chunk in self._row_chunks(payloads):
+            if self._dialect.insert_returning:
+                result: Result = await self.execute(
+                    insert(self.schema_class)
+                    .values(list(chunk))
+                    .returning(self.schema_class)
+                )
+                created.extend(result.scalars().all())
+                continue
+            schemas = [self.schema_class(**payload) for payload in chunk]
+            self._session.add_all(schemas)
+            await self._session.flush()
+            created.extend(schemas)
+        return created
+
+    async def bulk_upsert(
+        self,
+        payloads: Sequence[dict[str, Any]],
+        *,
+        conflict: Sequence[str] = ("id",),
+        update_fields: Sequence[str] | None = None,
+    ) -> None:
+        """Insert rows, updating the existing ones that clash on ``conflict``.
+
+        Compiles to ``ON CONFLICT DO UPDATE`` on PostgreSQL and SQLite and
+        to ``ON DUPLICATE KEY UPDATE`` on MySQL. ``update_fields`` defaults
+        to every given column outside ``conflict``.
+        """
+        if not payloads:
+            return
+        dialect = self._dialect.name
+        if dialect not in _UPSERT_INSERTS:
+            raise UnprocessableError(
+                message=f"Upsert is not supported on {dialect}"
+            )
+        if update_fields is None:
+            update_fields = [key for key in payloads[0] if key not in conflict]
+
+        for chunk in self._row_chunks(payloads):
+            query = _UPSERT_INSERTS[dialect](self.schema_class).values(
+                list(chunk)
+            )
+            if dialect == "mysql":
+                # Re-assigning a conflict column makes a duplicate a no-op.
+                fields = update_fields or conflict[:1]
+                query = query.on_duplicate_key_update(
+                    {field: query.inserted[field] for field in fields}
+                )
+            elif update_fields:
+                query = query.on_conflict_do_update(
+                    index_elements=list(conflict),
+                    set_={
+                        field: query.excluded[field] for field in update_fields
+                    },
+                )
+            else:
+                query = query.on_conflict_do_nothing(
+                    index_elements=list(conflict)
+                )
+            await self.execute(query)
+
+    async def bulk_update(self, payloads: Sequence[dict[str, Any]]) -> None:
+        """Update many rows by primary key; every payload carries ``id``.
+
+        Each chunk runs as one executemany ``UPDATE ... WHERE id = ?``.
+        """
+        for chunk in self._row_chunks(payloads):
+            await self.execute(update(self.schema_class), list(chunk))
+
+    async def delete_many(self, ids: Sequence[Any]) -> int:
+        deleted = 0
+        for chunk in _chunked(ids, MAX_BIND_PARAMETERS):
+            result = await self.execute(
+                delete(self.schema_class).where(
+                    self.schema_class.id.in_(chunk)
+                )
+            )
+            deleted += result.rowcount
+        await self._session.flush()
+        return deleted
@@ -1,3 +1,12 @@
-from .engine import build_engine, create_engine  # noqa: F401
-from .session import Session, create_session  # noqa: F401
-from .transactions import transaction  # noqa: F401
+from .engine import (  # noqa: F401
+    build_engine,
+    create_engine,
+    create_read_engine,
+)
+from .session import Session, UnitOfWork, create_session  # noqa: F401
+from .transactions import (  # noqa: F401
+    begin_unit_of_work,
+    current_unit_of_work,
+    end_unit_of_work,
+    transaction,
+)
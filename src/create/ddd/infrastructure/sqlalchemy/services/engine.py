@@ -1,19 +1,72 @@
 import functools
+import itertools
+from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 
 from ....config import settings
 
 
-def build_engine() -> AsyncEngine:
+def _pool_options() -> dict[str, Any]:
+    pool = settings.database.pool
+    options: dict[str, Any] = {
+        "pool_pre_ping": pool.pre_ping,
+        "pool_recycle": pool.recycle,
+    }
+    if pool.kind == "null":
+        options["poolclass"] = NullPool
+        return options
+
+    options.update(
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=pool.size,
+        max_overflow=pool.max_overflow,
+        pool_timeout=pool.timeout,
+    )
+    return options
+
+
+def _connect_args(url: str) -> dict[str, Any]:
+    """Size asyncpg's prepared statement caches from the settings."""
+    if not url.startswith("postgresql+asyncpg"):
+        return {}
+    size = settings.database.statement_cache_size
+    # SQLAlchemy keeps its own per-connection LRU of prepared statements
+    # next to asyncpg's; both must be 0 behind PgBouncer.
+    return {
+        "prepared_statement_cache_size": size,
+        "statement_cache_size": size,
+    }
+
+
+def build_engine(url: str | None = None) -> AsyncEngine:
+    url = url or settings.database.url
     return create_async_engine(
-        settings.database.url,
+        url,
         future=True,
-        pool_pre_ping=True,
         echo=settings.debug,
+        connect_args=_connect_args(url),
+        **_pool_options(),
     )
 
 
 @functools.lru_cache(maxsize=1)
 def create_engine() -> AsyncEngine:
     return build_engine()
+
+
+@functools.lru_cache(maxsize=1)
+def create_replica_engines() -> tuple[AsyncEngine, ...]:
+    return tuple(build_engine(url) for url in settings.database.replicas)
+
+
+_REPLICA_ROTATION = itertools.count()
+
+
+def create_read_engine() -> AsyncEngine:
+    """Next replica engine in round-robin order, or the primary if none."""
+    replicas = create_replica_engines()
+    if not replicas:
+        return create_engine()
+    return replicas[next(_REPLICA_ROTATION) % len(replicas)]
@@ -1,10 +1,12 @@
 from contextvars import ContextVar
+from typing import Awaitable, Callable, Hashable
 
 from sqlalchemy.exc import IntegrityError, InvalidRequestError
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
+from ....config import settings
 from ....infrastructure.application import DatabaseError
-from .engine import create_engine
+from .engine import create_engine, create_read_engine
 
 
 def create_session(engine: AsyncEngine | None = None) -> AsyncSession:
@@ -13,19 +15,99 @@ def create_session(engine: AsyncEngine | None = None) -> AsyncSession:
     )
 
 
-CTX_SESSION: ContextVar[AsyncSession] = ContextVar(
-    "session", default=create_session()
+class UnitOfWork:
+    """Request-scoped session shared by every repository in one request.
+
+    The session is created on first use, so requests that never touch the
+    database never check out a connection.
+    """
+
+    __slots__ = ("_session", "_replica", "failed", "written", "_after_commit")
+
+    def __init__(self) -> None:
+        self._session: AsyncSession | None = None
+        self._replica: AsyncSession | None = None
+        self.failed = False
+        # Keys of what the request wrote, e.g. cache entries to skip.
+        self.written: set[Hashable] = set()
+        self._after_commit: list[Callable[[], Awaitable[None]]] = []
+
+    @property
+    def session(self) -> AsyncSession:
+        if self._session is None:
+            self._session = create_session()
+        return self._session
+
+    @property
+    def read_session(self) -> AsyncSession:
+        """Session for read-only blocks.
+
+        Reads use a replica until the request opens the primary session;
+        after that they stick to the primary and see the request's writes.
+        """
+        if self._session is not None or not settings.database.replicas:
+            return self.session
+        if self._replica is None:
+            self._replica = create_session(create_read_engine())
+        return self._replica
+
+    def after_commit(self, callback: Callable[[], Awaitable[None]]) -> None:
+        """Run ``callback`` once the request's transaction has committed.
+
+        Callbacks of a request that rolls back are dropped.
+        """
+        self._after_commit.append(callback)
+
+    async def close(self, *, commit: bool) -> None:
+        session, self._session = self._session, None
+        replica, self._replica = self._replica, None
+        callbacks, self._after_commit = self._after_commit, []
+        commit = commit and not self.failed
+        try:
+            if session is not None:
+                try:
+                    if commit:
+                        await session.commit()
+                    else:
+                        await session.rollback()
+                finally:
+                    await session.close()
+        finally:
+            if replica is not None:
+                await replica.close()
+        if commit:
+            for callback in callbacks:
+                await callback()
+
+
+CTX_SESSION: ContextVar[AsyncSession | None] = ContextVar(
+    "session", default=None
+)
+CTX_UNIT_OF_WORK: ContextVar[UnitOfWork | None] = ContextVar(
+    "unit_of_work", default=None
 )
 
 
+def current_session() -> AsyncSession:
+    session = CTX_SESSION.get()
+    if session is not None:
+        return session
+    unit_of_work = CTX_UNIT_OF_WORK.get()
+    if unit_of_work is None:
+        raise DatabaseError(
+            message="Session requested outside transaction context"
+        )
+    return unit_of_work.session
+
+
 class Session:
     _ERRORS = (IntegrityError, InvalidRequestError)
 
     def __init__(self) -> None:
-        self._session: AsyncSession = CTX_SESSION.get()
+        self._session: AsyncSession = current_session()
 
-    async def execute(self, query):
+    async def execute(self, query, params=None):
         try:
-            return await self._session.execute(query)
+            return await self._session.execute(query, params)
         except self._ERRORS as exc:  # pragma: no cover - defensive
             raise DatabaseError(message=str(exc)) from exc
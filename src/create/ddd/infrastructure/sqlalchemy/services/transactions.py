@@ -6,23 +6,86 @@ from sqlalchemy.exc import IntegrityError, InvalidRequestError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ....infrastructure.application import DatabaseError
-from .session import CTX_SESSION, create_session
+from .engine import create_read_engine
+from .session import CTX_SESSION, CTX_UNIT_OF_WORK, UnitOfWork, create_session
+
+
+def begin_unit_of_work() -> UnitOfWork:
+    """Open a request scope; its session is created on first use."""
+    unit_of_work = UnitOfWork()
+    CTX_UNIT_OF_WORK.set(unit_of_work)
+    return unit_of_work
+
+
+async def end_unit_of_work(*, commit: bool) -> None:
+    """Commit (or roll back) and release the current request scope."""
+    unit_of_work = CTX_UNIT_OF_WORK.get()
+    if unit_of_work is None:
+        return
+    CTX_UNIT_OF_WORK.set(None)
+    await unit_of_work.close(commit=commit)
+
+
+def current_unit_of_work() -> UnitOfWork | None:
+    """The unit of work of the running request, if any."""
+    return CTX_UNIT_OF_WORK.get()
 
 
 @asynccontextmanager
-async def transaction() -> AsyncGenerator[AsyncSession, None]:
-    session = create_session()
-    CTX_SESSION.set(session)
+async def transaction(
+    *, readonly: bool = False
+) -> AsyncGenerator[AsyncSession, None]:
+    """Run a block against one session.
+
+    Inside a request scope the request session is reused and changes are
+    only flushed; the unit of work commits once when the request ends and
+    rolls back everything if any block failed. Nested blocks join the
+    enclosing transaction.
+
+    ``readonly`` blocks are routed to a read replica (round-robin) and
+    never commit. Once a request has opened the primary session its reads
+    stay on the primary, so they see the request's own writes.
+    """
+    active = CTX_SESSION.get()
+    if active is not None:
+        yield active
+        return
+
+    unit_of_work = CTX_UNIT_OF_WORK.get()
+    if unit_of_work:
+        session = (
+            unit_of_work.read_session if readonly else unit_of_work.session
+        )
+    else:
+        session = create_session(create_read_engine() if readonly else None)
+    token = CTX_SESSION.set(session)
     try:
         yield session
-        await session.commit()
+        if unit_of_work:
+            await session.flush()
+        elif not readonly:
+            await session.commit()
     except DatabaseError as exc:
         logger.error(f"Rolling back changes: {exc}")
-        await session.rollback()
+        await _rollback(session, unit_of_work)
         raise
     except (IntegrityError, InvalidRequestError) as exc:  # pragma: no cover
         logger.error(f"Rolling back changes: {exc}")
-        await session.rollback()
+        await _rollback(session, unit_of_work)
         raise DatabaseError(message=str(exc)) from exc
+    except BaseException:
+        if unit_of_work:
+            unit_of_work.failed = True
+        raise
     finally:
-        await session.close()
+        CTX_SESSION.reset(token)
+        if not unit_of_work:
+            await session.close()
+
+
+async def _rollback(
+    session: AsyncSession, unit_of_work: UnitOfWork | None
+) -> None:
+    if unit_of_work:
+        unit_of_work.failed = True
+    await session.rollback()
@@ -1,30 +1,71 @@
 from typing import Any, AsyncGenerator
 
+from ....config import settings
 from ....domain.users import UsersRepository as UsersRepositoryInterface
-from ....domain.users.entities import UserFlat, UserUncommitted
+from ....domain.users.entities import (
+    UserCredentials,
+    UserFlat,
+    UserUncommitted,
+)
+from ....infrastructure.application import NotFoundError, PrimaryKey
+from ....infrastructure.cache import (
+    EntityCache,
+    read_through,
+    write_invalidate,
+)
 from ..tables import UsersTable
 from .base import BaseRepository
 
+USERS_CACHE = EntityCache(
+    "users", UserFlat, ttl=settings.cache.ttl_entity_seconds
+)
+# Login aliases: a hit is only served after the user it points at, read
+# through USERS_CACHE, still has that username.
+USER_LOGINS_CACHE = EntityCache(
+    "users-login", UserFlat, ttl=settings.cache.ttl_entity_seconds
+)
+
+
+async def _current_login(
+    repository: "UsersRepository", login: str, alias: UserFlat
+) -> UserFlat | None:
+    try:
+        user = await repository.get(alias.id)
+    except NotFoundError:
+        return None
+    return user if user.username == login else None
+
 
 class UsersRepository(BaseRepository[UsersTable], UsersRepositoryInterface):
     async def all(self) -> AsyncGenerator[UserFlat, None]:
         async for instance in self._all():
             yield UserFlat.model_validate(instance)
 
+    @read_through(USERS_CACHE)
     async def get(self, id_: int) -> UserFlat:
         instance = await self._get(key="id", value=id_)
         return UserFlat.model_validate(instance)
 
+    @read_through(USER_LOGINS_CACHE, resolve=_current_login)
     async def get_by_login(self, login: str) -> UserFlat:
-        instance = await self._get(key="username", value=login)
-        return UserFlat.model_validate(instance)
+        return await self.load_only(UserFlat, key="username", value=login)
+
+    async def get_credentials(self, login: str) -> UserCredentials:
+        return await self.load_only(
+            UserCredentials, key="username", value=login
+        )
 
     async def create(self, schema: UserUncommitted) -> UserFlat:
         instance = await self._save(schema.model_dump())
         return UserFlat.model_validate(instance)
 
+    @write_invalidate(USERS_CACHE, keys=lambda user, *_, **__: [user.id])
     async def update(
         self, attr: str, value: Any, payload: dict[str, Any]
     ) -> UserFlat:
         schema = await self._update(attr, value, payload)
         return UserFlat.model_validate(schema)
+
+    @write_invalidate(USERS_CACHE, keys=lambda _, id_: [id_])
+    async def delete(self, id_: PrimaryKey) -> None:
+        await super().delete(id_)
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import asyncio
 import functools
+import itertools
 from typing import Any
+from urllib.parse import urlencode
 
 from tortoise import Tortoise
 
@@ -30,10 +32,38 @@ def _normalize_database_url(url: str) -> str:
     return url
 
 
+def _pool_query(url: str) -> str:
+    """Append per-process pool and statement cache limits as URL params."""
+    if url.startswith("sqlite"):
+        return url
+
+    pool = settings.database.pool
+    params = {"minsize": pool.min_size, "maxsize": pool.max_size}
+    if url.startswith("postgres"):
+        params["max_inactive_connection_lifetime"] = pool.max_inactive_lifetime
+        params["statement_cache_size"] = settings.database.statement_cache_size
+    elif url.startswith("mysql"):
+        params["pool_recycle"] = int(pool.max_inactive_lifetime)
+    separator = "&" if "?" in url else "?"
+    return f"{url}{separator}{urlencode(params)}"
+
+
+def _connection_url(url: str) -> str:
+    return _pool_query(_normalize_database_url(url))
+
+
+def _replica_names() -> tuple[str, ...]:
+    return tuple(
+        f"replica_{index}" for index in range(len(settings.database.replicas))
+    )
+
+
 def _build_config() -> dict[str, Any]:
+    replicas = zip(_replica_names(), settings.database.replicas)
     return {
         "connections": {
-            "default": _normalize_database_url(settings.database.url)
+            "default": _connection_url(settings.database.url),
+            **{name: _connection_url(url) for name, url in replicas},
         },
         "apps": {
             APP_LABEL: {
@@ -52,6 +82,16 @@ def build_engine() -> dict[str, Any]:
 
 
 TORTOISE_ORM = build_engine()
+REPLICA_CONNECTIONS = _replica_names()
+_REPLICA_ROTATION = itertools.count()
+
+
+def read_connection_name() -> str:
+    """Next replica connection in round-robin order, or the primary."""
+    if not REPLICA_CONNECTIONS:
+        return "default"
+    index = next(_REPLICA_ROTATION) % len(REPLICA_CONNECTIONS)
+    return REPLICA_CONNECTIONS[index]
 
 
 async def create_engine() -> dict[str, Any]:
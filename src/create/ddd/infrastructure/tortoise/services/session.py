@@ -1,18 +1,96 @@
 from __future__ import annotations
 
 from contextvars import ContextVar
-from typing import Any, Sequence
+from typing import Any, Awaitable, Callable, Hashable, Sequence
 
 from tortoise import connections
-from tortoise.backends.base.client import BaseDBAsyncClient
+from tortoise.backends.base.client import (
+    BaseDBAsyncClient,
+    TransactionContext,
+)
 from tortoise.exceptions import OperationalError
+from tortoise.transactions import in_transaction
 
 from ....infrastructure.application import DatabaseError
-from .engine import create_engine
+from .engine import REPLICA_CONNECTIONS, create_engine, read_connection_name
+
+
+class UnitOfWork:
+    """Request-scoped transaction shared by every repository in one request.
+
+    The transaction is opened on first use, so requests that never touch
+    the database never check out a connection.
+    """
+
+    __slots__ = (
+        "_context",
+        "_connection",
+        "_replica",
+        "failed",
+        "written",
+        "_after_commit",
+    )
+
+    def __init__(self) -> None:
+        self._context: TransactionContext | None = None
+        self._connection: BaseDBAsyncClient | None = None
+        self._replica: BaseDBAsyncClient | None = None
+        self.failed = False
+        # Keys of what the request wrote, e.g. cache entries to skip.
+        self.written: set[Hashable] = set()
+        self._after_commit: list[Callable[[], Awaitable[None]]] = []
+
+    async def connection(self) -> BaseDBAsyncClient:
+        if self._connection is None:
+            await create_engine()
+            context = in_transaction(connection_name="default")
+            self._connection = await context.__aenter__()
+            self._context = context
+        return self._connection
+
+    async def read_connection(self) -> BaseDBAsyncClient:
+        """Connection for read-only blocks.
+
+        Reads use a replica until the request opens its primary
+        transaction; after that they stick to the primary and see the
+        request's writes.
+        """
+        if self._connection is not None or not REPLICA_CONNECTIONS:
+            return await self.connection()
+        if self._replica is None:
+            await create_engine()
+            self._replica = connections.get(read_connection_name())
+        return self._replica
+
+    def after_commit(self, callback: Callable[[], Awaitable[None]]) -> None:
+        """Run ``callback`` once the request's transaction has committed.
+
+        Callbacks of a request that rolls back are dropped.
+        """
+        self._after_commit.append(callback)
+
+    async def close(self, *, commit: bool) -> None:
+        context, connection = self._context, self._connection
+        self._context = self._connection = self._replica = None
+        callbacks, self._after_commit = self._after_commit, []
+        commit = commit and not self.failed
+        if context is not None and connection is not None:
+            try:
+                if not commit:
+                    await connection.rollback()
+            finally:
+                await context.__aexit__(None, None, None)
+        if commit:
+            for callback in callbacks:
+                await callback()
+
 
 CTX_CONNECTION: ContextVar[BaseDBAsyncClient | None] = ContextVar(
     "tortoise_connection", default=None
 )
+CTX_UNIT_OF_WORK: ContextVar[UnitOfWork | None] = ContextVar(
+    "unit_of_work", default=None
+)
 
 
 async def create_session(
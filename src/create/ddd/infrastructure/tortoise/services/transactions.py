@@ -4,27 +4,100 @@ from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from loguru import logger
+from tortoise import connections
 from tortoise.backends.base.client import BaseDBAsyncClient
 from tortoise.exceptions import IntegrityError, OperationalError
 from tortoise.transactions import in_transaction
 
 from ....infrastructure.application import DatabaseError
-from .engine import create_engine
-from .session import CTX_CONNECTION
+from .engine import create_engine, read_connection_name
+from .session import CTX_CONNECTION, CTX_UNIT_OF_WORK, UnitOfWork
+
+
+def begin_unit_of_work() -> UnitOfWork:
+    """Open a request scope; its transaction starts on first use."""
+    unit_of_work = UnitOfWork()
+    CTX_UNIT_OF_WORK.set(unit_of_work)
+    return unit_of_work
+
+
+async def end_unit_of_work(*, commit: bool) -> None:
+    """Commit (or roll back) and release the current request scope."""
+    unit_of_work = CTX_UNIT_OF_WORK.get()
+    if unit_of_work is None:
+        return
+    CTX_UNIT_OF_WORK.set(None)
+    await unit_of_work.close(commit=commit)
+
+
+def current_unit_of_work() -> UnitOfWork | None:
+    """The unit of work of the running request, if any."""
+    return CTX_UNIT_OF_WORK.get()
 
 
 @asynccontextmanager
-async def transaction() -> AsyncGenerator[BaseDBAsyncClient, None]:
+async def transaction(
+    *, readonly: bool = False
+) -> AsyncGenerator[BaseDBAsyncClient, None]:
+    """Run a block inside one database transaction.
+
+    Inside a request scope the request transaction is reused; the unit of
+    work commits once when the request ends and rolls back everything if
+    any block failed. Nested blocks join the enclosing transaction.
+
+    ``readonly`` blocks run on a read replica (round-robin) outside any
+    transaction. Once a request has opened its primary transaction its
+    reads stay on the primary, so they see the request's own writes.
+    """
+    active = CTX_CONNECTION.get()
+    if active is not None:
+        yield active
+        return
+
+    unit_of_work = CTX_UNIT_OF_WORK.get()
+    if unit_of_work is not None:
+        if readonly:
+            connection = await unit_of_work.read_connection()
+        else:
+            connection = await unit_of_work.connection()
+        async with _scope(connection, unit_of_work):
+            yield connection
+        return
+
     await create_engine()
+    if readonly:
+        connection = connections.get(read_connection_name())
+        async with _scope(connection, None):
+            yield connection
+        return
+
     async with in_transaction(connection_name="default") as connection:
-        token = CTX_CONNECTION.set(connection)
-        try:
+        async with _scope(connection, None):
             yield connection
-        except DatabaseError as exc:
-            logger.error(f"Rolling back changes: {exc}")
-            raise
-        except (IntegrityError, OperationalError) as exc:  # pragma: no cover
-            logger.error(f"Rolling back changes: {exc}")
-            raise DatabaseError(message=str(exc)) from exc
-        finally:
-            CTX_CONNECTION.reset(token)
+
+
+@asynccontextmanager
+async def _scope(
+    connection: BaseDBAsyncClient, unit_of_work: UnitOfWork | None
+) -> AsyncGenerator[None, None]:
+    token = CTX_CONNECTION.set(connection)
+    try:
+        yield
+    except DatabaseError as exc:
+        logger.error(f"Rolling back changes: {exc}")
+        _mark_failed(unit_of_work)
+        raise
+    except (IntegrityError, OperationalError) as exc:  # pragma: no cover
+        logger.error(f"Rolling back changes: {exc}")
+        _mark_failed(unit_of_work)
+        raise DatabaseError(message=str(exc)) from exc
+    except BaseException:
+        _mark_failed(unit_of_work)
+        raise
+    finally:
+        CTX_CONNECTION.reset(token)
+
+
+def _mark_failed(unit_of_work: UnitOfWork | None) -> None:
+    if unit_of_work is not None:
+        unit_of_work.failed = True
@@ -10,7 +10,7 @@ from robyn import Request
 from robyn.authentication import AuthenticationHandler, BearerGetter, Identity
 
 from ..config import settings
-from ..domain.users import UserFlat
+from ..domain.users import UserCredentials
 from ..infrastructure.application import (
     AuthenticationError,
     NotFoundError,
@@ -25,12 +25,12 @@ from ..infrastructure.database.repository import (
 )
 
 
-async def authenticate_user(login: str, password: str) -> UserFlat:
+async def authenticate_user(login: str, password: str) -> UserCredentials:
     """Validate credentials and return the matching active user."""
     try:
-        async with transaction():
+        async with transaction(readonly=True):
             repository = InfrastructureUsersRepository()
-            user = await repository.get_by_login(login=login)
+            user = await repository.get_credentials(login=login)
     except NotFoundError as exc:
         raise AuthenticationError(message="Invalid credentials") from exc
 
@@ -43,7 +43,7 @@ async def authenticate_user(login: str, password: str) -> UserFlat:
     return user
 
 
-def create_access_token(user: UserFlat) -> str:
+def create_access_token(user: UserCredentials) -> str:
     """Generate a signed JWT for the provided user."""
     now = datetime.now(timezone.utc)
     ttl = settings.authentication.access_token.ttl
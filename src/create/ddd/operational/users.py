@@ -14,7 +14,7 @@ from ..infrastructure.application import (
     UnprocessableError,
 )
 from ..infrastructure.authentication import AuthProvider, pwd_context
-from ..infrastructure.cache import CacheRepository
+from ..infrastructure.cache import CacheRepository, cached
 from ..infrastructure.database import transaction
 from ..infrastructure.database.repository import (
     UsersRepository as InfrastructureUsersRepository,
@@ -80,12 +80,13 @@ async def update_partial(user: UserFlat, payload: dict[str, Any]) -> UserFlat:
 
 
 async def get_by_login(login: str) -> UserFlat:
-    async with transaction():
+    async with transaction(readonly=True):
         return await InfrastructureUsersRepository().get_by_login(login=login)
 
 
+@cached(namespace="users")
 async def get(user_id: PrimaryKey) -> UserFlat:
-    async with transaction():
+    async with transaction(readonly=True):
         return await InfrastructureUsersRepository().get(id_=user_id)
 
 
@@ -116,7 +117,7 @@ async def password_change(
 
 async def password_reset(email: EmailStr) -> None:
     try:
-        async with transaction():
+        async with transaction(readonly=True):
             repository = InfrastructureUsersRepository()
             user = await repository.get_by_login(login=email)
     except NotFoundError:
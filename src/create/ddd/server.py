@@ -37,6 +37,7 @@ app: Robyn = create(
     __name__,
     route_registrars=(register_routes,),
     middlewares=(
+        middlewares.database.register,
         middlewares.sessions.register,
         middlewares.cors.register,
     ),
@@ -1,18 +1,52 @@
 from __future__ import annotations
 
+import asyncio
+import functools
+import inspect
 import json
-from datetime import datetime
-from typing import Annotated, Any, Generic, TypeVar, get_args
+import math
+import random
+import time
+import types
+import uuid
+import weakref
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import suppress
+from contextvars import ContextVar
+from datetime import date, datetime
+from enum import Enum
+from typing import (
+    Annotated,
+    Any,
+    Awaitable,
+    Callable,
+    ClassVar,
+    Generic,
+    Hashable,
+    Iterable,
+    Mapping,
+    Sequence,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
 
-from pydantic import Field
-from redis.asyncio import Redis
+from loguru import logger
+from pydantic import BaseModel, EmailStr, Field
+from redis.asyncio import BlockingConnectionPool, Redis
+from redis.asyncio.client import Pipeline
+from redis.exceptions import RedisError
 
 from .config import settings
 from .schemas import InternalEntity
 from .utils import NotFoundError
 
 try:  # Optional dependency for fakeredis in dev
-    from fakeredis.aioredis import FakeRedis, FakeServer  # type: ignore
+    from fakeredis import FakeServer  # type: ignore
+    from fakeredis.aioredis import FakeRedis  # type: ignore
 except Exception:  # pragma: no cover - fakeredis not installed
     FakeRedis = None  # type: ignore
     FakeServer = None  # type: ignore
@@ -21,75 +55,411 @@ CacheClient = Redis
 
 _fake_server: "FakeServer | None" = None
 _CacheEntryInstance = TypeVar("_CacheEntryInstance", bound=InternalEntity)
+_Value = TypeVar("_Value")
+_Method = TypeVar("_Method", bound=Callable[..., Awaitable[Any]])
 
 
 class CacheEntry(InternalEntity, Generic[_CacheEntryInstance]):
     instance: _CacheEntryInstance
     created_at: Annotated[datetime, Field(default_factory=datetime.utcnow)]
+    # Seconds it took to load ``instance``, for early expiration.
+    delta: float = 0.0
+
+
+# redis-py connections belong to the event loop that opened them, so
+# every loop (Robyn runs one per worker) gets its own client and pool.
+_CLIENTS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Redis] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _build_client() -> Redis:
+    if settings.cache.use_fake:
+        if not FakeRedis or not FakeServer:  # pragma: no cover - import guard
+            raise RuntimeError(
+                "fakeredis must be installed to use the fake cache "
+                "(SETTINGS__CACHE__USE_FAKE=true). Install the `[dev]` extras "
+                "or disable the flag."
+            )
+        global _fake_server
+        if _fake_server is None:
+            _fake_server = FakeServer()
+        return FakeRedis(server=_fake_server)
+
+    pool = settings.cache.pool
+    return Redis(
+        connection_pool=BlockingConnectionPool(
+            host=settings.cache.host,
+            port=settings.cache.port,
+            db=settings.cache.db,
+            max_connections=pool.max_connections,
+            timeout=pool.timeout,
+            health_check_interval=pool.health_check_interval,
+            socket_keepalive=pool.socket_keepalive,
+        )
+    )
+
+
+def get_client() -> Redis:
+    """Client of the running event loop, created on first use."""
+    loop = asyncio.get_running_loop()
+    client = _CLIENTS.get(loop)
+    if client is None:
+        client = _CLIENTS[loop] = _build_client()
+    return client
+
+
+async def close_client() -> None:
+    """Disconnect the running loop's pool, e.g. from a shutdown handler."""
+    await stop_listener()
+    client = _CLIENTS.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.connection_pool.disconnect()
+
+
+def pool_metrics() -> dict[str, int]:
+    """Connection counts summed over the pools of this process.
+
+    redis-py has no public connection counters; ``in_use`` and ``idle``
+    read its pool internals and stay 0 if a release renames them.
+    """
+    metrics = {"pools": 0, "in_use": 0, "idle": 0, "max_connections": 0}
+    for client in list(_CLIENTS.values()):
+        pool = client.connection_pool
+        metrics["pools"] += 1
+        metrics["in_use"] += len(getattr(pool, "_in_use_connections", ()))
+        metrics["idle"] += len(getattr(pool, "_available_connections", ()))
+        metrics["max_connections"] += pool.max_connections
+    return metrics
+
+
+# Every zstd frame starts with these bytes, and neither a JSON object nor
+# a msgpack map does, so compressed entries need no extra header.
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# Field types ``model_construct`` can rebuild from their JSON form.
+_NATIVE = (str, int, float, bool, EmailStr)
+_REVIVERS: dict[Any, Callable[[Any], Any]] = {
+    datetime: datetime.fromisoformat,
+    date: date.fromisoformat,
+    uuid.UUID: uuid.UUID,
+}
+
+
+class Codec(ABC):
+    """Turns a cache entry into bytes and back into a plain payload."""
+
+    name: ClassVar[str]
+
+    def dumps(self, entry: BaseModel) -> bytes:
+        return self.pack(entry.model_dump(mode="json"))
+
+    def loads(self, raw: bytes, model: type[BaseModel]) -> BaseModel:
+        """Decode and validate ``raw`` as ``model``."""
+        return model.model_validate(self.unpack(raw))
+
+    @abstractmethod
+    def pack(self, payload: dict[str, Any]) -> bytes: ...
+
+    @abstractmethod
+    def unpack(self, raw: bytes) -> dict[str, Any]: ...
+
+
+class JsonCodec(Codec):
+    """JSON through pydantic's own serializer and parser."""
+
+    name = "json"
+
+    def dumps(self, entry: BaseModel) -> bytes:
+        return entry.model_dump_json().encode()
+
+    def loads(self, raw: bytes, model: type[BaseModel]) -> BaseModel:
+        return model.model_validate_json(raw)
+
+    def pack(self, payload: dict[str, Any]) -> bytes:
+        return json.dumps(payload, separators=(",", ":")).encode()
+
+    def unpack(self, raw: bytes) -> dict[str, Any]:
+        return json.loads(raw)
+
+
+class OrjsonCodec(JsonCodec):
+    """The same JSON, parsed by orjson when entries are not validated."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+
+    def pack(self, payload: dict[str, Any]) -> bytes:
+        return self._orjson.dumps(payload)
+
+    def unpack(self, raw: bytes) -> dict[str, Any]:
+        return self._orjson.loads(raw)
+
+
+class MsgpackCodec(Codec):
+    """MessagePack: smaller than JSON for numbers and short strings."""
+
+    name = "msgpack"
+
+    def __init__(self) -> None:
+        import msgpack
+
+        self._msgpack = msgpack
+
+    def pack(self, payload: dict[str, Any]) -> bytes:
+        return self._msgpack.packb(payload)
+
+    def unpack(self, raw: bytes) -> dict[str, Any]:
+        return self._msgpack.unpackb(raw)
+
+
+_CODECS: dict[str, type[Codec]] = {
+    codec.name: codec for codec in (JsonCodec, OrjsonCodec, MsgpackCodec)
+}
+
+
+@functools.cache
+def _codec(name: str) -> Codec:
+    try:
+        return _CODECS[name]()
+    except ImportError as exc:
+        raise RuntimeError(
+            f"The {name!r} cache codec needs the `{name}` package;"
+            " install it or change SETTINGS__CACHE__CODEC."
+        ) from exc
+
+
+def get_codec() -> Codec:
+    """Codec named by ``settings.cache.codec``."""
+    return _codec(settings.cache.codec)
+
+
+def codec_for(raw: bytes) -> Codec:
+    """Codec able to read ``raw``, the configured one if it can.
+
+    A JSON entry is an object and a msgpack one a map, which never starts
+    with ``{``, so entries written before a codec change stay readable.
+    """
+    codec = get_codec()
+    is_json = raw.startswith(b"{")
+    if is_json == isinstance(codec, JsonCodec):
+        return codec
+    return _codec("json" if is_json else "msgpack")
+
+
+@functools.cache
+def _zstd() -> tuple[Any, Any]:
+    try:
+        import zstandard
+    except ImportError as exc:
+        raise RuntimeError(
+            "zstandard must be installed to compress cache entries"
+            " (SETTINGS__CACHE__COMPRESS_MIN_BYTES > 0)."
+        ) from exc
+    return zstandard.ZstdCompressor(), zstandard.ZstdDecompressor()
+
+
+def compress(data: bytes) -> bytes:
+    """zstd-compress ``data`` when it exceeds the configured threshold."""
+    threshold = settings.cache.compress_min_bytes
+    if threshold <= 0 or len(data) < threshold:
+        return data
+    compressor, _ = _zstd()
+    return compressor.compress(data)
+
+
+def decompress(raw: bytes) -> bytes:
+    if not raw.startswith(_ZSTD_MAGIC):
+        return raw
+    _, decompressor = _zstd()
+    try:
+        return decompressor.decompress(raw)
+    except Exception as exc:  # zstandard.ZstdError
+        raise ValueError(f"Corrupt compressed cache entry: {exc}") from exc
+
+
+@functools.cache
+def revivers(model: type[BaseModel]) -> dict[str, Callable] | None:
+    """Converters rebuilding ``model`` fields from their JSON values.
+
+    ``None`` means a field has a type ``model_construct`` cannot be fed
+    from JSON (a nested model, a container, ...), so the entry has to
+    be validated instead.
+    """
+    enum_values = model.model_config.get("use_enum_values", False)
+    converters = {}
+    for name, field in model.model_fields.items():
+        annotation = field.annotation
+        if get_origin(annotation) in (Union, types.UnionType):
+            options = [
+                arg for arg in get_args(annotation) if arg is not type(None)
+            ]
+            if len(options) != 1:
+                return None
+            annotation = options[0]
+        if annotation in _REVIVERS:
+            converters[name] = _REVIVERS[annotation]
+        elif not isinstance(annotation, type):
+            return None
+        elif issubclass(annotation, Enum):
+            if not enum_values:
+                converters[name] = annotation
+        elif not issubclass(annotation, _NATIVE):
+            return None
+    return converters
+
+
+def construct(model: type[BaseModel], payload: dict[str, Any]) -> BaseModel:
+    """Build ``model`` from trusted ``payload`` without validating it."""
+    for name, revive in revivers(model).items():  # type: ignore[union-attr]
+        value = payload.get(name)
+        if value is not None:
+            payload[name] = revive(value)
+    return model.model_construct(**payload)
 
 
 class CacheRepository(Generic[_CacheEntryInstance]):
+    """Typed cache entries, read and written inside an ``async with`` block.
+
+    Reads go to Redis right away. Writes (``set``, ``delete`` and their
+    ``*_many`` forms) are queued in a MULTI/EXEC pipeline and sent in one
+    round trip when the block exits, or dropped if it raises. Reads in the
+    block already see the block's queued writes.
+
+    ``CacheRepository[Entity]`` is a subclass made once per entity type,
+    so the entry type is resolved at subscription, not on every call.
+    """
+
+    entity: ClassVar[type[InternalEntity]] = InternalEntity
+    entry_model: ClassVar[type[CacheEntry]] = CacheEntry[InternalEntity]
+    _subclasses: ClassVar[dict[tuple[type, type], type[CacheRepository]]] = {}
+
+    def __class_getitem__(cls, entity: Any) -> Any:
+        alias = super().__class_getitem__(entity)  # type: ignore[misc]
+        if isinstance(entity, TypeVar):
+            return alias
+        try:
+            return cls._subclasses[cls, entity]
+        except KeyError:
+            subclass = types.new_class(
+                f"{cls.__name__}[{entity.__name__}]",
+                (alias,),
+                exec_body=lambda namespace: namespace.update(
+                    entity=entity,
+                    entry_model=CacheEntry[entity],
+                    __module__=cls.__module__,
+                ),
+            )
+            return cls._subclasses.setdefault((cls, entity), subclass)
+
     def __init__(self) -> None:
         self.redis_client: CacheClient | None = None
+        self.transaction: Pipeline | None = None
+        self._pending: dict[str, bytes | None] = {}
 
     async def __aenter__(self) -> "CacheRepository[_CacheEntryInstance]":
-        if settings.cache.use_fake:
-            if (
-                not FakeRedis or not FakeServer
-            ):  # pragma: no cover - import guard
-                raise RuntimeError(
-                    "fakeredis must be installed to use the fake cache "
-                    "(SETTINGS__CACHE__USE_FAKE=true). Install the `[dev]` extras "
-                    "or disable the flag."
-                )
-            global _fake_server
-            if _fake_server is None:
-                _fake_server = FakeServer()
-            self.redis_client = FakeRedis(server=_fake_server)
-        else:
-            self.redis_client = Redis(
-                host=settings.cache.host,
-                port=settings.cache.port,
-                db=settings.cache.db,
-            )
+        # Borrow the process-wide client: no connect or AUTH per block.
+        self.redis_client = get_client()
+        self.transaction = self.redis_client.pipeline(transaction=True)
         return self
 
     async def __aexit__(self, exc_type, exc, tb) -> None:
-        if self.redis_client is not None:
-            await self.redis_client.close()
-        self.redis_client = None
+        if self.transaction is None:
+            return
+        try:
+            if exc_type is None:
+                await self.flush()
+        finally:
+            await self.transaction.reset()
+            self._pending.clear()
+            self.redis_client = None
+            self.transaction = None
+
+    def _pipeline(self) -> Pipeline:
+        if self.transaction is None:
+            raise RuntimeError("CacheRepository not initialized")
+        return self.transaction
+
+    def _client(self) -> CacheClient:
+        if self.redis_client is None:
+            raise RuntimeError("CacheRepository not initialized")
+        return self.redis_client
+
+    async def flush(self) -> None:
+        """Send the queued writes now instead of on exit."""
+        transaction = self._pipeline()
+        if len(transaction):
+            await transaction.execute()
+        self._pending.clear()
 
     def _build_key(self, namespace: str, key: Any) -> str:
         return f"{namespace}:{key}"
 
-    def _model_for_entry(self) -> type[_CacheEntryInstance]:
+    def _encode(self, entry: CacheEntry[_CacheEntryInstance]) -> bytes:
+        return compress(get_codec().dumps(entry))
+
+    def _decode(self, key: Any, raw: bytes) -> CacheEntry[_CacheEntryInstance]:
         try:
-            return get_args(self.__orig_class__)[0]  # type: ignore[attr-defined]
-        except Exception:  # pragma: no cover - fallback
-            return InternalEntity  # type: ignore[return-value]
+            raw = decompress(raw)
+            codec = codec_for(raw)
+            if (
+                settings.cache.trusted_entries
+                and revivers(self.entity) is not None
+            ):
+                # Written by this code, so skip validation: rebuild the
+                # entry as is from the decoded payload.
+                payload = codec.unpack(raw)
+                return self.entry_model.model_construct(
+                    instance=construct(self.entity, payload["instance"]),
+                    created_at=datetime.fromisoformat(payload["created_at"]),
+                    delta=payload.get("delta", 0.0),
+                )
+            return codec.loads(raw, self.entry_model)  # type: ignore[return-value]
+        except (TypeError, ValueError, KeyError) as exc:
+            raise NotFoundError(
+                message=f"Cache entry invalid. Key: {key}"
+            ) from exc
 
     async def get(
         self, namespace: str, key: Any
     ) -> CacheEntry[_CacheEntryInstance]:
-        if self.redis_client is None:
-            raise RuntimeError("CacheRepository not initialized")
-
         built_key = self._build_key(namespace, key)
-        raw = await self.redis_client.get(built_key)
+        if built_key in self._pending:
+            raw = self._pending[built_key]
+        else:
+            raw = await self._client().get(built_key)
         if raw is None:
             raise NotFoundError(message=f"Cache entry not found. Key: {key}")
+        return self._decode(key, raw)
 
-        try:
-            payload = json.loads(raw)
-        except (TypeError, json.JSONDecodeError) as exc:  # pragma: no cover
-            raise NotFoundError(
-                message=f"Cache entry invalid. Key: {key}"
-            ) from exc
+    async def get_many(
+        self, namespace: str, keys: Sequence[Any]
+    ) -> dict[Any, CacheEntry[_CacheEntryInstance]]:
+        """Entries of ``keys`` read with one MGET; missing keys are left out."""
+        built_keys = [self._build_key(namespace, key) for key in keys]
+        values = {
+            built_key: self._pending[built_key]
+            for built_key in built_keys
+            if built_key in self._pending
+        }
+        unread = [key for key in built_keys if key not in values]
+        if unread:
+            values.update(zip(unread, await self._client().mget(unread)))
 
-        model = self._model_for_entry()
-        return CacheEntry[_CacheEntryInstance](
-            instance=model(**payload["instance"])
-        )
+        entries = {}
+        for key, built_key in zip(keys, built_keys):
+            raw = values[built_key]
+            if raw is None:
+                continue
+            try:
+                entries[key] = self._decode(key, raw)
+            except NotFoundError:
+                continue
+        return entries
 
     async def set(
         self,
@@ -98,19 +468,473 @@ class CacheRepository(Generic[_CacheEntryInstance]):
         key: Any,
         instance: _CacheEntryInstance,
         ttl: int | None = None,
+        delta: float = 0.0,
     ) -> CacheEntry[_CacheEntryInstance]:
-        if self.redis_client is None:
-            raise RuntimeError("CacheRepository not initialized")
-
-        entry = CacheEntry[_CacheEntryInstance](instance=instance)
-        await self.redis_client.set(
-            name=self._build_key(namespace, key),
-            value=entry.model_dump_json(),
-            ex=ttl,
-        )
+        entry = self.entry_model(instance=instance, delta=delta)
+        built_key = self._build_key(namespace, key)
+        value = self._encode(entry)
+        self._pipeline().set(name=built_key, value=value, ex=ttl)
+        self._pending[built_key] = value
         return entry
 
+    async def set_many(
+        self,
+        *,
+        namespace: str,
+        instances: Mapping[Any, _CacheEntryInstance],
+        ttl: int | None = None,
+    ) -> dict[Any, CacheEntry[_CacheEntryInstance]]:
+        """Queue one ``SET ... EX`` per instance, sent with the block."""
+        return {
+            key: await self.set(
+                namespace=namespace, key=key, instance=instance, ttl=ttl
+            )
+            for key, instance in instances.items()
+        }
+
     async def delete(self, namespace: str, key: Any) -> None:
-        if self.redis_client is None:
-            raise RuntimeError("CacheRepository not initialized")
-        await self.redis_client.delete(self._build_key(namespace, key))
+        await self.delete_many(namespace, [key])
+
+    async def delete_many(self, namespace: str, keys: Sequence[Any]) -> None:
+        """Queue a single DEL for all ``keys``."""
+        if not keys:
+            return
+        built_keys = [self._build_key(namespace, key) for key in keys]
+        self._pipeline().delete(*built_keys)
+        self._pending.update(dict.fromkeys(built_keys))
+
+
+class LocalCache(Generic[_Value]):
+    """In-process LRU mapping whose entries expire ``ttl`` seconds after set.
+
+    Each server process has its own copy, so a write made elsewhere only
+    reaches this tier once the entry expires: keep ``ttl`` short.
+    """
+
+    __slots__ = ("_entries", "maxsize", "ttl")
+
+    def __init__(self, *, maxsize: int, ttl: float) -> None:
+        self._entries: OrderedDict[Hashable, tuple[float, _Value]] = (
+            OrderedDict()
+        )
+        self.maxsize = maxsize
+        self.ttl = ttl
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> _Value | None:
+        item = self._entries.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: _Value) -> None:
+        if self.maxsize <= 0 or self.ttl <= 0:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+# In-process tiers by namespace; each server process subscribes once per
+# event loop and drops the keys that other processes invalidate.
+_LOCAL_TIERS: dict[str, LocalCache[Any]] = {}
+_LISTENERS: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, asyncio.Task[None]
+] = weakref.WeakKeyDictionary()
+
+
+def _register_local_tier(namespace: str, local: LocalCache[Any]) -> None:
+    _LOCAL_TIERS[namespace] = local
+
+
+async def publish(namespace: str, keys: Iterable[Any]) -> None:
+    """Tell every process to drop ``keys`` from its ``namespace`` tier."""
+    channel = settings.cache.invalidation_channel
+    if not channel:
+        return
+    message = {"namespace": namespace, "keys": [str(key) for key in keys]}
+    await get_client().publish(channel, json.dumps(message))
+
+
+def ensure_listener() -> None:
+    """Start this event loop's subscriber unless it already runs."""
+    channel = settings.cache.invalidation_channel
+    if not channel:
+        return
+    loop = asyncio.get_running_loop()
+    if loop not in _LISTENERS:
+        _LISTENERS[loop] = loop.create_task(_listen(channel))
+
+
+async def stop_listener() -> None:
+    task = _LISTENERS.pop(asyncio.get_running_loop(), None)
+    if task is not None:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
+
+async def _listen(channel: str) -> None:
+    # Holds one pool connection for as long as the loop runs.
+    while True:
+        pubsub = get_client().pubsub(ignore_subscribe_messages=True)
+        try:
+            await pubsub.subscribe(channel)
+            async for message in pubsub.listen():
+                _drop(message["data"])
+        except RedisError as exc:
+            logger.warning(f"Cache invalidation listener failed: {exc}")
+            await asyncio.sleep(1)
+        finally:
+            await pubsub.aclose()
+
+
+def _drop(data: bytes | str) -> None:
+    try:
+        message = json.loads(data)
+        local = _LOCAL_TIERS.get(message["namespace"])
+        keys = message["keys"]
+    except (TypeError, ValueError, KeyError):
+        return
+    if local is not None:
+        for key in keys:
+            local.delete(key)
+
+
+# (namespace, key) pairs whose load runs in the current context, so a
+# cached operation reading through a cached repository does not wait on
+# its own load.
+_LOADING: ContextVar[frozenset[tuple[str, str]]] = ContextVar(
+    "cache_loading", default=frozenset()
+)
+
+
+class EntityCache(Generic[_CacheEntryInstance]):
+    """Entities of one type cached by key, in-process first, then Redis.
+
+    Redis keeps an entry for ``ttl`` seconds, the process-local LRU for at
+    most ``settings.cache.local_ttl_seconds``; deletes reach the local
+    tier of every process over pub/sub. Redis failures count as misses,
+    so the database stays the source of truth. A ``ttl`` of 0 disables
+    the cache. There is one cache per namespace, see ``named``.
+    """
+
+    _registry: ClassVar[dict[str, EntityCache[Any]]] = {}
+
+    def __init__(
+        self, namespace: str, entity: type[_CacheEntryInstance], *, ttl: int
+    ) -> None:
+        if namespace in self._registry:
+            raise ValueError(f"Cache namespace {namespace!r} already exists")
+        self.namespace = namespace
+        self.entity = entity
+        self.ttl = ttl
+        self.local = LocalCache[_CacheEntryInstance](
+            maxsize=settings.cache.local_max_entries,
+            ttl=min(ttl, settings.cache.local_ttl_seconds),
+        )
+        self._flights: dict[
+            tuple[asyncio.AbstractEventLoop, str],
+            asyncio.Task[_CacheEntryInstance],
+        ] = {}
+        self._registry[namespace] = self
+        _register_local_tier(namespace, self.local)
+
+    @classmethod
+    def named(
+        cls,
+        namespace: str,
+        entity: type[_CacheEntryInstance],
+        *,
+        ttl: int | None = None,
+    ) -> EntityCache[_CacheEntryInstance]:
+        """The cache of ``namespace``, created on first use."""
+        cache = cls._registry.get(namespace)
+        if cache is None:
+            if ttl is None:
+                ttl = settings.cache.ttl_entity_seconds
+            return cls(namespace, entity, ttl=ttl)
+        if cache.entity is not entity or ttl not in (None, cache.ttl):
+            raise ValueError(
+                f"Cache namespace {namespace!r} holds {cache.entity.__name__}"
+                f" for {cache.ttl}s"
+            )
+        return cache
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def _expires_early(self, entry: CacheEntry[_CacheEntryInstance]) -> bool:
+        # XFetch: a reader reloads before expiry with a probability that
+        # grows as expiry nears and with how long the entry took to load,
+        # so processes do not all miss at the same moment.
+        beta = settings.cache.early_expiration_beta
+        if beta <= 0 or entry.delta <= 0:
+            return False
+        age = (datetime.utcnow() - entry.created_at).total_seconds()
+        jitter = -entry.delta * beta * math.log(1.0 - random.random())
+        return age + jitter >= self.ttl
+
+    async def get(self, key: Any) -> _CacheEntryInstance | None:
+        if self.local.ttl > 0:
+            ensure_listener()
+        instance = self.local.get(str(key))
+        if instance is None:
+            try:
+                async with CacheRepository[self.entity]() as cache:
+                    entry = await cache.get(self.namespace, key)
+            except NotFoundError:
+                return None
+            except RedisError as exc:
+                logger.warning(f"Cache read failed ({self.namespace}): {exc}")
+                return None
+            if self._expires_early(entry):
+                return None
+            instance = entry.instance
+            self.local.set(str(key), instance)
+        # Callers may mutate what they get; the cached copy must not change.
+        return instance.model_copy()
+
+    async def set(
+        self, key: Any, instance: _CacheEntryInstance, *, delta: float = 0.0
+    ) -> None:
+        self.local.set(str(key), instance.model_copy())
+        try:
+            async with CacheRepository[self.entity]() as cache:
+                await cache.set(
+                    namespace=self.namespace,
+                    key=key,
+                    instance=instance,
+                    ttl=self.ttl,
+                    delta=delta,
+                )
+        except RedisError as exc:
+            logger.warning(f"Cache write failed ({self.namespace}): {exc}")
+
+    async def delete(self, *keys: Any) -> None:
+        for key in keys:
+            self.local.delete(str(key))
+        try:
+            async with CacheRepository[self.entity]() as cache:
+                await cache.delete_many(self.namespace, keys)
+            await publish(self.namespace, keys)
+        except RedisError as exc:
+            logger.warning(f"Cache delete failed ({self.namespace}): {exc}")
+
+    async def invalidate(self, *keys: Any) -> None:
+        """Drop ``keys`` once the running request commits.
+
+        Until then the request reads them from the database, so no reader
+        caches rows it may still roll back. Outside a request the write
+        has already committed and the keys are dropped at once.
+        """
+        unit_of_work = _unit_of_work()
+        if unit_of_work is None:
+            await self.delete(*keys)
+            return
+        unit_of_work.written.update((self.namespace, str(key)) for key in keys)
+        unit_of_work.after_commit(functools.partial(self.delete, *keys))
+
+    async def fetch(
+        self,
+        key: Any,
+        load: Callable[[], Awaitable[_CacheEntryInstance]],
+        *,
+        check: (
+            Callable[
+                [_CacheEntryInstance], Awaitable[_CacheEntryInstance | None]
+            ]
+            | None
+        ) = None,
+    ) -> _CacheEntryInstance:
+        """The cached entity of ``key``, else what ``load()`` returns.
+
+        ``check`` may turn a hit into the entity to return, or reject it
+        with ``None``. Concurrent misses of one key in a process share a
+        single ``load``.
+        """
+        if not self.enabled:
+            return await load()
+        token = (self.namespace, str(key))
+        if token in _LOADING.get() or _written(token):
+            return await load()
+        instance = await self.get(key)
+        if instance is not None and check is not None:
+            instance = await check(instance)
+        if instance is not None:
+            return instance
+
+        loop = asyncio.get_running_loop()
+        flight = self._flights.get((loop, token[1]))
+        if flight is None:
+            flight = loop.create_task(self._load(key, load))
+            self._flights[loop, token[1]] = flight
+            flight.add_done_callback(
+                lambda task: self._land(loop, token[1], task)
+            )
+        # Shielded: a cancelled caller must not cancel the others' load.
+        return (await asyncio.shield(flight)).model_copy()
+
+    async def _load(
+        self, key: Any, load: Callable[[], Awaitable[_CacheEntryInstance]]
+    ) -> _CacheEntryInstance:
+        _LOADING.set(_LOADING.get() | {(self.namespace, str(key))})
+        started = time.monotonic()
+        instance = await load()
+        await self.set(key, instance, delta=time.monotonic() - started)
+        return instance
+
+    def _land(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        key: str,
+        task: asyncio.Task[_CacheEntryInstance],
+    ) -> None:
+        self._flights.pop((loop, key), None)
+        if not task.cancelled():
+            # Mark the error as seen when every caller went away.
+            task.exception()
+
+
+def _unit_of_work() -> Any:
+    # Imported here: the database package itself depends on the cache.
+    from .models.database import current_unit_of_work
+
+    return current_unit_of_work()
+
+
+def _written(token: tuple[str, str]) -> bool:
+    unit_of_work = _unit_of_work()
+    return unit_of_work is not None and token in unit_of_work.written
+
+
+def _key_of(function: Callable[..., Any]) -> Callable[..., Any]:
+    """Reads the first argument after ``self``/``cls`` of ``function``."""
+    parameters = list(inspect.signature(function).parameters)
+    index = 1 if parameters[0] in ("self", "cls") else 0
+    name = parameters[index]
+
+    def key(*args: Any, **kwargs: Any) -> Any:
+        return kwargs[name] if name in kwargs else args[index]
+
+    return key
+
+
+def cached(
+    namespace: str,
+    *,
+    ttl: int | None = None,
+    key: Callable[..., Any] | None = None,
+) -> Callable[[_Method], _Method]:
+    """Cache what an async function returns, keyed by its first argument.
+
+    The entity type is the function's return annotation. Functions that
+    name the namespace of a repository's ``EntityCache`` share its
+    entries and its invalidation; ``ttl`` defaults to
+    ``settings.cache.ttl_entity_seconds``. ``key`` builds the cache key
+    from the call's arguments instead.
+    """
+
+    def decorator(function: _Method) -> _Method:
+        cache = EntityCache.named(
+            namespace, get_type_hints(function)["return"], ttl=ttl
+        )
+        key_of = key or _key_of(function)
+
+        @functools.wraps(function)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return await cache.fetch(
+                key_of(*args, **kwargs), lambda: function(*args, **kwargs)
+            )
+
+        wrapper.cache = cache  # type: ignore[attr-defined]
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def read_through(
+    cache: EntityCache[_CacheEntryInstance],
+    *,
+    resolve: (
+        Callable[
+            [Any, Any, _CacheEntryInstance],
+            Awaitable[_CacheEntryInstance | None],
+        ]
+        | None
+    ) = None,
+) -> Callable[[_Method], _Method]:
+    """Serve ``method(self, key)`` from ``cache`` and cache what it loads.
+
+    ``resolve(repository, key, hit)`` may turn a hit into the entity to
+    return, or reject it with ``None``; an alias entry uses it to check
+    that its target still matches. Keys written in the running request
+    (see ``write_invalidate``) skip the cache until it commits, and so
+    does a repository that has written outside a request, so uncommitted
+    rows are never cached.
+    """
+
+    def decorator(method: _Method) -> _Method:
+        key_of = _key_of(method)
+
+        @functools.wraps(method)
+        async def wrapper(
+            self: Any, *args: Any, **kwargs: Any
+        ) -> _CacheEntryInstance:
+            key = key_of(self, *args, **kwargs)
+            if getattr(self, "_cache_bypass", False):
+                return await method(self, key)
+            check = None
+            if resolve is not None:
+
+                async def check(
+                    hit: _CacheEntryInstance,
+                ) -> _CacheEntryInstance | None:
+                    return await resolve(self, key, hit)
+
+            return await cache.fetch(
+                key, lambda: method(self, key), check=check
+            )
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def write_invalidate(
+    cache: EntityCache[Any], *, keys: Callable[..., Iterable[Any]]
+) -> Callable[[_Method], _Method]:
+    """Drop the entries a write makes stale, in every process.
+
+    ``keys`` gets the method's result followed by its arguments and
+    returns the cache keys to delete. Inside a request they are dropped
+    after its unit of work commits, and not at all when it rolls back.
+    """
+
+    def decorator(method: _Method) -> _Method:
+        @functools.wraps(method)
+        async def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            self._cache_bypass = True
+            result = await method(self, *args, **kwargs)
+            if cache.enabled:
+                await cache.invalidate(*keys(result, *args, **kwargs))
+            return result
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
@@ -1 +1 @@
-from . import cors, sessions  # noqa: F401
+from . import cors, database, sessions  # noqa: F401
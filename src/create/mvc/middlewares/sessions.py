@@ -1,27 +1,187 @@
-"""Signed-cookie session middleware mirroring the DDD stack."""
+"""Session middleware with pluggable storage, mirroring the DDD stack.
+
+``settings.authentication.session_backend`` picks where sessions live:
+``cookie`` keeps the whole session in a signed cookie, ``redis`` keeps it
+in the cache Redis behind an opaque id cookie (its TTL slides on every
+request) and ``memory`` keeps it in the process, for tests.
+"""
 
 from __future__ import annotations
 
 import hashlib
 import hmac
 import json
+import secrets
+import time
+from abc import ABC, abstractmethod
 from base64 import urlsafe_b64decode, urlsafe_b64encode
 from contextvars import ContextVar
 from dataclasses import dataclass
-from typing import Any, MutableMapping
+from typing import Any, Callable, ClassVar, MutableMapping
 
+from redis.asyncio import Redis
 from robyn import Request, Response, Robyn
 
+from ..cache import get_client
 from ..config import settings
 
 SESSION_COOKIE_NAME = "robyn_session"
-SESSION_MAX_AGE = 60 * 60 * 24 * 14  # 14 days
+
+
+class Session(dict[str, Any]):
+    """Session data that records whether it was changed.
+
+    Only top-level writes are seen: after changing a nested value in
+    place, set ``modified`` so the session is saved.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.modified = False
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        super().__setitem__(key, value)
+        self.modified = True
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self.modified = True
+
+    def clear(self) -> None:
+        if self:
+            self.modified = True
+        super().clear()
+
+    def pop(self, key: str, *default: Any) -> Any:
+        if key in self:
+            self.modified = True
+        return super().pop(key, *default)
+
+    def popitem(self) -> tuple[str, Any]:
+        item = super().popitem()
+        self.modified = True
+        return item
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key not in self:
+            self.modified = True
+        return super().setdefault(key, default)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        self.modified = True
+
+    def __ior__(self, other: Any) -> Session:
+        self.update(other)
+        return self
+
+
+class SessionBackend(ABC):
+    """Where session data lives; the cookie carries the returned token."""
+
+    # Stored sessions expire ``max_age`` after the last request, so the id
+    # cookie is sent again on every request to expire with them.
+    sliding: ClassVar[bool] = False
+
+    @abstractmethod
+    async def load(self, token: str) -> dict[str, Any] | None: ...
+
+    @abstractmethod
+    async def save(self, token: str | None, data: dict[str, Any]) -> str:
+        """Store ``data`` and return the token for the cookie."""
+
+    @abstractmethod
+    async def delete(self, token: str) -> None: ...
+
+
+class CookieSessionBackend(SessionBackend):
+    """The whole session, signed with HMAC-SHA256, in the cookie."""
+
+    def __init__(self, secret: bytes) -> None:
+        self.secret = secret
+
+    async def load(self, token: str) -> dict[str, Any] | None:
+        data, _ = _decode_session(token, self.secret)
+        return data or None
+
+    async def save(self, token: str | None, data: dict[str, Any]) -> str:
+        return _encode_session(data, self.secret)
+
+    async def delete(self, token: str) -> None:
+        return None
+
+
+class RedisSessionBackend(SessionBackend):
+    """Sessions in Redis under an opaque id, expiring after ``max_age``
+    seconds without a request."""
+
+    sliding = True
+
+    def __init__(
+        self, client: Callable[[], Redis], *, max_age: int, prefix: str
+    ) -> None:
+        self.client = client
+        self.max_age = max_age
+        self.prefix = prefix
+
+    async def load(self, token: str) -> dict[str, Any] | None:
+        # GETEX reads the session and slides its TTL in one round trip.
+        raw = await self.client().getex(
+            f"{self.prefix}{token}", ex=self.max_age
+        )
+        if raw is None:
+            return None
+        try:
+            data = json.loads(raw)
+        except ValueError:
+            return None
+        return data if isinstance(data, dict) else None
+
+    async def save(self, token: str | None, data: dict[str, Any]) -> str:
+        token = token or secrets.token_urlsafe(32)
+        await self.client().set(
+            f"{self.prefix}{token}",
+            json.dumps(data, separators=(",", ":")),
+            ex=self.max_age,
+        )
+        return token
+
+    async def delete(self, token: str) -> None:
+        await self.client().delete(f"{self.prefix}{token}")
+
+
+class MemorySessionBackend(SessionBackend):
+    """Sessions in a dict of this process, for tests."""
+
+    sliding = True
+
+    def __init__(self, *, max_age: int) -> None:
+        self.max_age = max_age
+        self.sessions: dict[str, tuple[float, dict[str, Any]]] = {}
+
+    async def load(self, token: str) -> dict[str, Any] | None:
+        expires_at, data = self.sessions.get(token, (0.0, None))
+        if data is None or expires_at <= time.monotonic():
+            self.sessions.pop(token, None)
+            return None
+        self.sessions[token] = (time.monotonic() + self.max_age, data)
+        return dict(data)
+
+    async def save(self, token: str | None, data: dict[str, Any]) -> str:
+        token = token or secrets.token_urlsafe(32)
+        self.sessions[token] = (time.monotonic() + self.max_age, dict(data))
+        return token
+
+    async def delete(self, token: str) -> None:
+        self.sessions.pop(token, None)
 
 
 @dataclass
 class SessionState:
-    data: dict[str, Any]
-    serialized: str
+    data: Session
+    token: str
+    # The request sent a cookie that matched no session.
+    stale: bool = False
 
 
 _state: ContextVar[SessionState | None] = ContextVar(
@@ -29,9 +189,9 @@ _state: ContextVar[SessionState | None] = ContextVar(
 )
 
 
-def get_session() -> dict[str, Any]:
+def get_session() -> Session:
     state = _state.get()
-    return state.data if state else {}
+    return state.data if state else Session()
 
 
 def _extract_cookie(raw_cookie_header: str | None) -> str | None:
@@ -53,11 +213,6 @@ def _encode_session(session: dict[str, Any], secret: bytes) -> str:
     return f"{urlsafe_b64encode(payload).decode()}.{signature}"
 
 
-def _pad_base64(value: str) -> bytes:
-    padding = (-len(value)) % 4
-    return (value + ("=" * padding)).encode()
-
-
 def _decode_session(value: str, secret: bytes) -> tuple[dict[str, Any], str]:
     try:
         payload_b64, signature = value.split(".", 1)
@@ -73,80 +228,99 @@ def _decode_session(value: str, secret: bytes) -> tuple[dict[str, Any], str]:
     return {}, ""
 
 
-def _cookie_header(serialized: str | None) -> str:
+def _pad_base64(value: str) -> bytes:
+    padding = (-len(value)) % 4
+    return (value + ("=" * padding)).encode()
+
+
+def _cookie_header(serialized: str | None, max_age: int) -> str:
     base = f"{SESSION_COOKIE_NAME}={serialized or ''}"
     parts = [base, "Path=/", "HttpOnly", "SameSite=Lax"]
     if serialized is None:
         parts.append("Max-Age=0")
     else:
-        parts.append(f"Max-Age={SESSION_MAX_AGE}")
+        parts.append(f"Max-Age={max_age}")
     return "; ".join(parts)
 
 
-def register(app: Robyn) -> None:
-    secret = settings.authentication.session_secret_key.encode()
+def _set_cookie(response: Response, header: str) -> None:
+    headers = response.headers
+    if isinstance(headers, MutableMapping):
+        headers["set-cookie"] = header
+    else:
+        # Robyn's Headers cannot be replaced by a dict; append keeps any
+        # cookie the handler set.
+        headers.append("set-cookie", header)
+
+
+def _request_cookie(request: Request) -> str | None:
+    raw_headers = getattr(request, "headers", {}) or {}
+    if isinstance(raw_headers, dict):
+        header_map = raw_headers
+    else:  # Robyn exposes Headers objects; convert defensively
+        try:
+            header_map = dict(raw_headers)  # type: ignore[arg-type]
+        except Exception:  # pragma: no cover - safety net
+            header_map = {}
+
+    for key, value in header_map.items():
+        if isinstance(key, bytes):
+            key = key.decode()
+        if key.lower() == "cookie":
+            return value if isinstance(value, str) else str(value)
+    return None
+
+
+def build_backend() -> SessionBackend:
+    """Backend named by ``settings.authentication.session_backend``."""
+    config = settings.authentication
+    if config.session_backend == "redis":
+        return RedisSessionBackend(
+            get_client,
+            max_age=config.session_max_age,
+            prefix=f"{config.session_redis_prefix}:",
+        )
+    if config.session_backend == "memory":
+        return MemorySessionBackend(max_age=config.session_max_age)
+    return CookieSessionBackend(config.session_secret_key.encode())
+
+
+def register(app: Robyn, backend: SessionBackend | None = None) -> None:
+    backend = backend or build_backend()
+    max_age = settings.authentication.session_max_age
 
     @app.before_request()
-    def load_session(request: Request):
-        raw_headers = getattr(request, "headers", {}) or {}
-        if isinstance(raw_headers, dict):
-            header_map = raw_headers
+    async def load_session(request: Request):
+        token = _extract_cookie(_request_cookie(request)) or ""
+        data = await backend.load(token) if token else None
+        if data is None:
+            # Unknown or expired: never store a new session under an id
+            # the client picked, mint one instead.
+            state = SessionState(data=Session(), token="", stale=bool(token))
         else:
-            try:
-                header_map = dict(raw_headers)  # type: ignore[arg-type]
-            except Exception:
-                header_map = {}
-
-        raw_cookie = None
-        for key, value in header_map.items():
-            if isinstance(key, bytes):
-                key = key.decode()
-            if key.lower() == "cookie":
-                raw_cookie = value if isinstance(value, str) else str(value)
-                break
-
-        cookie_value = _extract_cookie(raw_cookie)
-        session_data: dict[str, Any]
-        serialized: str
-        if cookie_value:
-            session_data, serialized = _decode_session(cookie_value, secret)
-        else:
-            session_data, serialized = {}, ""
-
-        state = SessionState(data=session_data, serialized=serialized)
+            state = SessionState(data=Session(data), token=token)
         _state.set(state)
+        # Robyn Request objects don't allow setting arbitrary attributes, so
+        # consumers should import `get_session()` from this module instead.
         return request
 
     @app.after_request()
-    def persist_session(response: Response):
+    async def persist_session(response: Response):
         state = _state.get()
         if state is None:
             return response
-
-        headers_source = response.headers
-        if isinstance(headers_source, MutableMapping):
-            headers = dict(headers_source.items())
-        elif headers_source is None:
-            headers = {}
-        else:
-            try:
-                headers = dict(headers_source)
-            except (TypeError, ValueError):
-                headers = {}
-
-        session_data = state.data
-        serialized = state.serialized
-
-        if not session_data:
-            if serialized:
-                headers["set-cookie"] = _cookie_header(None)
-        else:
-            new_serialized = _encode_session(session_data, secret)
-            if new_serialized != serialized:
-                headers["set-cookie"] = _cookie_header(new_serialized)
-
-        if headers:
-            response.headers = headers
-
         _state.set(None)
+
+        # An untouched session is neither encoded nor stored again.
+        session = state.data
+        if session:
+            if session.modified:
+                token = await backend.save(state.token or None, session)
+                _set_cookie(response, _cookie_header(token, max_age))
+            elif backend.sliding:
+                _set_cookie(response, _cookie_header(state.token, max_age))
+        elif state.token or state.stale:
+            if state.token:
+                await backend.delete(state.token)
+            _set_cookie(response, _cookie_header(None, max_age))
         return response
@@ -1,7 +1,8 @@
 import functools
+import itertools
 from contextlib import asynccontextmanager
 from contextvars import ContextVar
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Awaitable, Callable, Hashable
 
 from loguru import logger
 from sqlalchemy.exc import IntegrityError, InvalidRequestError
@@ -11,6 +12,7 @@ from sqlalchemy.ext.asyncio import (
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 
 from ..config import settings
 from ..utils import BaseError
@@ -21,12 +23,46 @@ class DatabaseError(BaseError):
         super().__init__(message)
 
 
-def build_engine() -> AsyncEngine:
+def _pool_options() -> dict[str, Any]:
+    pool = settings.database.pool
+    options: dict[str, Any] = {
+        "pool_pre_ping": pool.pre_ping,
+        "pool_recycle": pool.recycle,
+    }
+    if pool.kind == "null":
+        options["poolclass"] = NullPool
+        return options
+
+    options.update(
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=pool.size,
+        max_overflow=pool.max_overflow,
+        pool_timeout=pool.timeout,
+    )
+    return options
+
+
+def _connect_args(url: str) -> dict[str, Any]:
+    """Size asyncpg's prepared statement caches from the settings."""
+    if not url.startswith("postgresql+asyncpg"):
+        return {}
+    size = settings.database.statement_cache_size
+    # SQLAlchemy keeps its own per-connection LRU of prepared statements
+    # next to asyncpg's; both must be 0 behind PgBouncer.
+    return {
+        "prepared_statement_cache_size": size,
+        "statement_cache_size": size,
+    }
+
+
+def build_engine(url: str | None = None) -> AsyncEngine:
+    url = url or settings.database.url
     return create_async_engine(
-        settings.database.url,
+        url,
         future=True,
-        pool_pre_ping=True,
         echo=settings.debug,
+        connect_args=_connect_args(url),
+        **_pool_options(),
     )
 
 
@@ -35,46 +71,205 @@ def create_engine() -> AsyncEngine:
     return build_engine()
 
 
-def create_session() -> AsyncSession:
+@functools.lru_cache(maxsize=1)
+def create_replica_engines() -> tuple[AsyncEngine, ...]:
+    return tuple(build_engine(url) for url in settings.database.replicas)
+
+
+_REPLICA_ROTATION = itertools.count()
+
+
+def create_read_engine() -> AsyncEngine:
+    """Next replica engine in round-robin order, or the primary if none."""
+    replicas = create_replica_engines()
+    if not replicas:
+        return create_engine()
+    return replicas[next(_REPLICA_ROTATION) % len(replicas)]
+
+
+def create_session(engine: AsyncEngine | None = None) -> AsyncSession:
     Session = async_sessionmaker(
-        create_engine(),
+        engine or create_engine(),
         expire_on_commit=False,
         class_=AsyncSession,
     )
     return Session()
 
 
+class UnitOfWork:
+    """Request-scoped session shared by every repository in one request.
+
+    The session is created on first use, so requests that never touch the
+    database never check out a connection.
+    """
+
+    __slots__ = ("_session", "_replica", "failed", "written", "_after_commit")
+
+    def __init__(self) -> None:
+        self._session: AsyncSession | None = None
+        self._replica: AsyncSession | None = None
+        self.failed = False
+        # Keys of what the request wrote, e.g. cache entries to skip.
+        self.written: set[Hashable] = set()
+        self._after_commit: list[Callable[[], Awaitable[None]]] = []
+
+    @property
+    def session(self) -> AsyncSession:
+        if self._session is None:
+            self._session = create_session()
+        return self._session
+
+    @property
+    def read_session(self) -> AsyncSession:
+        """Session for read-only blocks.
+
+        Reads use a replica until the request opens the primary session;
+        after that they stick to the primary and see the request's writes.
+        """
+        if self._session is not None or not settings.database.replicas:
+            return self.session
+        if self._replica is None:
+            self._replica = create_session(create_read_engine())
+        return self._replica
+
+    def after_commit(self, callback: Callable[[], Awaitable[None]]) -> None:
+        """Run ``callback`` once the request's transaction has committed.
+
+        Callbacks of a request that rolls back are dropped.
+        """
+        self._after_commit.append(callback)
+
+    async def close(self, *, commit: bool) -> None:
+        session, self._session = self._session, None
+        replica, self._replica = self._replica, None
+        callbacks, self._after_commit = self._after_commit, []
+        commit = commit and not self.failed
+        try:
+            if session is not None:
+                try:
+                    if commit:
+                        await session.commit()
+                    else:
+                        await session.rollback()
+                finally:
+                    await session.close()
+        finally:
+            if replica is not None:
+                await replica.close()
+        if commit:
+            for callback in callbacks:
+                await callback()
+
+
+CTX_SESSION: ContextVar[AsyncSession | None] = ContextVar(
+    "session", default=None
+)
+CTX_UNIT_OF_WORK: ContextVar[UnitOfWork | None] = ContextVar(
+    "unit_of_work", default=None
+)
+
+
+def current_session() -> AsyncSession:
+    session = CTX_SESSION.get()
+    if session is not None:
+        return session
+    unit_of_work = CTX_UNIT_OF_WORK.get()
+    if unit_of_work is None:
+        raise DatabaseError(
+            message="Session requested outside transaction context"
+        )
+    return unit_of_work.session
+
+
+def begin_unit_of_work() -> UnitOfWork:
+    """Open a request scope; its session is created on first use."""
+    unit_of_work = UnitOfWork()
+    CTX_UNIT_OF_WORK.set(unit_of_work)
+    return unit_of_work
+
+
+async def end_unit_of_work(*, commit: bool) -> None:
+    """Commit (or roll back) and release the current request scope."""
+    unit_of_work = CTX_UNIT_OF_WORK.get()
+    if unit_of_work is None:
+        return
+    CTX_UNIT_OF_WORK.set(None)
+    await unit_of_work.close(commit=commit)
+
+
+def current_unit_of_work() -> UnitOfWork | None:
+    """The unit of work of the running request, if any."""
+    return CTX_UNIT_OF_WORK.get()
+
+
 @asynccontextmanager
-async def transaction() -> AsyncGenerator[AsyncSession, None]:
-    session = create_session()
+async def transaction(
+    *, readonly: bool = False
+) -> AsyncGenerator[AsyncSession, None]:
+    """Run a block against one session.
+
+    Inside a request scope the request session is reused and changes are
+    only flushed; the unit of work commits once when the request ends and
+    rolls back everything if any block failed. Nested blocks join the
+    enclosing transaction.
+
+    ``readonly`` blocks are routed to a read replica (round-robin) and
+    never commit. Once a request has opened the primary session its reads
+    stay on the primary, so they see the request's own writes.
+    """
+    active = CTX_SESSION.get()
+    if active is not None:
+        yield active
+        return
+
+    unit_of_work = CTX_UNIT_OF_WORK.get()
+    if unit_of_work:
+        session = (
+            unit_of_work.read_session if readonly else unit_of_work.session
+        )
+    else:
+        session = create_session(create_read_engine() if readonly else None)
+    token = CTX_SESSION.set(session)
     try:
         yield session
-        await session.commit()
+        if unit_of_work:
+            await session.flush()
+        elif not readonly:
+            await session.commit()
     except DatabaseError as exc:
         logger.error(f"Rolling back changes: {exc}")
-        await session.rollback()
+        await _rollback(session, unit_of_work)
         raise
     except (IntegrityError, InvalidRequestError) as exc:
         logger.error(f"Rolling back changes: {exc}")
-        await session.rollback()
+        await _rollback(session, unit_of_work)
         raise DatabaseError(message=str(exc)) from exc
+    except BaseException:
+        if unit_of_work:
+            unit_of_work.failed = True
+        raise
     finally:
-        await session.close()
+        CTX_SESSION.reset(token)
+        if not unit_of_work:
+            await session.close()
 
 
-CTX_SESSION: ContextVar[AsyncSession] = ContextVar(
-    "session", default=create_session()
-)
+async def _rollback(
+    session: AsyncSession, unit_of_work: UnitOfWork | None
+) -> None:
+    if unit_of_work:
+        unit_of_work.failed = True
+    await session.rollback()
 
 
 class Session:
     _ERRORS = (IntegrityError, InvalidRequestError)
 
     def __init__(self) -> None:
-        self._session: AsyncSession = CTX_SESSION.get()
+        self._session: AsyncSession = current_session()
 
-    async def execute(self, query):
+    async def execute(self, query, params=None):
         try:
-            return await self._session.execute(query)
+            return await self._session.execute(query, params)
         except self._ERRORS as exc:
             raise DatabaseError(message=str(exc)) from exc
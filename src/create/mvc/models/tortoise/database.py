@@ -1,12 +1,17 @@
 import asyncio
 import functools
+import itertools
 from contextlib import asynccontextmanager
 from contextvars import ContextVar
-from typing import Any, AsyncGenerator, Sequence
+from typing import Any, AsyncGenerator, Awaitable, Callable, Hashable, Sequence
+from urllib.parse import urlencode
 
 from loguru import logger
 from tortoise import Tortoise, connections
-from tortoise.backends.base.client import BaseDBAsyncClient
+from tortoise.backends.base.client import (
+    BaseDBAsyncClient,
+    TransactionContext,
+)
 from tortoise.exceptions import IntegrityError, OperationalError
 from tortoise.transactions import in_transaction
 
@@ -41,10 +46,38 @@ def _normalize_database_url(url: str) -> str:
     return url
 
 
+def _pool_query(url: str) -> str:
+    """Append per-process pool and statement cache limits as URL params."""
+    if url.startswith("sqlite"):
+        return url
+
+    pool = settings.database.pool
+    params = {"minsize": pool.min_size, "maxsize": pool.max_size}
+    if url.startswith("postgres"):
+        params["max_inactive_connection_lifetime"] = pool.max_inactive_lifetime
+        params["statement_cache_size"] = settings.database.statement_cache_size
+    elif url.startswith("mysql"):
+        params["pool_recycle"] = int(pool.max_inactive_lifetime)
+    separator = "&" if "?" in url else "?"
+    return f"{url}{separator}{urlencode(params)}"
+
+
+def _connection_url(url: str) -> str:
+    return _pool_query(_normalize_database_url(url))
+
+
+def _replica_names() -> tuple[str, ...]:
+    return tuple(
+        f"replica_{index}" for index in range(len(settings.database.replicas))
+    )
+
+
 def _build_config() -> dict[str, Any]:
+    replicas = zip(_replica_names(), settings.database.replicas)
     return {
         "connections": {
-            "default": _normalize_database_url(settings.database.url)
+            "default": _connection_url(settings.database.url),
+            **{name: _connection_url(url) for name, url in replicas},
         },
         "apps": {
             APP_LABEL: {
@@ -63,6 +96,16 @@ def build_engine() -> dict[str, Any]:
 
 
 TORTOISE_ORM = build_engine()
+REPLICA_CONNECTIONS = _replica_names()
+_REPLICA_ROTATION = itertools.count()
+
+
+def read_connection_name() -> str:
+    """Next replica connection in round-robin order, or the primary."""
+    if not REPLICA_CONNECTIONS:
+        return "default"
+    index = next(_REPLICA_ROTATION) % len(REPLICA_CONNECTIONS)
+    return REPLICA_CONNECTIONS[index]
 
 
 async def create_engine() -> dict[str, Any]:
@@ -85,23 +128,171 @@ async def close_engine() -> None:
     _INITIALIZED = False
 
 
+class UnitOfWork:
+    """Request-scoped transaction shared by every repository in one request.
+
+    The transaction is opened on first use, so requests that never touch
+    the database never check out a connection.
+    """
+
+    __slots__ = (
+        "_context",
+        "_connection",
+        "_replica",
+        "failed",
+        "written",
+        "_after_commit",
+    )
+
+    def __init__(self) -> None:
+        self._context: TransactionContext | None = None
+        self._connection: BaseDBAsyncClient | None = None
+        self._replica: BaseDBAsyncClient | None = None
+        self.failed = False
+        # Keys of what the request wrote, e.g. cache entries to skip.
+        self.written: set[Hashable] = set()
+        self._after_commit: list[Callable[[], Awaitable[None]]] = []
+
+    async def connection(self) -> BaseDBAsyncClient:
+        if self._connection is None:
+            await create_engine()
+            context = in_transaction(connection_name="default")
+            self._connection = await context.__aenter__()
+            self._context = context
+        return self._connection
+
+    async def read_connection(self) -> BaseDBAsyncClient:
+        """Connection for read-only blocks.
+
+        Reads use a replica until the request opens its primary
+        transaction; after that they stick to the primary and see the
+        request's writes.
+        """
+        if self._connection is not None or not REPLICA_CONNECTIONS:
+            return await self.connection()
+        if self._replica is None:
+            await create_engine()
+            self._replica = connections.get(read_connection_name())
+        return self._replica
+
+    def after_commit(self, callback: Callable[[], Awaitable[None]]) -> None:
+        """Run ``callback`` once the request's transaction has committed.
+
+        Callbacks of a request that rolls back are dropped.
+        """
+        self._after_commit.append(callback)
+
+    async def close(self, *, commit: bool) -> None:
+        context, connection = self._context, self._connection
+        self._context = self._connection = self._replica = None
+        callbacks, self._after_commit = self._after_commit, []
+        commit = commit and not self.failed
+        if context is not None and connection is not None:
+            try:
+                if not commit:
+                    await connection.rollback()
+            finally:
+                await context.__aexit__(None, None, None)
+        if commit:
+            for callback in callbacks:
+                await callback()
+
+
+CTX_CONNECTION: ContextVar[BaseDBAsyncClient | None] = ContextVar(
+    "tortoise_connection", default=None
+)
+CTX_UNIT_OF_WORK: ContextVar[UnitOfWork | None] = ContextVar(
+    "unit_of_work", default=None
+)
+
+
+def begin_unit_of_work() -> UnitOfWork:
+    """Open a request scope; its transaction starts on first use."""
+    unit_of_work = UnitOfWork()
+    CTX_UNIT_OF_WORK.set(unit_of_work)
+    return unit_of_work
+
+
+async def end_unit_of_work(*, commit: bool) -> None:
+    """Commit (or roll back) and release the current request scope."""
+    unit_of_work = CTX_UNIT_OF_WORK.get()
+    if unit_of_work is None:
+        return
+    CTX_UNIT_OF_WORK.set(None)
+    await unit_of_work.close(commit=commit)
+
+
+def current_unit_of_work() -> UnitOfWork | None:
+    """The unit of work of the running request, if any."""
+    return CTX_UNIT_OF_WORK.get()
+
+
 @asynccontextmanager
-async def transaction() -> AsyncGenerator[BaseDBAsyncClient, None]:
+async def transaction(
+    *, readonly: bool = False
+) -> AsyncGenerator[BaseDBAsyncClient, None]:
+    """Run a block inside one database transaction.
+
+    Inside a request scope the request transaction is reused; the unit of
+    work commits once when the request ends and rolls back everything if
+    any block failed. Nested blocks join the enclosing transaction.
+
+    ``readonly`` blocks run on a read replica (round-robin) outside any
+    transaction. Once a request has opened its primary transaction its
+    reads stay on the primary, so they see the request's own writes.
+    """
+    active = CTX_CONNECTION.get()
+    if active is not None:
+        yield active
+        return
+
+    unit_of_work = CTX_UNIT_OF_WORK.get()
+    if unit_of_work is not None:
+        if readonly:
+            connection = await unit_of_work.read_connection()
+        else:
+            connection = await unit_of_work.connection()
+        async with _scope(connection, unit_of_work):
+            yield connection
+        return
+
     await create_engine()
+    if readonly:
+        connection = connections.get(read_connection_name())
+        async with _scope(connection, None):
+            yield connection
+        return
+
     async with in_transaction(connection_name="default") as connection:
-        try:
+        async with _scope(connection, None):
             yield connection
-        except DatabaseError as exc:
-            logger.error(f"Rolling back changes: {exc}")
-            raise
-        except (IntegrityError, OperationalError) as exc:
-            logger.error(f"Rolling back changes: {exc}")
-            raise DatabaseError(message=str(exc)) from exc
 
 
-CTX_CONNECTION: ContextVar[BaseDBAsyncClient | None] = ContextVar(
-    "tortoise_connection", default=None
-)
+@asynccontextmanager
+async def _scope(
+    connection: BaseDBAsyncClient, unit_of_work: UnitOfWork | None
+) -> AsyncGenerator[None, None]:
+    token = CTX_CONNECTION.set(connection)
+    try:
+        yield
+    except DatabaseError as exc:
+        logger.error(f"Rolling back changes: {exc}")
+        _mark_failed(unit_of_work)
+        raise
+    except (IntegrityError, OperationalError) as exc:
+        logger.error(f"Rolling back changes: {exc}")
+        _mark_failed(unit_of_work)
+        raise DatabaseError(message=str(exc)) from exc
+    except BaseException:
+        _mark_failed(unit_of_work)
+        raise
+    finally:
+        CTX_CONNECTION.reset(token)
+
+
+def _mark_failed(unit_of_work: UnitOfWork | None) -> None:
+    if unit_of_work is not None:
+        unit_of_work.failed = True
 
 
 class Session:
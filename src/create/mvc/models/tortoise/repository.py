@@ -1,13 +1,34 @@
-from typing import Any, AsyncGenerator, Generic, get_args, get_origin
+from typing import (
+    Any,
+    AsyncGenerator,
+    Generic,
+    Sequence,
+    TypeVar,
+    get_args,
+    get_origin,
+)
 
+from pydantic import BaseModel
 from tortoise.expressions import Q
 from tortoise.queryset import QuerySet
 
-from ..schemas import UserFlat, UserUncommitted
+from ..cache import EntityCache, read_through, write_invalidate
+from ..config import settings
+from ..schemas import (
+    PrimaryKey,
+    UserCredentials,
+    UserFlat,
+    UserUncommitted,
+)
 from ..utils import DatabaseError, NotFoundError, UnprocessableError
 from .database import Session
 from .tables import ConcreteTable, UsersTable
 
+# Bulk statements stay under the bind parameter limit of every supported
+# driver (SQLite 32766, asyncpg 32767, MySQL 65535).
+MAX_BIND_PARAMETERS = 32_000
+_Entity = TypeVar("_Entity", bound=BaseModel)
+
 
 class BaseRepository(Session, Generic[ConcreteTable]):
     schema_class: type[ConcreteTable] | None = None
@@ -44,11 +65,12 @@ class BaseRepository(Session, Generic[ConcreteTable]):
     async def _update(
         self, key: str, value: Any, payload: dict[str, Any]
     ) -> ConcreteTable:
-        filters = {key: value}
-        updated = await self._filter(**filters).update(**payload)
+        updated = await self._filter(**{key: value}).update(**payload)
         if not updated:
             raise DatabaseError
-        schema = await self._filter(**filters).first()
+        # Tortoise has no public UPDATE ... RETURNING, so the row is read
+        # back once, by its new key if the update changed it.
+        schema = await self._filter(**{key: payload.get(key, value)}).first()
         if not schema:
             raise DatabaseError
         return schema
@@ -59,6 +81,29 @@ class BaseRepository(Session, Generic[ConcreteTable]):
             raise NotFoundError
         return schema
 
+    async def select_only(
+        self, fields: Sequence[str], **filters: Any
+    ) -> list[dict[str, Any]]:
+        """Return only ``fields`` of the rows matching ``filters``.
+
+        ``values()`` hands back plain dicts, so no model instances are
+        built for the rows.
+        """
+        return await self._filter(**filters).values(*fields)
+
+    async def load_only(
+        self, entity: type[_Entity], key: str, value: Any
+    ) -> _Entity:
+        """Load one row straight into ``entity``, selecting its fields only."""
+        row = (
+            await self._filter(**{key: value})
+            .first()
+            .values(*entity.model_fields)
+        )
+        if row is None:
+            raise NotFoundError
+        return entity.model_validate(row)
+
     async def count(self) -> int:
         value = await self._query().count()
         if not isinstance(value, int):
@@ -80,41 +125,187 @@ class BaseRepository(Session, Generic[ConcreteTable]):
     async def _save(self, payload: dict[str, Any]) -> ConcreteTable:
         schema = self.schema_class(**payload)
         await schema.save(using_db=self._connection)
-        await schema.refresh_from_db(using_db=self._connection)
+        # With RETURNING the insert already loaded the generated columns.
+        if not self._connection.capabilities.support_returning:
+            await schema.refresh_from_db(using_db=self._connection)
         return schema
 
     async def _all(self) -> AsyncGenerator[ConcreteTable, None]:
-        async for schema in self._query():
+        async for schema in self.stream_scalars():
             yield schema
 
+    async def paginate(
+        self, *, after: Any = None, limit: int = 50, order_by: str = "id"
+    ) -> list[ConcreteTable]:
+        """Return up to ``limit`` rows that sort after the ``after`` key.
+
+        Keyset pagination: the cursor is the last row's ``order_by`` value,
+        so every page is an index range scan however deep it is. The field
+        must be unique; prefix it with ``-`` for descending order.
+        """
+        query = self._query()
+        if after is not None:
+            lookup = "lt" if order_by.startswith("-") else "gt"
+            query = query.filter(
+                **{f"{order_by.lstrip('-')}__{lookup}": after}
+            )
+        return await query.order_by(order_by).limit(limit)
+
+    async def stream_scalars(
+        self, *, batch_size: int = 500
+    ) -> AsyncGenerator[ConcreteTable, None]:
+        """Yield every row, loading ``batch_size`` rows per query.
+
+        Tortoise has no server-side cursors, so this walks the primary key
+        page by page; memory stays bounded by one batch.
+        """
+        after = None
+        while True:
+            batch = await self.paginate(after=after, limit=batch_size)
+            for schema in batch:
+                yield schema
+            if len(batch) < batch_size:
+                return
+            after = batch[-1].pk
+
     async def delete(self, id_: int) -> None:
         await self._filter(id=id_).delete()
 
+    def _batch_size(self, parameters_per_row: int) -> int:
+        return max(1, MAX_BIND_PARAMETERS // parameters_per_row)
+
+    async def bulk_create(
+        self, payloads: Sequence[dict[str, Any]]
+    ) -> list[ConcreteTable]:
+        """Insert many rows with one multi-row statement per batch.
+
+        Tortoise does not read generated integer primary keys back, so
+        ``id`` stays unset on the returned objects in that case.
+        """
+        schemas = [self.schema_class(**payload) for payload in payloads]
+        if schemas:
+            columns = len(self.schema_class._meta.fields_db_projection)
+            await self.schema_class.bulk_create(
+                schemas,
+                batch_size=self._batch_size(columns),
+                using_db=self._connection,
+            )
+        return schemas
+
+    async def bulk_upsert(
+        self,
+        payloads: Sequence[dict[str, Any]],
+        *,
+        conflict: Sequence[str] = ("id",),
+        update_fields: Sequence[str] | None = None,
+    ) -> None:
+        """Insert rows, updating the existing ones that clash on ``conflict``.
+
+        Tortoise compiles this to ``ON CONFLICT DO UPDATE`` or ``ON
+        DUPLICATE KEY UPDATE`` for the connected dialect. ``update_fields``
+        defaults to every given field outside ``conflict``.
+        """
+        if not payloads:
+            return
+        if update_fields is None:
+            update_fields = [key for key in payloads[0] if key not in conflict]
+        columns = len(self.schema_class._meta.fields_db_projection)
+        await self.schema_class.bulk_create(
+            [self.schema_class(**payload) for payload in payloads],
+            batch_size=self._batch_size(columns),
+            on_conflict=list(conflict),
+            update_fields=list(update_fields) or None,
+            ignore_conflicts=not update_fields,
+            using_db=self._connection,
+        )
+
+    async def bulk_update(self, payloads: Sequence[dict[str, Any]]) -> None:
+        """Update many rows by primary key; every payload carries ``id``.
+
+        All payloads must set the same fields: each batch is a single
+        ``UPDATE ... SET field = CASE id WHEN ... END`` statement.
+        """
+        if not payloads:
+            return
+        keys = set(payloads[0])
+        if any(set(payload) != keys for payload in payloads):
+            raise UnprocessableError(
+                message="Bulk update payloads must set the same fields"
+            )
+        fields = [key for key in payloads[0] if key != "id"]
+        await self.schema_class.bulk_update(
+            [self.schema_class(**payload) for payload in payloads],
+            fields=fields,
+            batch_size=self._batch_size(2 * len(fields) + 1),
+            using_db=self._connection,
+        )
+
+    async def delete_many(self, ids: Sequence[Any]) -> int:
+        deleted = 0
+        for start in range(0, len(ids), MAX_BIND_PARAMETERS):
+            chunk = ids[start : start + MAX_BIND_PARAMETERS]
+            deleted += await self._filter(id__in=chunk).delete()
+        return deleted
+
+
+USERS_CACHE = EntityCache(
+    "users", UserFlat, ttl=settings.cache.ttl_entity_seconds
+)
+# Login aliases: a hit is only served after the user it points at, read
+# through USERS_CACHE, still has that username or email.
+USER_LOGINS_CACHE = EntityCache(
+    "users-login", UserFlat, ttl=settings.cache.ttl_entity_seconds
+)
+
+
+async def _current_login(
+    repository: "UsersRepository", login: str, alias: UserFlat
+) -> UserFlat | None:
+    try:
+        user = await repository.get(alias.id)
+    except NotFoundError:
+        return None
+    return user if login in (user.username, user.email) else None
+
 
 class UsersRepository(BaseRepository[UsersTable]):
     async def all(self) -> AsyncGenerator[UserFlat, None]:
         async for instance in self._all():
             yield UserFlat.model_validate(instance)
 
+    @read_through(USERS_CACHE)
     async def get(self, id_: int) -> UserFlat:
         instance = await self._get(key="id", value=id_)
         return UserFlat.model_validate(instance)
 
-    async def get_by_login(self, login: str) -> UserFlat:
+    async def _load_by_login(
+        self, entity: type[_Entity], login: str
+    ) -> _Entity:
         for field in ("username", "email"):
             try:
-                instance = await self._get(key=field, value=login)
-                return UserFlat.model_validate(instance)
+                return await self.load_only(entity, key=field, value=login)
             except NotFoundError:
                 continue
         raise NotFoundError
 
+    @read_through(USER_LOGINS_CACHE, resolve=_current_login)
+    async def get_by_login(self, login: str) -> UserFlat:
+        return await self._load_by_login(UserFlat, login)
+
+    async def get_credentials(self, login: str) -> UserCredentials:
+        return await self._load_by_login(UserCredentials, login)
+
     async def create(self, schema: UserUncommitted) -> UserFlat:
         instance = await self._save(schema.model_dump())
         return UserFlat.model_validate(instance)
 
+    @write_invalidate(USERS_CACHE, keys=lambda user, *_, **__: [user.id])
     async def update(
         self, attr: str, value: Any, payload: dict[str, Any]
     ) -> UserFlat:
         schema = await self._update(attr, value, payload)
         return UserFlat.model_validate(schema)
+
+    @write_invalidate(USERS_CACHE, keys=lambda _, id_: [id_])
+    async def delete(self, id_: PrimaryKey) -> None:
+        await super().delete(id_)
@@ -3,7 +3,7 @@ import sys
 from pathlib import Path
 
 from app.config import settings
-from app.middlewares import cors, sessions
+from app.middlewares import cors, database, sessions
 from app.urls import register_routes
 from app.utils import error_response
 from app.views.authentication import JWTAuthenticationHandler
@@ -59,6 +59,7 @@ app.exception(error_response)
 app.configure_authentication(JWTAuthenticationHandler())
 
 # Middlewares
+database.register(app)
 sessions.register(app)
 cors.register(app)
 
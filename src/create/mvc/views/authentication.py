@@ -94,10 +94,10 @@ def register(app: Robyn) -> None:
         "/auth/login", openapi_name="Login", openapi_tags=["Authentication"]
     )
     async def login(body: LoginRequestBody) -> Response[TokenResponse]:
-        async with transaction():
+        async with transaction(readonly=True):
             repo = UsersRepository()
             try:
-                user = await repo.get_by_login(login=body.login)
+                user = await repo.get_credentials(login=body.login)
             except NotFoundError:
                 raise AuthenticationError(message="Invalid credentials")
 
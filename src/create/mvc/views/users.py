@@ -209,7 +209,7 @@ def register(app: Robyn) -> None:
         body: PasswordResetRequestBody,
     ) -> RobynResponse:
         try:
-            async with transaction():
+            async with transaction(readonly=True):
                 repo = UsersRepository()
                 user = await repo.get_by_login(login=body.email)
         except NotFoundError:
@@ -266,7 +266,7 @@ def register(app: Robyn) -> None:
     ) -> RobynResponse:
         user_id = require_user_id(request)
 
-        async with transaction():
+        async with transaction(readonly=True):
             repo = UsersRepository()
             user = await repo.get(id_=user_id)
 
@@ -9,6 +9,7 @@ from ._config import (
     INTERACTIVE_NOSQL_CHOICES,
     INTERACTIVE_WORKER_CHOICES,
     LOCK_FILE_BY_MANAGER,
+    LOCK_MODE_CHOICES,
     NOSQL_CHOICES,
     ORM_CHOICES,
     PACKAGE_MANAGER_CHOICES,
@@ -16,6 +17,7 @@ from ._config import (
     TEMPLATE_CONFIGS,
     UID_CHOICES,
     WORKER_CHOICES,
+    InteractiveCreateConfig,
 )
 from ._filesystem import (
     collect_existing_items,
@@ -23,11 +25,21 @@ from ._filesystem import (
     get_generated_items,
     prepare_destination,
 )
-from ._interactive import InteractiveCreateConfig, run_create_interactive
+from ._manifest import (
+    ManifestProject,
+    ManifestResult,
+    create_from_manifest,
+    load_manifest,
+)
 from ._package_manager import (
     apply_package_manager,
+    defer_package_manager,
     ensure_package_manager_available,
+    is_lock_pending,
+    run_pending_lock,
+    start_background_lock,
 )
+from ._template_cache import configure_template_cache
 
 __all__ = [
     "DESIGN_CHOICES",
@@ -36,6 +48,7 @@ __all__ = [
     "INTERACTIVE_NOSQL_CHOICES",
     "INTERACTIVE_WORKER_CHOICES",
     "LOCK_FILE_BY_MANAGER",
+    "LOCK_MODE_CHOICES",
     "NOSQL_CHOICES",
     "ORM_CHOICES",
     "PACKAGE_MANAGER_CHOICES",
@@ -45,10 +58,31 @@ __all__ = [
     "WORKER_CHOICES",
     "apply_package_manager",
     "collect_existing_items",
+    "configure_template_cache",
     "copy_template",
+    "create_from_manifest",
+    "defer_package_manager",
     "ensure_package_manager_available",
     "get_generated_items",
+    "is_lock_pending",
+    "load_manifest",
     "prepare_destination",
+    "run_pending_lock",
+    "start_background_lock",
     "InteractiveCreateConfig",
+    "ManifestProject",
+    "ManifestResult",
     "run_create_interactive",
 ]
+
+
+def run_create_interactive(
+    defaults: InteractiveCreateConfig,
+) -> InteractiveCreateConfig | None:
+    """Run interactive create UI and return selected configuration.
+
+    Textual is only imported here, so other commands start without it.
+    """
+    from ._interactive import run_create_interactive as _run_interactive
+
+    return _run_interactive(defaults)
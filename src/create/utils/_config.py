@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
+from dataclasses import dataclass
 from typing import Mapping, Sequence
 
 ORM_CHOICES: Sequence[str] = ("sqlalchemy", "tortoise")
 DESIGN_CHOICES: Sequence[str] = ("ddd", "mvc")
 PACKAGE_MANAGER_CHOICES: Sequence[str] = ("uv", "poetry")
+LOCK_MODE_CHOICES: Sequence[str] = ("sync", "background", "defer")
 BROKER_CHOICES: Sequence[str] = (
     "none",
     "redis",
@@ -79,6 +81,23 @@ _CELERY_BACKENDS: Mapping[str, tuple[str, str | None, int | None]] = {
 }
 
 
+@dataclass(frozen=True, slots=True)
+class InteractiveCreateConfig:
+    """Collected values from interactive create mode."""
+
+    name: str
+    destination: str
+    orm: str
+    design: str
+    package_manager: str
+    uid: str
+    broker: str
+    nosql: tuple[str, ...]
+    worker: str
+    worker_exp_mode: bool
+    scheduler: bool = False
+
+
 def _worker_config(
     worker: str,
     worker_exp_mode: bool,
@@ -4,17 +4,19 @@ from __future__ import annotations
 
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, Mapping
 
 import click
-from jinja2 import Environment, StrictUndefined
 
 from ._config import (
     LOCK_FILE_BY_MANAGER,
     ORM_CHOICES,
     _get_template_config,
 )
+from ._template_cache import _render_template_path
 
 PACKAGE_ROOT = Path(__file__).resolve().parent.parent
 SRC_DIR = PACKAGE_ROOT.resolve()
@@ -24,7 +26,7 @@ BROKERS_DIR = (SRC_DIR / "brokers").resolve()
 NOSQL_DIR = (SRC_DIR / "nosql").resolve()
 WORKERS_DIR = (SRC_DIR / "workers").resolve()
 
-JINJA_ENV = Environment(undefined=StrictUndefined, keep_trailing_newline=True)
+DEFAULT_WRITE_JOBS = min(32, (os.cpu_count() or 1) + 4)
 
 
 def _collect_existing_items(destination: Path) -> set[Path]:
@@ -121,36 +123,121 @@ def prepare_destination(
     return destination
 
 
-def _render_template(
-    source: Path, target: Path, context: Mapping[str, object]
+@dataclass(frozen=True, slots=True)
+class _PlannedFile:
+    """A generated file: a template to render or a file to copy verbatim."""
+
+    source: Path
+    is_template: bool = False
+
+
+_FilePlan = dict[Path, _PlannedFile]
+
+_PLAN_IGNORED_NAMES = frozenset({"__pycache__", ".DS_Store"})
+
+
+def _plan_tree(
+    plan: _FilePlan,
+    source_root: Path,
+    target_rel: Path,
+    skip_map: Mapping[Path, set[str]] | None = None,
 ) -> None:
-    """Render a Jinja2 template from source to target."""
-    template = JINJA_ENV.from_string(source.read_text())
-    rendered = template.render(**context)
-    target.parent.mkdir(parents=True, exist_ok=True)
-    target.write_text(rendered)
+    """Add every file under source_root to the plan, rooted at target_rel.
+
+    Later overlays replace earlier entries with the same output path, so
+    broker, NoSQL and worker overlays can override base template files.
+    """
+    skip_map = skip_map or {}
+    for current, dirs, files in os.walk(source_root):
+        current_path = Path(current)
+        skip_names = _PLAN_IGNORED_NAMES | skip_map.get(
+            current_path.resolve(), set()
+        )
+        dirs[:] = sorted(name for name in dirs if name not in skip_names)
+        rel_base = target_rel / current_path.relative_to(source_root)
+        for name in sorted(files):
+            if name in skip_names:
+                continue
+            source = current_path / name
+            if name.endswith(".jinja2"):
+                plan[rel_base / name.removesuffix(".jinja2")] = _PlannedFile(
+                    source, is_template=True
+                )
+            else:
+                plan[rel_base / name] = _PlannedFile(source)
 
 
-def _render_jinja2_in_tree(
-    target_dir: Path, context: Mapping[str, object]
+def _plan_directories(destination: Path, plan: _FilePlan) -> set[Path]:
+    """Return the leaf directories needed to hold every planned file."""
+    directories = {(destination / rel_path).parent for rel_path in plan}
+    ancestors = {
+        parent for directory in directories for parent in directory.parents
+    }
+    return directories - ancestors
+
+
+def _write_planned_file(
+    destination: Path,
+    rel_path: Path,
+    planned: _PlannedFile,
+    context: Mapping[str, object],
 ) -> None:
-    """Render and delete all *.jinja2 files found under target_dir."""
-    for jinja_file in list(target_dir.rglob("*.jinja2")):
-        output_file = jinja_file.with_suffix("")
-        _render_template(jinja_file, output_file, context)
-        jinja_file.unlink()
+    """Render or copy a single planned file into an existing directory."""
+    target = destination / rel_path
+    if planned.is_template:
+        target.write_text(
+            _render_template_path(
+                planned.source, context, keep_trailing_newline=True
+            )
+        )
+    else:
+        shutil.copy2(planned.source, target)
 
 
-def _copy_common_files(
+def _write_plan(
     destination: Path,
-    orm_type: str,
-    package_manager: str,
+    plan: _FilePlan,
     context: Mapping[str, object],
+    jobs: int | None = None,
+) -> None:
+    """Materialize the planned files, writing each output path once.
+
+    Directories are created up front so the writers never race on mkdir;
+    files are then rendered and written by up to ``jobs`` threads.
+    """
+    for directory in sorted(_plan_directories(destination, plan)):
+        directory.mkdir(parents=True, exist_ok=True)
+
+    workers = min(jobs or DEFAULT_WRITE_JOBS, len(plan))
+    if workers <= 1:
+        for rel_path, planned in plan.items():
+            _write_planned_file(destination, rel_path, planned, context)
+        return
+
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="robyn-config-write"
+    ) as executor:
+        futures = [
+            executor.submit(
+                _write_planned_file, destination, rel_path, planned, context
+            )
+            for rel_path, planned in plan.items()
+        ]
+        try:
+            for future in as_completed(futures):
+                future.result()
+        except BaseException:
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise
+
+
+def _plan_common_files(
+    plan: _FilePlan, orm_type: str, package_manager: str
 ) -> None:
-    """Copy common files to the destination directory."""
+    """Plan the root-level common files for the destination directory."""
     lock_files = set(LOCK_FILE_BY_MANAGER.values())
     current_lock = LOCK_FILE_BY_MANAGER.get(package_manager)
-    for source in COMMON_DIR.iterdir():
+    for source in sorted(COMMON_DIR.iterdir()):
         if source.is_dir() or source.name == ".DS_Store":
             continue
 
@@ -167,68 +254,42 @@ def _copy_common_files(
         if name in lock_files:
             continue
 
-        target = destination / name
-        if is_template:
-            _render_template(source, target, context)
-        else:
-            target.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(source, target)
+        plan[Path(name)] = _PlannedFile(source, is_template=is_template)
 
 
-def _copy_src_app(
-    destination: Path,
-    orm_type: str,
-    design: str,
-    context: Mapping[str, object],
-) -> None:
-    """Copy the application source directory to the destination."""
-    target_dir = destination / "src" / "app"
-    target_dir.parent.mkdir(parents=True, exist_ok=True)
+def _plan_src_app(plan: _FilePlan, orm_type: str, design: str) -> None:
+    """Plan the application source directory."""
+    target_rel = Path("src") / "app"
 
     source_app_dir = SRC_DIR / design
     infra_dir = (source_app_dir / "infrastructure").resolve()
     models_dir = (source_app_dir / "models").resolve()
 
-    def copy_tree_with_skip(
-        source: Path, target: Path, skip_map: Mapping[Path, set[str]]
-    ) -> None:
-        def ignore(current: str, names: Iterable[str]) -> Iterable[str]:
-            current_path = Path(current).resolve()
-            for root, skip_names in skip_map.items():
-                if current_path == root:
-                    return [name for name in names if name in skip_names]
-            return []
-
-        shutil.copytree(source, target, dirs_exist_ok=True, ignore=ignore)
-
     if design == "ddd":
-        skip = {infra_dir: set(ORM_CHOICES)}
-        copy_tree_with_skip(source_app_dir, target_dir, skip)
-        _render_jinja2_in_tree(target_dir, context)
-
-        source_database = infra_dir / orm_type
-        target_database = target_dir / "infrastructure" / "database"
-        shutil.copytree(source_database, target_database, dirs_exist_ok=True)
-        _render_jinja2_in_tree(target_database, context)
+        _plan_tree(
+            plan,
+            source_app_dir,
+            target_rel,
+            {infra_dir: set(ORM_CHOICES)},
+        )
+        _plan_tree(
+            plan,
+            infra_dir / orm_type,
+            target_rel / "infrastructure" / "database",
+        )
 
     elif design == "mvc":
-        skip = {source_app_dir.resolve(): {"models"}}
-        copy_tree_with_skip(source_app_dir, target_dir, skip)
-        _render_jinja2_in_tree(target_dir, context)
-
-        source_models = models_dir / orm_type
-        target_models = target_dir / "models"
-        shutil.copytree(source_models, target_models, dirs_exist_ok=True)
-        _render_jinja2_in_tree(target_models, context)
+        _plan_tree(
+            plan,
+            source_app_dir,
+            target_rel,
+            {source_app_dir.resolve(): {"models"}},
+        )
+        _plan_tree(plan, models_dir / orm_type, target_rel / "models")
 
 
-def _copy_broker_files(
-    destination: Path,
-    design: str,
-    broker: str,
-    context: Mapping[str, object],
-) -> None:
-    """Copy optional broker infrastructure into the generated app."""
+def _plan_broker_files(plan: _FilePlan, design: str, broker: str) -> None:
+    """Plan optional broker infrastructure for the generated app."""
     if broker == "none":
         return
 
@@ -238,23 +299,17 @@ def _copy_broker_files(
             f"Could not find broker template for '{design}/{broker}'."
         )
 
-    target = destination / "src" / "app"
-    shutil.copytree(source, target, dirs_exist_ok=True)
-    _render_jinja2_in_tree(target, context)
+    _plan_tree(plan, source, Path("src") / "app")
 
 
-def _copy_nosql_files(
-    destination: Path,
-    design: str,
-    nosql: Iterable[str],
-    context: Mapping[str, object],
+def _plan_nosql_files(
+    plan: _FilePlan, design: str, nosql: Iterable[str]
 ) -> None:
-    """Copy optional NoSQL infrastructure into the generated app."""
+    """Plan optional NoSQL infrastructure for the generated app."""
     providers = tuple(nosql)
     if not providers:
         return
 
-    target = destination / "src" / "app"
     sources = (NOSQL_DIR / "common", NOSQL_DIR / design / "common")
     for provider in providers:
         source = NOSQL_DIR / design / provider
@@ -265,17 +320,11 @@ def _copy_nosql_files(
         sources += (source,)
 
     for source in sources:
-        shutil.copytree(source, target, dirs_exist_ok=True)
-    _render_jinja2_in_tree(target, context)
+        _plan_tree(plan, source, Path("src") / "app")
 
 
-def _copy_worker_files(
-    destination: Path,
-    design: str,
-    worker: str,
-    context: Mapping[str, object],
-) -> None:
-    """Copy optional worker infrastructure into the generated app."""
+def _plan_worker_files(plan: _FilePlan, design: str, worker: str) -> None:
+    """Plan optional worker infrastructure for the generated app."""
     if worker == "none":
         return
 
@@ -285,9 +334,7 @@ def _copy_worker_files(
             f"Could not find worker template for '{design}/{worker}'."
         )
 
-    target = destination / "src" / "app"
-    shutil.copytree(source, target, dirs_exist_ok=True)
-    _render_jinja2_in_tree(target, context)
+    _plan_tree(plan, source, Path("src") / "app")
 
 
 def _resolve_compose_file(base: str, extension: str, orm_type: str) -> Path:
@@ -304,36 +351,44 @@ def _resolve_compose_file(base: str, extension: str, orm_type: str) -> Path:
     )
 
 
-def _copy_compose_app(
-    destination: Path, orm_type: str, context: Mapping[str, object]
-) -> None:
-    """Copy the compose app files to the destination directory."""
-    target_dir = destination / "compose" / "app"
-
-    def ignore(source: str, names: Iterable[str]) -> Iterable[str]:
-        source_path = Path(source).resolve()
-        if source_path == COMPOSE_APP_DIR:
-            templates = {
-                "dev.sqlalchemy.sh",
-                "dev.tortoise.sh",
-                "prod.sqlalchemy.py",
-                "prod.tortoise.py",
-                "Dockerfile.jinja2",
-            }
-            return [name for name in names if name in templates]
-        return []
-
-    shutil.copytree(
-        COMPOSE_APP_DIR, target_dir, dirs_exist_ok=True, ignore=ignore
+def _plan_compose_app(plan: _FilePlan, orm_type: str) -> None:
+    """Plan the compose app files for the destination directory."""
+    target_rel = Path("compose") / "app"
+    templates = {
+        "dev.sqlalchemy.sh",
+        "dev.tortoise.sh",
+        "prod.sqlalchemy.py",
+        "prod.tortoise.py",
+        "Dockerfile.jinja2",
+    }
+    _plan_tree(plan, COMPOSE_APP_DIR, target_rel, {COMPOSE_APP_DIR: templates})
+
+    plan[target_rel / "dev.sh"] = _PlannedFile(
+        _resolve_compose_file("dev", "sh", orm_type)
+    )
+    plan[target_rel / "prod.py"] = _PlannedFile(
+        _resolve_compose_file("prod", "py", orm_type)
+    )
+    plan[target_rel / "Dockerfile"] = _PlannedFile(
+        COMPOSE_APP_DIR / "Dockerfile.jinja2", is_template=True
     )
 
-    dev_source = _resolve_compose_file("dev", "sh", orm_type)
-    prod_source = _resolve_compose_file("prod", "py", orm_type)
-    shutil.copy2(dev_source, target_dir / "dev.sh")
-    shutil.copy2(prod_source, target_dir / "prod.py")
 
-    dockerfile_source = COMPOSE_APP_DIR / "Dockerfile.jinja2"
-    _render_template(dockerfile_source, target_dir / "Dockerfile", context)
+def _plan_template(
+    orm_type: str,
+    design: str,
+    package_manager: str,
+    context: Mapping[str, object],
+) -> _FilePlan:
+    """Build the complete file plan for a project from all overlays."""
+    plan: _FilePlan = {}
+    _plan_src_app(plan, orm_type, design)
+    _plan_broker_files(plan, design, context["broker"])
+    _plan_nosql_files(plan, design, context["nosql"])
+    _plan_worker_files(plan, design, context["worker"])
+    _plan_compose_app(plan, orm_type)
+    _plan_common_files(plan, orm_type, package_manager)
+    return plan
 
 
 def copy_template(
@@ -348,6 +403,7 @@ def copy_template(
     worker: str = "none",
     worker_exp_mode: bool = False,
     scheduler: bool = False,
+    jobs: int | None = None,
 ) -> None:
     """Copy the complete template to the destination directory."""
     context = _get_template_config(
@@ -362,12 +418,34 @@ def copy_template(
         worker_exp_mode,
         scheduler,
     )
-    _copy_src_app(destination, orm_type, design, context)
-    _copy_broker_files(destination, design, context["broker"], context)
-    _copy_nosql_files(destination, design, context["nosql"], context)
-    _copy_worker_files(destination, design, context["worker"], context)
-    _copy_compose_app(destination, orm_type, context)
-    _copy_common_files(destination, orm_type, package_manager, context)
+    plan = _plan_template(orm_type, design, package_manager, context)
+    _write_plan(destination, plan, context, jobs)
+
+
+def _remove_path(path: Path) -> None:
+    if path.is_dir():
+        shutil.rmtree(path, ignore_errors=True)
+    else:
+        path.unlink(missing_ok=True)
+
+
+def _cleanup_create_failure(
+    target_dir: Path,
+    generated_items: set[Path],
+    existing_items: set[Path],
+    created_new_dir: bool,
+) -> None:
+    """Attempt to remove files created during a failed create command."""
+    if created_new_dir and target_dir.exists():
+        shutil.rmtree(target_dir, ignore_errors=True)
+        return
+
+    for rel_path in generated_items:
+        if rel_path in existing_items:
+            continue
+        candidate = target_dir / rel_path
+        if candidate.exists():
+            _remove_path(candidate)
 
 
 def collect_existing_items(destination: Path) -> set[Path]:
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
 from typing import Sequence
 
 from ._config import (
@@ -13,6 +12,7 @@ from ._config import (
     ORM_CHOICES,
     PACKAGE_MANAGER_CHOICES,
     UID_CHOICES,
+    InteractiveCreateConfig,
     _normalize_nosql,
 )
 
@@ -46,23 +46,6 @@ def _pick_nosql(values: Sequence[str]) -> tuple[str, ...]:
         return ()
 
 
-@dataclass(frozen=True, slots=True)
-class InteractiveCreateConfig:
-    """Collected values from interactive create mode."""
-
-    name: str
-    destination: str
-    orm: str
-    design: str
-    package_manager: str
-    uid: str
-    broker: str
-    nosql: tuple[str, ...]
-    worker: str
-    worker_exp_mode: bool
-    scheduler: bool = False
-
-
 if TEXTUAL_AVAILABLE:
 
     BANNER_ART = r"""
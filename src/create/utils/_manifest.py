@@ -0,0 +1,334 @@
+"""Manifest-driven batch generation for the 'create' command."""
+
+from __future__ import annotations
+
+import os
+import sys
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Any, Iterable, Mapping, Sequence
+
+try:
+    import tomllib
+except ImportError:
+    import tomli as tomllib
+
+from ._config import (
+    DESIGN_CHOICES,
+    ORM_CHOICES,
+    PACKAGE_MANAGER_CHOICES,
+    UID_CHOICES,
+    _normalize_nosql,
+    _resolve_worker,
+)
+from ._filesystem import (
+    _cleanup_create_failure,
+    _collect_existing_items,
+    _collect_generated_items,
+    copy_template,
+)
+from ._package_manager import (
+    apply_package_manager,
+    defer_package_manager,
+    ensure_package_manager_available,
+    start_background_lock,
+)
+from ._template_cache import configure_template_cache
+
+MANIFEST_DEFAULTS: Mapping[str, object] = {
+    "orm": "sqlalchemy",
+    "design": "ddd",
+    "package_manager": "uv",
+    "uid": "none",
+    "broker": "none",
+    "nosql": "none",
+    "worker": "none",
+    "worker_exp_mode": False,
+    "scheduler": False,
+}
+
+_MANIFEST_KEYS = frozenset({"name", "destination", *MANIFEST_DEFAULTS})
+_CHOICE_KEYS: Mapping[str, Sequence[str]] = {
+    "orm": ORM_CHOICES,
+    "design": DESIGN_CHOICES,
+    "package_manager": PACKAGE_MANAGER_CHOICES,
+    "uid": UID_CHOICES,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class ManifestProject:
+    """A single validated project entry from a create manifest."""
+
+    name: str
+    destination: Path
+    orm: str = "sqlalchemy"
+    design: str = "ddd"
+    package_manager: str = "uv"
+    uid: str = "none"
+    broker: str = "none"
+    nosql: tuple[str, ...] = field(default_factory=tuple)
+    worker: str = "none"
+    worker_exp_mode: bool = False
+    scheduler: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class ManifestResult:
+    """Outcome of generating one manifest project."""
+
+    name: str
+    destination: Path
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _normalize_keys(entry: Mapping[str, Any], label: str) -> dict[str, Any]:
+    if not isinstance(entry, Mapping):
+        raise ValueError(f"{label}: must be a table.")
+    normalized = {key.replace("-", "_"): value for key, value in entry.items()}
+    unknown = sorted(set(normalized) - _MANIFEST_KEYS)
+    if unknown:
+        raise ValueError(f"{label}: unknown keys: {', '.join(unknown)}.")
+    return normalized
+
+
+def _parse_project(
+    entry: Mapping[str, Any],
+    defaults: Mapping[str, Any],
+    base_dir: Path,
+    label: str,
+) -> ManifestProject:
+    """Validate one manifest entry merged over the manifest defaults."""
+    values = {
+        **MANIFEST_DEFAULTS,
+        **defaults,
+        **_normalize_keys(entry, label),
+    }
+
+    name = values.get("name")
+    if not isinstance(name, str) or not name.strip():
+        raise ValueError(f"{label}: 'name' is required.")
+    destination = values.get("destination") or name
+    if not isinstance(destination, str):
+        raise ValueError(f"{label}: 'destination' must be a string.")
+
+    for key in (*_CHOICE_KEYS, "broker", "worker"):
+        if not isinstance(values[key], str):
+            raise ValueError(f"{label}: '{key}' must be a string.")
+        values[key] = values[key].lower()
+    for key, choices in _CHOICE_KEYS.items():
+        if values[key] not in choices:
+            raise ValueError(
+                f"{label}: unsupported {key} '{values[key]}'. "
+                f"Valid options: {', '.join(choices)}."
+            )
+    for key in ("worker_exp_mode", "scheduler"):
+        if not isinstance(values[key], bool):
+            raise ValueError(f"{label}: '{key}' must be a boolean.")
+
+    raw_nosql = values["nosql"]
+    if not (
+        raw_nosql is None
+        or isinstance(raw_nosql, str)
+        or (
+            isinstance(raw_nosql, list)
+            and all(isinstance(item, str) for item in raw_nosql)
+        )
+    ):
+        raise ValueError(
+            f"{label}: 'nosql' must be a string or a list of strings."
+        )
+
+    try:
+        nosql = _normalize_nosql(raw_nosql)
+        _resolve_worker(
+            values["worker"],
+            values["broker"],
+            values["worker_exp_mode"],
+            values["scheduler"],
+        )
+    except (AttributeError, TypeError, ValueError) as exc:
+        raise ValueError(f"{label}: {exc}") from exc
+
+    return ManifestProject(
+        name=name,
+        destination=(base_dir / destination).expanduser().resolve(),
+        orm=values["orm"],
+        design=values["design"],
+        package_manager=values["package_manager"],
+        uid=values["uid"],
+        broker=values["broker"],
+        nosql=nosql,
+        worker=values["worker"],
+        worker_exp_mode=values["worker_exp_mode"],
+        scheduler=values["scheduler"],
+    )
+
+
+def load_manifest(path: Path) -> list[ManifestProject]:
+    """Read and validate a TOML create manifest.
+
+    The manifest holds an optional ``[defaults]`` table and one
+    ``[[projects]]`` table per service; keys mirror the ``create`` options.
+    Relative destinations are resolved against the manifest directory.
+    """
+    try:
+        with open(path, "rb") as f:
+            data = tomllib.load(f)
+    except tomllib.TOMLDecodeError as exc:
+        raise ValueError(f"Invalid manifest {path}: {exc}") from exc
+
+    defaults = data.get("defaults", {})
+    entries = data.get("projects", [])
+    if not isinstance(defaults, dict):
+        raise ValueError("Manifest [defaults] must be a table.")
+    if not isinstance(entries, list) or not entries:
+        raise ValueError("Manifest must define at least one [[projects]].")
+    defaults = _normalize_keys(defaults, "defaults")
+    if {"name", "destination"} & set(defaults):
+        raise ValueError(
+            "defaults: 'name' and 'destination' must be set per project."
+        )
+
+    base_dir = path.expanduser().resolve().parent
+    projects = [
+        _parse_project(entry, defaults, base_dir, f"projects[{index}]")
+        for index, entry in enumerate(entries)
+    ]
+
+    seen: set[Path] = set()
+    for project in projects:
+        if project.destination in seen:
+            raise ValueError(
+                f"Duplicate manifest destination '{project.destination}'."
+            )
+        seen.add(project.destination)
+    return projects
+
+
+def _create_manifest_project(
+    project: ManifestProject,
+    jobs: int | None,
+    template_cache: bool,
+    lock_mode: str = "sync",
+    lock_cache: bool = True,
+    package_cache_dir: Path | None = None,
+) -> ManifestResult:
+    """Generate one manifest project; failures are reported, not raised."""
+    configure_template_cache(template_cache)
+    destination = project.destination
+    generated_items = _collect_generated_items(
+        project.orm, project.design, project.package_manager
+    )
+    existing_items: set[Path] = set()
+    created_new_dir = False
+
+    try:
+        if project.uid == "uuidv7" and sys.version_info < (3, 13):
+            raise ValueError("uuidv7 requires Python 3.13 or newer.")
+        if lock_mode != "defer":
+            ensure_package_manager_available(project.package_manager)
+
+        if destination.exists():
+            if not destination.is_dir():
+                raise ValueError(
+                    f"Target path '{destination}' is not a directory."
+                )
+            existing_items = _collect_existing_items(destination)
+            overlapping = sorted(existing_items & generated_items)
+            if overlapping:
+                raise ValueError(
+                    f"Target directory '{destination}' already contains "
+                    + ", ".join(item.as_posix() for item in overlapping)
+                    + "."
+                )
+        else:
+            destination.mkdir(parents=True)
+            created_new_dir = True
+
+        copy_template(
+            destination,
+            project.orm,
+            project.design,
+            project.name,
+            project.package_manager,
+            project.uid,
+            project.broker,
+            project.nosql,
+            project.worker,
+            project.worker_exp_mode,
+            project.scheduler,
+            jobs=jobs,
+        )
+        if lock_mode == "defer":
+            defer_package_manager(destination)
+        elif lock_mode == "background":
+            start_background_lock(
+                destination,
+                project.package_manager,
+                lock_cache=lock_cache,
+                package_cache_dir=package_cache_dir,
+            )
+        else:
+            apply_package_manager(
+                destination,
+                project.package_manager,
+                lock_cache=lock_cache,
+                package_cache_dir=package_cache_dir,
+            )
+    except Exception as exc:
+        _cleanup_create_failure(
+            destination, generated_items, existing_items, created_new_dir
+        )
+        message = getattr(exc, "message", None) or str(exc)
+        return ManifestResult(project.name, destination, message)
+    return ManifestResult(project.name, destination)
+
+
+def create_from_manifest(
+    projects: Iterable[ManifestProject],
+    processes: int | None = None,
+    jobs: int | None = None,
+    template_cache: bool = True,
+    *,
+    lock_mode: str = "sync",
+    lock_cache: bool = True,
+    package_cache_dir: Path | None = None,
+) -> list[ManifestResult]:
+    """Generate every manifest project across a pool of processes.
+
+    Results are returned in manifest order; one failing project does not
+    stop the others.
+    """
+    projects = list(projects)
+    generate = partial(
+        _create_manifest_project,
+        jobs=jobs,
+        template_cache=template_cache,
+        lock_mode=lock_mode,
+        lock_cache=lock_cache,
+        package_cache_dir=package_cache_dir,
+    )
+    workers = min(processes or os.cpu_count() or 1, len(projects))
+    if workers <= 1:
+        return [generate(project) for project in projects]
+
+    # multiprocessing is costly to import; only batch runs need it.
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(generate, project) for project in projects]
+        results = []
+        for project, future in zip(projects, futures):
+            try:
+                results.append(future.result())
+            except Exception as exc:
+                results.append(
+                    ManifestResult(project.name, project.destination, str(exc))
+                )
+        return results
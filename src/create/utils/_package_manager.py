@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 import os
 import shutil
 import subprocess
+import sys
+import tempfile
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
 import click
@@ -14,6 +20,18 @@ from ._config import (
     PACKAGE_MANAGER_CHOICES,
     PACKAGE_MANAGER_DOWNLOAD_URLS,
 )
+from ._template_cache import _user_cache_dir
+
+CACHE_ENV_BY_MANAGER = {
+    "uv": "UV_CACHE_DIR",
+    "poetry": "POETRY_CACHE_DIR",
+}
+
+LOCK_STATUS_FILE = ".robyn-config-lock.json"
+_CONFIG_SECTION_HEADER = "[tool.robyn-config]"
+_LOCK_PENDING_LINE = 'lock = "pending"'
+# Directory holding the top-level ``cli`` module, for the background locker.
+_CLI_DIR = Path(__file__).resolve().parents[2]
 
 
 def ensure_package_manager_available(package_manager: str) -> None:
@@ -36,17 +54,89 @@ def ensure_package_manager_available(package_manager: str) -> None:
         )
 
 
-def apply_package_manager(destination: Path, package_manager: str) -> None:
-    """Generate the lock file for the project using the chosen package manager."""
+@lru_cache(maxsize=None)
+def _package_manager_version(package_manager: str) -> str:
+    """Return the reported version of the package manager executable."""
+    try:
+        result = subprocess.run(
+            [package_manager, "--version"],
+            capture_output=True,
+            text=True,
+        )
+    except OSError:
+        return "unknown"
+    return result.stdout.strip() or "unknown"
+
+
+def _lock_cache_path(destination: Path, package_manager: str) -> Path:
+    """Return the cache entry for the destination's rendered pyproject."""
+    digest = hashlib.sha256()
+    digest.update(package_manager.encode())
+    digest.update(b"\0")
+    digest.update(_package_manager_version(package_manager).encode())
+    digest.update(b"\0")
+    digest.update((destination / "pyproject.toml").read_bytes())
+    lock_file = LOCK_FILE_BY_MANAGER[package_manager]
+    return _user_cache_dir() / "locks" / digest.hexdigest() / lock_file
+
+
+def _restore_cached_lock(cache_path: Path, lock_path: Path) -> bool:
+    try:
+        shutil.copyfile(cache_path, lock_path)
+    except OSError:
+        return False
+    return True
+
+
+def _store_cached_lock(lock_path: Path, cache_path: Path) -> None:
+    """Store a lock file atomically; cache failures never fail create."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(
+            dir=cache_path.parent, prefix=f".{cache_path.name}."
+        )
+    except OSError:
+        return
+    os.close(fd)
+    try:
+        shutil.copyfile(lock_path, tmp_name)
+        os.replace(tmp_name, cache_path)
+    except OSError:
+        Path(tmp_name).unlink(missing_ok=True)
+
+
+def apply_package_manager(
+    destination: Path,
+    package_manager: str,
+    *,
+    lock_cache: bool = True,
+    package_cache_dir: Path | None = None,
+) -> None:
+    """Generate the lock file for the project using the chosen package manager.
+
+    With ``lock_cache`` enabled a lock file previously resolved for an
+    identical ``pyproject.toml`` and package manager version is reused
+    instead of resolving again. ``package_cache_dir`` shares the package
+    manager's download cache across projects instead of a per-project one.
+    """
     ensure_package_manager_available(package_manager)
 
     lock_file = LOCK_FILE_BY_MANAGER.get(package_manager, "lock file")
     lock_path = destination / lock_file
+    cache_path = None
+    if lock_cache:
+        cache_path = _lock_cache_path(destination, package_manager)
+        if _restore_cached_lock(cache_path, lock_path):
+            return
+
     env = os.environ.copy()
-    if package_manager == "uv":
-        env.setdefault("UV_CACHE_DIR", str(destination / ".uv-cache"))
+    cache_env = CACHE_ENV_BY_MANAGER[package_manager]
+    if package_cache_dir is not None:
+        env[cache_env] = str(package_cache_dir.expanduser().resolve())
     else:
-        env.setdefault("POETRY_CACHE_DIR", str(destination / ".poetry-cache"))
+        env.setdefault(
+            cache_env, str(destination / f".{package_manager}-cache")
+        )
     if package_manager == "uv":
         command = ["uv", "lock"]
     else:
@@ -68,3 +158,167 @@ def apply_package_manager(destination: Path, package_manager: str) -> None:
         raise click.ClickException(
             f"{package_manager} finished without creating {lock_file}{detail}"
         )
+    if cache_path is not None:
+        _store_cached_lock(lock_path, cache_path)
+
+
+def _set_lock_pending(pyproject_path: Path, pending: bool) -> None:
+    """Add or remove the pending-lock marker in [tool.robyn-config]."""
+    lines = pyproject_path.read_text().splitlines()
+    try:
+        start = next(
+            idx
+            for idx, line in enumerate(lines)
+            if line.strip() == _CONFIG_SECTION_HEADER
+        )
+    except StopIteration:
+        raise ValueError(
+            f"No {_CONFIG_SECTION_HEADER} section found in {pyproject_path}."
+        ) from None
+
+    end = len(lines)
+    for idx in range(start + 1, len(lines)):
+        if lines[idx].strip().startswith("["):
+            end = idx
+            break
+    marker_idx = next(
+        (
+            idx
+            for idx in range(start + 1, end)
+            if lines[idx].strip() == _LOCK_PENDING_LINE
+        ),
+        None,
+    )
+    if pending == (marker_idx is not None):
+        return
+
+    if pending:
+        insert_at = end
+        while insert_at > start + 1 and not lines[insert_at - 1].strip():
+            insert_at -= 1
+        lines.insert(insert_at, _LOCK_PENDING_LINE)
+    elif marker_idx is not None:
+        del lines[marker_idx]
+    pyproject_path.write_text("\n".join(lines) + "\n")
+
+
+def is_lock_pending(project_path: Path) -> bool:
+    """Return whether the project's lock file generation was deferred."""
+    pyproject_path = project_path / "pyproject.toml"
+    if not pyproject_path.exists():
+        return False
+    return any(
+        line.strip() == _LOCK_PENDING_LINE
+        for line in pyproject_path.read_text().splitlines()
+    )
+
+
+def _write_lock_status(status_path: Path, status: str, **details) -> None:
+    payload = {
+        "status": status,
+        "updated_at": datetime.now(timezone.utc).isoformat(),
+        **details,
+    }
+    tmp_path = status_path.with_name(f".{status_path.name}.tmp")
+    tmp_path.write_text(json.dumps(payload, indent=2) + "\n")
+    os.replace(tmp_path, status_path)
+
+
+def defer_package_manager(destination: Path) -> None:
+    """Skip lock generation and mark the project as pending a lock."""
+    _set_lock_pending(destination / "pyproject.toml", True)
+
+
+def run_pending_lock(
+    destination: Path,
+    package_manager: str,
+    *,
+    lock_cache: bool = True,
+    package_cache_dir: Path | None = None,
+    status_path: Path | None = None,
+) -> None:
+    """Generate a deferred lock file and clear the pending-lock marker.
+
+    The marker is restored if locking fails, and ``status_path`` (when
+    given) records the outcome for background runs.
+    """
+    pyproject_path = destination / "pyproject.toml"
+    was_pending = is_lock_pending(destination)
+    if was_pending:
+        _set_lock_pending(pyproject_path, False)
+    try:
+        apply_package_manager(
+            destination,
+            package_manager,
+            lock_cache=lock_cache,
+            package_cache_dir=package_cache_dir,
+        )
+    except Exception as exc:
+        if was_pending:
+            _set_lock_pending(pyproject_path, True)
+        if status_path is not None:
+            message = getattr(exc, "message", None) or str(exc)
+            _write_lock_status(
+                status_path,
+                "failed",
+                package_manager=package_manager,
+                error=message,
+            )
+        raise
+    if status_path is not None:
+        _write_lock_status(
+            status_path, "succeeded", package_manager=package_manager
+        )
+
+
+def start_background_lock(
+    destination: Path,
+    package_manager: str,
+    *,
+    lock_cache: bool = True,
+    package_cache_dir: Path | None = None,
+) -> Path:
+    """Spawn a detached ``robyn-config lock`` run and return its status file.
+
+    The project stays marked as pending until the background run succeeds.
+    """
+    ensure_package_manager_available(package_manager)
+    defer_package_manager(destination)
+    status_path = destination / LOCK_STATUS_FILE
+
+    command = [
+        sys.executable,
+        "-m",
+        "cli",
+        "lock",
+        "--status-file",
+        str(status_path),
+    ]
+    if not lock_cache:
+        command.append("--no-lock-cache")
+    if package_cache_dir is not None:
+        command += ["--package-cache-dir", str(package_cache_dir)]
+    command.append(str(destination))
+
+    env = os.environ.copy()
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, (str(_CLI_DIR), env.get("PYTHONPATH")))
+    )
+    creationflags = 0
+    if sys.platform == "win32":
+        creationflags = (
+            subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+        )
+
+    _write_lock_status(status_path, "running", package_manager=package_manager)
+    subprocess.Popen(
+        command,
+        cwd=destination,
+        env=env,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=sys.platform != "win32",
+        creationflags=creationflags,
+    )
+    return status_path
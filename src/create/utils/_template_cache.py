@@ -0,0 +1,115 @@
+"""Compiled Jinja2 template cache shared by the scaffolding commands.
+
+Jinja2 is imported on the first render so commands that never render a
+template (``--help``, ``lock``) do not pay for it at startup.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Mapping
+
+if TYPE_CHECKING:
+    from jinja2 import Environment, FileSystemBytecodeCache
+
+CACHE_DIR_ENV_VAR = "ROBYN_CONFIG_CACHE_DIR"
+
+_TEMPLATE_CACHE_ENABLED = True
+
+
+def _user_cache_dir() -> Path:
+    """Return the per-user cache directory for robyn-config."""
+    override = os.environ.get(CACHE_DIR_ENV_VAR)
+    if override:
+        return Path(override).expanduser()
+
+    home = Path.home()
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or str(
+            home / "AppData" / "Local"
+        )
+    elif sys.platform == "darwin":
+        base = str(home / "Library" / "Caches")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or str(home / ".cache")
+    return Path(base) / "robyn-config"
+
+
+def _template_cache_dir(keep_trailing_newline: bool) -> Path:
+    """Return the bytecode directory for one environment configuration."""
+    import jinja2
+
+    variant = "keep-newline" if keep_trailing_newline else "strip-newline"
+    return (
+        _user_cache_dir()
+        / "templates"
+        / f"jinja2-{jinja2.__version__}"
+        / variant
+    )
+
+
+def _build_bytecode_cache(
+    keep_trailing_newline: bool,
+) -> FileSystemBytecodeCache | None:
+    from ._template_loader import _TemplateBytecodeCache
+
+    directory = _template_cache_dir(keep_trailing_newline)
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return None
+    return _TemplateBytecodeCache(str(directory))
+
+
+@lru_cache(maxsize=None)
+def _template_environment(keep_trailing_newline: bool = False) -> Environment:
+    """Return the shared Jinja2 environment for the given newline policy."""
+    from jinja2 import Environment, StrictUndefined
+
+    from ._template_loader import _TemplatePathLoader
+
+    bytecode_cache = None
+    if _TEMPLATE_CACHE_ENABLED:
+        bytecode_cache = _build_bytecode_cache(keep_trailing_newline)
+    return Environment(
+        loader=_TemplatePathLoader(),
+        bytecode_cache=bytecode_cache,
+        undefined=StrictUndefined,
+        keep_trailing_newline=keep_trailing_newline,
+        cache_size=-1,
+    )
+
+
+def configure_template_cache(enabled: bool) -> None:
+    """Enable or disable the persistent compiled-template cache."""
+    global _TEMPLATE_CACHE_ENABLED
+    if _TEMPLATE_CACHE_ENABLED == enabled:
+        return
+    _TEMPLATE_CACHE_ENABLED = enabled
+    _template_environment.cache_clear()
+
+
+def _render_template_path(
+    source: Path,
+    context: Mapping[str, object],
+    *,
+    keep_trailing_newline: bool = False,
+) -> str:
+    """Render the template stored at source through the shared cache."""
+    environment = _template_environment(keep_trailing_newline)
+    template = environment.get_template(str(source.resolve()))
+    return template.render(**context)
+
+
+def _render_template_text(
+    template_str: str,
+    context: Mapping[str, object],
+    *,
+    keep_trailing_newline: bool = False,
+) -> str:
+    """Render an in-memory template string with the shared environment."""
+    environment = _template_environment(keep_trailing_newline)
+    return environment.from_string(template_str).render(**context)
@@ -0,0 +1,61 @@
+"""Jinja2 loader and bytecode cache used by the shared template cache.
+
+Kept apart from ``_template_cache`` so Jinja2 is only imported once a
+template is actually rendered.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Callable
+
+from jinja2 import (
+    BaseLoader,
+    Environment,
+    FileSystemBytecodeCache,
+    TemplateNotFound,
+)
+from jinja2.bccache import Bucket
+
+
+class _TemplatePathLoader(BaseLoader):
+    """Load templates by absolute path so every template root shares a cache.
+
+    Jinja2's ``FileSystemLoader`` resolves names against fixed search
+    paths; scaffolding renders from several roots (create, add, adminpanel
+    and test fixtures), so the template name is the file path itself.
+    """
+
+    def get_source(
+        self, environment: Environment, template: str
+    ) -> tuple[str, str, Callable[[], bool]]:
+        path = Path(template)
+        try:
+            mtime = path.stat().st_mtime_ns
+            source = path.read_text()
+        except OSError as exc:
+            raise TemplateNotFound(template) from exc
+
+        def uptodate() -> bool:
+            try:
+                return path.stat().st_mtime_ns == mtime
+            except OSError:
+                return False
+
+        return source, str(path), uptodate
+
+
+class _TemplateBytecodeCache(FileSystemBytecodeCache):
+    """Bytecode cache that never fails a render because of cache I/O."""
+
+    def load_bytecode(self, bucket: Bucket) -> None:
+        try:
+            super().load_bytecode(bucket)
+        except (OSError, EOFError, TypeError, ValueError):
+            bucket.reset()
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        try:
+            super().dump_bytecode(bucket)
+        except OSError:
+            pass
@@ -0,0 +1,169 @@
+"""Micro-benchmark: encode/decode cost of cache entry codecs.
+
+Scaffolds a DDD project and times ``CacheRepository[UserFlat]`` turning
+a ``UserFlat`` entry into bytes and back, for every codec, validated and
+trusted (``model_construct``), with and without zstd compression::
+
+    python tests/benchmarks/bench_cache_codecs.py --rounds 20000
+
+The ``legacy`` row is the previous decoder (``json.loads`` then
+``UserFlat(**instance)``). Codecs whose package is missing are skipped.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from tests.integration.conftest import (  # noqa: E402
+    create_fake_package_managers,
+    run_cli_create,
+)
+
+WORKLOAD = """
+import json
+import statistics
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, {src!r})
+
+from app.config import settings
+from app.domain.users import UserFlat
+from app.infrastructure.cache import CacheRepository
+from app.infrastructure.cache.entities import CacheEntry
+
+ROUNDS, COMPRESS_MIN_BYTES = {rounds!r}, {compress_min_bytes!r}
+USER = UserFlat(
+    id=4242,
+    username="ada.lovelace",
+    email="ada.lovelace@example.com",
+    password="$2b$12$" + "x" * 53,
+    role=1,
+    is_active=True,
+    created_at=datetime(2024, 1, 1, 12, 30),
+    updated_at=datetime(2024, 6, 1, 8, 15),
+)
+
+
+def timed(operation):
+    for _ in range(ROUNDS // 10):
+        operation()
+    samples = []
+    for _ in range(5):
+        started = time.perf_counter_ns()
+        for _ in range(ROUNDS):
+            operation()
+        samples.append((time.perf_counter_ns() - started) / ROUNDS / 1000)
+    return statistics.median(samples)
+
+
+def legacy():
+    raw = CacheEntry[UserFlat](instance=USER).model_dump_json()
+
+    def decode():
+        payload = json.loads(raw)
+        return CacheEntry[UserFlat](instance=UserFlat(**payload["instance"]))
+
+    return {{
+        "codec": "legacy",
+        "trusted": False,
+        "compressed": False,
+        "bytes": len(raw),
+        "encode": timed(
+            lambda: CacheEntry[UserFlat](instance=USER).model_dump_json()
+        ),
+        "decode": timed(decode),
+    }}
+
+
+def measure(codec, trusted, compress_min_bytes):
+    settings.cache.codec = codec
+    settings.cache.trusted_entries = trusted
+    settings.cache.compress_min_bytes = compress_min_bytes
+    repository = CacheRepository[UserFlat]()
+    entry = repository.entry_model(instance=USER)
+    raw = repository._encode(entry)
+    assert repository._decode("bench", raw).instance == USER
+    return {{
+        "codec": codec,
+        "trusted": trusted,
+        "compressed": compress_min_bytes > 0,
+        "bytes": len(raw),
+        "encode": timed(lambda: repository._encode(entry)),
+        "decode": timed(lambda: repository._decode("bench", raw)),
+    }}
+
+
+rows = [legacy()]
+for codec in ("json", "orjson", "msgpack"):
+    for compress_min_bytes in (0, COMPRESS_MIN_BYTES):
+        for trusted in (False, True):
+            try:
+                rows.append(measure(codec, trusted, compress_min_bytes))
+            except RuntimeError as exc:
+                print(exc, file=sys.stderr)
+                break
+print(json.dumps(rows))
+"""
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=10_000)
+    parser.add_argument(
+        "--compress-min-bytes",
+        type=int,
+        default=128,
+        help="zstd threshold of the compressed rows (UserFlat is ~300 B)",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        project_dir = workdir / "bench-codecs"
+        fake_bin = create_fake_package_managers(workdir)
+        run_cli_create(
+            project_dir, design="ddd", orm="sqlalchemy", bin_dir=fake_bin
+        )
+        script = workdir / "workload-codecs.py"
+        script.write_text(
+            WORKLOAD.format(
+                src=str(project_dir / "src"),
+                rounds=args.rounds,
+                compress_min_bytes=args.compress_min_bytes,
+            )
+        )
+        result = subprocess.run(
+            [sys.executable, str(script)],
+            cwd=project_dir,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        if result.stderr:
+            print(result.stderr.strip(), file=sys.stderr)
+        rows = json.loads(result.stdout.splitlines()[-1])
+
+    print(
+        f"{'codec':<9} {'trusted':<8} {'zstd':<5} "
+        f"{'bytes':>6} {'encode µs':>10} {'decode µs':>10}"
+    )
+    for row in rows:
+        print(
+            f"{row['codec']:<9} {str(row['trusted']).lower():<8} "
+            f"{str(row['compressed']).lower():<5} {row['bytes']:>6} "
+            f"{row['encode']:>10.2f} {row['decode']:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,13 +2,21 @@
 
 from __future__ import annotations
 
+import json
 import os
 import re
+import socket
 import subprocess
 import sys
+import time
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Any, Iterator, Sequence
+
+import pytest
 
 ROOT = Path(__file__).resolve().parents[2]
+PROBES = Path(__file__).resolve().parent / "probes"
 COMBINATIONS = (
     ("ddd", "sqlalchemy"),
     ("ddd", "tortoise"),
@@ -103,3 +111,114 @@ def run_cli_create(
         check=True,
         env=env,
     )
+
+
+def _probe_project(
+    tmp_path: Path, design: str, orm: str, add: Sequence[str]
+) -> Path:
+    project_dir = tmp_path / "test-project-probe"
+    fake_bin = create_fake_package_managers(tmp_path)
+    run_cli_create(project_dir, design=design, orm=orm, bin_dir=fake_bin)
+    env = os.environ.copy()
+    env["PYTHONPATH"] = str(ROOT / "src")
+    for name in add:
+        subprocess.run(
+            [sys.executable, "-m", "cli", "add", name, str(project_dir)],
+            check=True,
+            env=env,
+        )
+    return project_dir
+
+
+def _probe_env(
+    project_dir: Path, design: str, orm: str, env: dict[str, str] | None
+) -> dict[str, str]:
+    probe_env = os.environ.copy()
+    probe_env["PYTHONPATH"] = str(project_dir / "src")
+    probe_env["PROBE_DESIGN"] = design
+    probe_env["PROBE_ORM"] = orm
+    probe_env.update(env or {})
+    return probe_env
+
+
+def run_probe(
+    tmp_path: Path,
+    design: str,
+    orm: str,
+    script: str,
+    env: dict[str, str] | None = None,
+    *,
+    add: Sequence[str] = (),
+) -> Any:
+    """Scaffold a project and run ``probes/<script>`` against it.
+
+    The probe reads the design and ORM from ``PROBE_DESIGN`` and
+    ``PROBE_ORM``, imports the generated ``app`` package and prints its
+    findings as JSON on its last line, which is returned. ``add`` names
+    entities to add to the project first.
+    """
+    project_dir = _probe_project(tmp_path, design, orm, add)
+    result = subprocess.run(
+        [sys.executable, str(PROBES / script)],
+        cwd=project_dir,
+        env=_probe_env(project_dir, design, orm, env),
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def serve_probe(
+    tmp_path: Path,
+    design: str,
+    orm: str,
+    script: str,
+    env: dict[str, str] | None = None,
+) -> Iterator[Any]:
+    """Like ``run_probe`` for probes that serve a Robyn app.
+
+    The app listens on ``PROBE_PORT``; yields an ``httpx.Client`` bound
+    to it once it accepts connections and kills the server afterwards.
+    """
+    httpx = pytest.importorskip("httpx")
+    pytest.importorskip("robyn")
+    project_dir = _probe_project(tmp_path, design, orm, ())
+    port = _free_port()
+    probe_env = _probe_env(project_dir, design, orm, env)
+    probe_env["PROBE_PORT"] = str(port)
+    server = subprocess.Popen(
+        [sys.executable, str(PROBES / script)],
+        cwd=project_dir,
+        env=probe_env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        deadline = time.monotonic() + 30
+        while True:
+            try:
+                socket.create_connection(("127.0.0.1", port), 1).close()
+                break
+            except OSError:
+                if server.poll() is not None or time.monotonic() > deadline:
+                    server.kill()
+                    pytest.fail(f"probe server failed: {server.stderr.read()}")
+                time.sleep(0.2)
+        with httpx.Client(
+            base_url=f"http://127.0.0.1:{port}", timeout=5
+        ) as client:
+            yield client
+    finally:
+        # Robyn ignores SIGTERM while serving.
+        server.kill()
+        server.wait()
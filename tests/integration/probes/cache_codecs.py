@@ -0,0 +1,62 @@
+"""Round-trip a cache entry through every codec."""
+
+import asyncio
+import json
+import os
+from datetime import datetime
+
+from app.config import settings
+
+if os.environ["PROBE_DESIGN"] == "ddd":
+    from app.domain.users import UserFlat
+    from app.infrastructure.cache import CacheRepository, get_client
+else:
+    from app.cache import CacheRepository, get_client
+    from app.schemas import UserFlat
+
+USER = UserFlat(
+    id=7,
+    username="ada",
+    email="ada@example.com",
+    password="hash",
+    role=1,
+    created_at=datetime(2024, 1, 1),
+    updated_at=datetime(2024, 1, 2),
+)
+
+
+async def round_trip(codec, trusted, compress_min_bytes):
+    settings.cache.codec = codec
+    settings.cache.trusted_entries = trusted
+    settings.cache.compress_min_bytes = compress_min_bytes
+    async with CacheRepository[UserFlat]() as cache:
+        await cache.set(namespace="codec", key=codec, instance=USER)
+    raw = await get_client().get(f"codec:{codec}")
+    async with CacheRepository[UserFlat]() as cache:
+        entry = await cache.get("codec", codec)
+    return {
+        "equal": entry.instance == USER,
+        "created_at": type(entry.instance.created_at).__name__,
+        "zstd": raw.startswith(bytes.fromhex("28b52ffd")),
+    }
+
+
+async def main():
+    seen = {
+        "same_class": CacheRepository[UserFlat] is CacheRepository[UserFlat],
+        "entity": CacheRepository[UserFlat].entity.__name__,
+    }
+    for codec in ("json", "orjson", "msgpack"):
+        seen[codec] = [
+            await round_trip(codec, False, 0),
+            await round_trip(codec, True, 64),
+        ]
+    await get_client().set("codec:broken", b"not an entry")
+    async with CacheRepository[UserFlat]() as cache:
+        seen["broken"] = list(
+            await cache.get_many("codec", ["broken", "json"])
+        )
+    return seen
+
+
+print(json.dumps(asyncio.run(main())))
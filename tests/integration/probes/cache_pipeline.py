@@ -0,0 +1,65 @@
+"""Count the round trips cache repository blocks make."""
+
+import asyncio
+import json
+import os
+
+from redis.asyncio.client import Pipeline
+
+if os.environ["PROBE_DESIGN"] == "ddd":
+    from app.domain.users import EmailChange
+    from app.infrastructure.cache import CacheRepository, get_client
+else:
+    from app.cache import CacheRepository, get_client
+    from app.schemas import EmailChange
+
+executions = []
+execute = Pipeline.execute
+
+
+async def counting_execute(self, *args, **kwargs):
+    executions.append(len(self))
+    return await execute(self, *args, **kwargs)
+
+
+Pipeline.execute = counting_execute
+
+
+def change(index):
+    return EmailChange(user_id=index, email=f"{index}@example.com")
+
+
+async def main():
+    client = get_client()
+    seen = {}
+    async with CacheRepository[EmailChange]() as cache:
+        await cache.set_many(
+            namespace="probe",
+            instances={index: change(index) for index in range(3)},
+            ttl=30,
+        )
+        seen["queued"] = await client.exists("probe:0", "probe:1")
+        seen["own_read"] = (await cache.get("probe", 1)).instance.user_id
+    seen["flushed"] = await client.exists("probe:0", "probe:1", "probe:2")
+    seen["ttl"] = 0 < await client.ttl("probe:2") <= 30
+
+    try:
+        async with CacheRepository[EmailChange]() as cache:
+            await cache.delete_many("probe", [0, 1])
+            raise RuntimeError("rollback")
+    except RuntimeError:
+        pass
+    seen["discarded"] = await client.exists("probe:0", "probe:1")
+
+    async with CacheRepository[EmailChange]() as cache:
+        await cache.delete_many("probe", [0])
+        entries = await cache.get_many("probe", [0, 1, 2, 3])
+        seen["many"] = {
+            key: entry.instance.user_id for key, entry in entries.items()
+        }
+    seen["deleted"] = await client.exists("probe:0")
+    seen["executions"] = executions
+    return seen
+
+
+print(json.dumps(asyncio.run(main())))
@@ -0,0 +1,69 @@
+"""Report how cache repositories share the pooled Redis client."""
+
+import asyncio
+import json
+import os
+
+if os.environ["PROBE_DESIGN"] == "ddd":
+    from app.config import settings
+    from app.domain.users import EmailChange
+    from app.infrastructure.cache import (
+        CacheRepository,
+        close_client,
+        get_client,
+        pool_metrics,
+    )
+else:
+    from app.cache import (
+        CacheRepository,
+        close_client,
+        get_client,
+        pool_metrics,
+    )
+    from app.config import settings
+    from app.schemas import EmailChange
+
+
+async def reuse():
+    clients = set()
+    for index in range(5):
+        async with CacheRepository[EmailChange]() as cache:
+            clients.add(id(cache.redis_client))
+            await cache.set(
+                namespace="probe",
+                key=index,
+                instance=EmailChange(user_id=1, email="a@example.com"),
+            )
+            await cache.get(namespace="probe", key=index)
+    metrics = pool_metrics()
+    # A redis-py release renaming the pool internals must not break it.
+    pool = get_client().connection_pool
+    in_use = pool.__dict__.pop("_in_use_connections")
+    renamed = pool_metrics()
+    pool._in_use_connections = in_use
+    await close_client()
+    return {
+        "clients": len(clients),
+        "pools": metrics["pools"],
+        "connections": metrics["in_use"] + metrics["idle"],
+        "closed": pool_metrics()["pools"],
+        "renamed": [renamed["in_use"], renamed["idle"]],
+    }
+
+
+async def real_pool():
+    pool = get_client().connection_pool
+    kwargs = pool.connection_kwargs
+    return {
+        "pool": type(pool).__name__,
+        "max_connections": pool.max_connections,
+        "timeout": pool.timeout,
+        "health_check_interval": kwargs["health_check_interval"],
+        "socket_keepalive": kwargs["socket_keepalive"],
+    }
+
+
+seen = asyncio.run(reuse())
+settings.cache.use_fake = False
+seen.update(asyncio.run(real_pool()))
+print(json.dumps(seen))
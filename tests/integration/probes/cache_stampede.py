@@ -0,0 +1,116 @@
+"""Drive concurrent cached reads, early expiration and invalidation."""
+
+import asyncio
+import json
+import os
+
+from sqlalchemy import event
+
+from app.config import settings
+
+if os.environ["PROBE_DESIGN"] == "ddd":
+    from app.domain.users import UserUncommitted
+    from app.infrastructure.cache import publish
+    from app.infrastructure.database import create_engine, transaction
+    from app.infrastructure.database.repository import UsersRepository
+    from app.infrastructure.database.repository.users import USERS_CACHE
+    from app.infrastructure.database.tables import Base
+    from app.operational import users as users_ops
+
+    get_user = users_ops.get
+else:
+    from app.cache import cached, publish
+    from app.models import UsersRepository, transaction
+    from app.models.database import create_engine
+    from app.models.repository import USERS_CACHE
+    from app.models.tables import Base
+    from app.schemas import UserFlat, UserUncommitted
+
+    @cached(namespace="users")
+    async def get_user(user_id: int) -> UserFlat:
+        async with transaction(readonly=True):
+            return await UsersRepository().get(id_=user_id)
+
+
+selects = []
+
+
+async def create_schema():
+    engine = create_engine()
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    event.listen(
+        engine.sync_engine,
+        "before_cursor_execute",
+        lambda connection, cursor, statement, *args: (
+            selects.append(statement)
+            if statement.lstrip().upper().startswith("SELECT")
+            else None
+        ),
+    )
+
+
+async def concurrently(user_id, count):
+    selects.clear()
+    results = await asyncio.gather(
+        *(get_user(user_id=user_id) for _ in range(count)),
+        return_exceptions=True,
+    )
+    return results
+
+
+async def main():
+    await create_schema()
+    async with transaction():
+        user = await UsersRepository().create(
+            UserUncommitted(
+                username="ada",
+                email="ada@example.com",
+                password="hashed",
+                role=1,
+            )
+        )
+    seen = {"shared": get_user.cache is USERS_CACHE}
+
+    users = await concurrently(user.id, 10)
+    seen["coalesced"] = [
+        len(selects),
+        sorted({found.username for found in users}),
+        len({id(found) for found in users}),
+    ]
+    await concurrently(user.id, 1)
+    seen["hit"] = len(selects)
+
+    errors = await concurrently(4242, 3)
+    seen["missing"] = [
+        len(selects),
+        [type(error).__name__ for error in errors],
+    ]
+
+    hot = await USERS_CACHE.get(user.id)
+    await USERS_CACHE.set(user.id, hot, delta=0.0)
+    USERS_CACHE.local.clear()
+    seen["fresh"] = await USERS_CACHE.get(user.id) is not None
+    await USERS_CACHE.set(user.id, hot, delta=10_000.0)
+    USERS_CACHE.local.clear()
+    seen["early"] = await USERS_CACHE.get(user.id) is None
+    settings.cache.early_expiration_beta = 0
+    seen["early_off"] = await USERS_CACHE.get(user.id) is not None
+
+    # Another process deletes the user: only the published message can
+    # reach this process' local copy.
+    await asyncio.sleep(0.05)
+    local_before = USERS_CACHE.local.get(str(user.id)) is not None
+    await publish("users", [user.id])
+    for _ in range(50):
+        if USERS_CACHE.local.get(str(user.id)) is None:
+            break
+        await asyncio.sleep(0.01)
+    seen["invalidated"] = [
+        local_before,
+        USERS_CACHE.local.get(str(user.id)) is None,
+    ]
+    print(json.dumps(seen))
+
+
+asyncio.run(main())
@@ -0,0 +1,120 @@
+"""Count the queries user lookups issue through the entity cache."""
+
+import asyncio
+import json
+import logging
+import os
+
+DESIGN, ORM = os.environ["PROBE_DESIGN"], os.environ["PROBE_ORM"]
+
+if DESIGN == "ddd":
+    from app.domain.users import UserUncommitted
+    from app.infrastructure.application import NotFoundError
+    from app.infrastructure.database import create_engine, transaction
+    from app.infrastructure.database.repository import UsersRepository
+    from app.infrastructure.database.repository.users import USERS_CACHE
+else:
+    from app.models import UsersRepository, transaction
+    from app.models.database import create_engine
+    from app.models.repository import USERS_CACHE
+    from app.schemas import UserUncommitted
+    from app.utils import NotFoundError
+
+selects = []
+
+
+def collect(statement):
+    if statement.lstrip().upper().startswith("SELECT"):
+        selects.append(statement)
+
+
+class Collect(logging.Handler):
+    def emit(self, record):
+        collect(str(record.args[0]) if record.args else record.getMessage())
+
+
+async def create_schema():
+    if ORM == "tortoise":
+        from tortoise import Tortoise
+
+        await create_engine()
+        await Tortoise.generate_schemas()
+        client_log = logging.getLogger("tortoise.db_client")
+        client_log.setLevel(logging.DEBUG)
+        client_log.addHandler(Collect())
+        return
+    from sqlalchemy import event
+
+    if DESIGN == "ddd":
+        from app.infrastructure.database.tables import Base
+    else:
+        from app.models.tables import Base
+    engine = create_engine()
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    event.listen(
+        engine.sync_engine,
+        "before_cursor_execute",
+        lambda connection, cursor, statement, *args: collect(statement),
+    )
+
+
+async def queries(read):
+    selects.clear()
+    async with transaction(readonly=True):
+        try:
+            value = await read(UsersRepository())
+        except NotFoundError:
+            value = None
+    return [len(selects), value]
+
+
+async def main():
+    await create_schema()
+    async with transaction():
+        user = await UsersRepository().create(
+            UserUncommitted(
+                username="ada",
+                email="ada@example.com",
+                password="hashed",
+                role=1,
+            )
+        )
+
+    async def by_id(repository):
+        return (await repository.get(id_=user.id)).username
+
+    def by_login(login):
+        async def read(repository):
+            return (await repository.get_by_login(login=login)).username
+
+        return read
+
+    seen = {"get": [await queries(by_id), await queries(by_id)]}
+    USERS_CACHE.local.clear()
+    seen["get_from_redis"] = await queries(by_id)
+    seen["login"] = [
+        await queries(by_login("ada")),
+        await queries(by_login("ada")),
+    ]
+    async with transaction():
+        repository = UsersRepository()
+        await repository.get(user.id)
+        await repository.update(
+            attr="id", value=user.id, payload={"username": "grace"}
+        )
+        seen["own_write"] = (await repository.get(user.id)).username
+    seen["after_update"] = await queries(by_id)
+    seen["old_login"] = await queries(by_login("ada"))
+    seen["new_login"] = await queries(by_login("grace"))
+    async with transaction():
+        await UsersRepository().delete(user.id)
+    seen["after_delete"] = await queries(by_id)
+    if ORM == "tortoise":
+        from tortoise import Tortoise
+
+        await Tortoise.close_connections()
+    print(json.dumps(seen))
+
+
+asyncio.run(main())
@@ -0,0 +1,92 @@
+"""Write a cached user inside request scopes that roll back or commit."""
+
+import asyncio
+import json
+import os
+
+DESIGN, ORM = os.environ["PROBE_DESIGN"], os.environ["PROBE_ORM"]
+
+if DESIGN == "ddd":
+    from app.domain.users import UserUncommitted
+    from app.infrastructure.database import (
+        begin_unit_of_work,
+        create_engine,
+        end_unit_of_work,
+        transaction,
+    )
+    from app.infrastructure.database.repository import UsersRepository
+    from app.infrastructure.database.repository.users import USERS_CACHE
+else:
+    from app.models import UsersRepository
+    from app.models.database import (
+        begin_unit_of_work,
+        create_engine,
+        end_unit_of_work,
+        transaction,
+    )
+    from app.models.repository import USERS_CACHE
+    from app.schemas import UserUncommitted
+
+
+async def create_schema():
+    if ORM == "tortoise":
+        from tortoise import Tortoise
+
+        await create_engine()
+        await Tortoise.generate_schemas()
+        return
+    if DESIGN == "ddd":
+        from app.infrastructure.database.tables import Base
+    else:
+        from app.models.tables import Base
+    async with create_engine().begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+
+async def username(user_id):
+    async with transaction(readonly=True):
+        return (await UsersRepository().get(id_=user_id)).username
+
+
+async def cached(user_id):
+    hit = await USERS_CACHE.get(user_id)
+    return hit and hit.username
+
+
+async def rename(user_id, name, *, commit):
+    begin_unit_of_work()
+    async with transaction():
+        await UsersRepository().update(
+            attr="id", value=user_id, payload={"username": name}
+        )
+    # A fresh repository in the same request reads the write, without
+    # caching it, while other requests still get the committed row.
+    seen = [await username(user_id), await cached(user_id)]
+    await end_unit_of_work(commit=commit)
+    return seen + [await cached(user_id), await username(user_id)]
+
+
+async def main():
+    await create_schema()
+    async with transaction():
+        user = await UsersRepository().create(
+            UserUncommitted(
+                username="ada",
+                email="ada@example.com",
+                password="hashed",
+                role=1,
+            )
+        )
+    await username(user.id)
+    seen = {
+        "rolled_back": await rename(user.id, "grace", commit=False),
+        "committed": await rename(user.id, "grace", commit=True),
+    }
+    if ORM == "tortoise":
+        from tortoise import Tortoise
+
+        await Tortoise.close_connections()
+    print(json.dumps(seen))
+
+
+asyncio.run(main())
@@ -0,0 +1,38 @@
+"""Bulk create, update, upsert and delete products."""
+
+from products import ProductRepository, names, run, transaction
+
+
+async def main():
+    seen = {}
+    async with transaction():
+        created = await ProductRepository().bulk_create(
+            [{"name": f"p{index}"} for index in range(4)]
+        )
+    seen["created"] = await names()
+
+    async with transaction():
+        rows = [item async for item in ProductRepository().all()]
+        ids = [row.id for row in rows]
+        await ProductRepository().bulk_update(
+            [{"id": id_, "name": f"u{index}"} for index, id_ in enumerate(ids)]
+        )
+    seen["updated"] = await names()
+
+    async with transaction():
+        await ProductRepository().bulk_upsert(
+            [
+                {"id": ids[0], "name": "upserted"},
+                {"id": ids[-1] + 1, "name": "inserted"},
+            ]
+        )
+    seen["upserted"] = await names()
+
+    async with transaction():
+        seen["deleted"] = await ProductRepository().delete_many(ids[:2])
+    seen["remaining"] = await names()
+    seen["returned"] = len(created)
+    return seen
+
+
+run(main)
@@ -0,0 +1,36 @@
+"""Page and stream products by primary key."""
+
+from products import (
+    ProductRepository,
+    ProductUncommitted,
+    decode_cursor,
+    encode_cursor,
+    run,
+    transaction,
+)
+
+
+async def main():
+    async with transaction():
+        repository = ProductRepository()
+        for index in range(5):
+            await repository.create(ProductUncommitted(name=f"p{index}"))
+
+    pages, after = [], None
+    while True:
+        async with transaction(readonly=True):
+            items = await ProductRepository().paginate(after=after, limit=2)
+        pages.append([item.name for item in items])
+        if len(items) < 2:
+            break
+        after = decode_cursor(encode_cursor(items[-1].id))
+
+    async with transaction(readonly=True):
+        repository = ProductRepository()
+        streamed = [
+            item.name async for item in repository.stream_scalars(batch_size=2)
+        ]
+    return {"pages": pages, "streamed": streamed}
+
+
+run(main)
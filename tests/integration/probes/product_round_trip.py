@@ -0,0 +1,61 @@
+"""Count the statements a product create and update issue."""
+
+import logging
+
+from products import (
+    ORM,
+    ProductRepository,
+    ProductUncommitted,
+    create_engine,
+    names,
+    run,
+    transaction,
+)
+
+statements = []
+
+
+def collect(statement):
+    verb = statement.lstrip().split(" ", 1)[0].upper()
+    if verb in ("INSERT", "UPDATE", "SELECT"):
+        statements.append(statement)
+
+
+class Collect(logging.Handler):
+    def emit(self, record):
+        collect(str(record.args[0]) if record.args else record.getMessage())
+
+
+async def main():
+    if ORM == "sqlalchemy":
+        from sqlalchemy import event
+
+        event.listen(
+            create_engine().sync_engine,
+            "before_cursor_execute",
+            lambda connection, cursor, statement, *args: collect(statement),
+        )
+    else:
+        client_log = logging.getLogger("tortoise.db_client")
+        client_log.setLevel(logging.DEBUG)
+        client_log.addHandler(Collect())
+
+    seen = {}
+    async with transaction():
+        repository = ProductRepository()
+        statements.clear()
+        created = await repository.create(ProductUncommitted(name="first"))
+        seen["insert_statements"] = len(statements)
+
+        statements.clear()
+        updated = await repository.update(
+            attr="id", value=created.id, payload={"name": "second"}
+        )
+        seen["update_statements"] = len(statements)
+    seen["created"] = [created.id is not None, created.created_at is not None]
+    seen["updated"] = [updated.id == created.id, updated.name]
+    seen["stored"] = await names()
+    return seen
+
+
+run(main)
@@ -0,0 +1,65 @@
+"""Shared setup of the probes run against an added ``product`` entity."""
+
+import asyncio
+import json
+import os
+
+DESIGN, ORM = os.environ["PROBE_DESIGN"], os.environ["PROBE_ORM"]
+
+if DESIGN == "ddd":
+    from app.domain.product import ProductUncommitted
+    from app.infrastructure.application import decode_cursor, encode_cursor
+    from app.infrastructure.database import create_engine, transaction
+    from app.infrastructure.database.repository import ProductRepository
+else:
+    from app.models import ProductRepository, transaction
+    from app.models.database import create_engine
+    from app.schemas import decode_cursor, encode_cursor
+
+    ProductUncommitted = dict
+
+__all__ = [
+    "DESIGN",
+    "ORM",
+    "ProductRepository",
+    "ProductUncommitted",
+    "create_engine",
+    "decode_cursor",
+    "encode_cursor",
+    "names",
+    "run",
+    "transaction",
+]
+
+
+async def create_schema():
+    if ORM == "tortoise":
+        from tortoise import Tortoise
+
+        await create_engine()
+        await Tortoise.generate_schemas()
+        return
+    if DESIGN == "ddd":
+        from app.infrastructure.database.tables import Base
+    else:
+        from app.models.tables import Base
+    async with create_engine().begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+
+async def names():
+    async with transaction(readonly=True):
+        return [item.name async for item in ProductRepository().all()]
+
+
+def run(main):
+    async def probe():
+        await create_schema()
+        seen = await main()
+        if ORM == "tortoise":
+            from tortoise import Tortoise
+
+            await Tortoise.close_connections()
+        print(json.dumps(seen))
+
+    asyncio.run(probe())
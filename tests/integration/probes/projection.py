@@ -0,0 +1,104 @@
+"""Report the columns the users login lookup selects."""
+
+import asyncio
+import json
+import logging
+import os
+
+DESIGN, ORM = os.environ["PROBE_DESIGN"], os.environ["PROBE_ORM"]
+
+if DESIGN == "ddd":
+    from app.domain.users import UserUncommitted
+    from app.infrastructure.database import create_engine, transaction
+    from app.infrastructure.database.repository import UsersRepository
+else:
+    from app.models import UsersRepository, transaction
+    from app.models.database import create_engine
+    from app.schemas import UserUncommitted
+
+selects = []
+
+
+class Collect(logging.Handler):
+    def emit(self, record):
+        statement = str(record.args[0]) if record.args else record.getMessage()
+        if statement.lstrip().upper().startswith("SELECT"):
+            selects.append(statement)
+
+
+async def main():
+    if ORM == "tortoise":
+        from tortoise import Tortoise
+
+        await create_engine()
+        await Tortoise.generate_schemas()
+        client_log = logging.getLogger("tortoise.db_client")
+        client_log.setLevel(logging.DEBUG)
+        client_log.addHandler(Collect())
+    else:
+        from sqlalchemy import event
+
+        if DESIGN == "ddd":
+            from app.infrastructure.database.tables import Base
+        else:
+            from app.models.tables import Base
+        engine = create_engine()
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        event.listen(
+            engine.sync_engine,
+            "before_cursor_execute",
+            lambda connection, cursor, statement, *args: (
+                selects.append(statement)
+                if statement.lstrip().upper().startswith("SELECT")
+                else None
+            ),
+        )
+
+    async with transaction():
+        await UsersRepository().create(
+            UserUncommitted(
+                username="ada",
+                email="ada@example.com",
+                password="hashed",
+                role=1,
+                is_active=True,
+            )
+        )
+    async with transaction(readonly=True):
+        repository = UsersRepository()
+        selects.clear()
+        credentials = await repository.get_credentials(login="ada")
+        credentials_sql = " ".join(selects).lower()
+        user = await repository.get_by_login(login="ada")
+        missing = None
+        try:
+            await repository.get_credentials(login="nobody")
+        except Exception as exc:
+            missing = type(exc).__name__
+    if ORM == "tortoise":
+        await Tortoise.close_connections()
+    print(
+        json.dumps(
+            {
+                "credentials": credentials.model_dump(
+                    mode="json", exclude={"id"}
+                ),
+                "same_id": credentials.id == user.id,
+                "timestamps": user.created_at is not None,
+                "credentials_sql": [
+                    column in credentials_sql
+                    for column in (
+                        "password",
+                        "is_active",
+                        "created_at",
+                        "role",
+                    )
+                ],
+                "missing": missing,
+            }
+        )
+    )
+
+
+asyncio.run(main())
@@ -0,0 +1,61 @@
+"""Report which database read-only and write blocks run against."""
+
+import asyncio
+import json
+import os
+import sqlite3
+
+DESIGN, ORM = os.environ["PROBE_DESIGN"], os.environ["PROBE_ORM"]
+
+for path, origin in (
+    (os.environ["PROBE_PRIMARY"], "primary"),
+    (os.environ["PROBE_REPLICA"], "replica"),
+):
+    with sqlite3.connect(path) as db:
+        db.execute("CREATE TABLE origin (name TEXT)")
+        db.execute("INSERT INTO origin VALUES (?)", (origin,))
+
+if DESIGN == "ddd":
+    from app.infrastructure.database import (
+        begin_unit_of_work,
+        end_unit_of_work,
+        transaction,
+    )
+else:
+    from app.models.database import (
+        begin_unit_of_work,
+        end_unit_of_work,
+        transaction,
+    )
+
+
+async def origin(connection):
+    if hasattr(connection, "execute_query_dict"):
+        rows = await connection.execute_query_dict("SELECT name FROM origin")
+        return rows[0]["name"]
+    from sqlalchemy import text
+
+    result = await connection.execute(text("SELECT name FROM origin"))
+    return result.scalar_one()
+
+
+async def main():
+    seen = {}
+    async with transaction(readonly=True) as connection:
+        seen["standalone_read"] = await origin(connection)
+    begin_unit_of_work()
+    async with transaction(readonly=True) as connection:
+        seen["request_read"] = await origin(connection)
+    async with transaction() as connection:
+        seen["request_write"] = await origin(connection)
+    async with transaction(readonly=True) as connection:
+        seen["read_after_write"] = await origin(connection)
+    await end_unit_of_work(commit=True)
+    if ORM == "tortoise":
+        from tortoise import Tortoise
+
+        await Tortoise.close_connections()
+    print(json.dumps(seen))
+
+
+asyncio.run(main())
@@ -0,0 +1,44 @@
+"""Serve endpoints that read and write the session."""
+
+import json
+import os
+
+from robyn import Request, Robyn
+
+if os.environ["PROBE_DESIGN"] == "ddd":
+    from app.infrastructure.application.middlewares import sessions
+    from app.infrastructure.cache import get_client
+else:
+    from app.cache import get_client
+    from app.middlewares import sessions
+
+app = Robyn(__file__)
+sessions.register(app)
+
+
+@app.get("/count")
+def count(request: Request):
+    session = sessions.get_session()
+    session["count"] = session.get("count", 0) + 1
+    return json.dumps({"count": session["count"]})
+
+
+@app.get("/peek")
+def peek(request: Request):
+    return json.dumps({"count": sessions.get_session().get("count")})
+
+
+@app.get("/logout")
+def logout(request: Request):
+    sessions.get_session().clear()
+    return json.dumps({})
+
+
+@app.get("/stored")
+async def stored(request: Request):
+    keys = await get_client().keys("session:*")
+    ttls = [await get_client().ttl(key) for key in keys]
+    return json.dumps({"keys": len(keys), "ttls": ttls})
+
+
+app.start(host="127.0.0.1", port=int(os.environ["PROBE_PORT"]))
@@ -0,0 +1,49 @@
+"""Serve two endpoints that inspect the request-scoped unit of work."""
+
+import json
+import os
+
+from robyn import Request, Robyn
+
+if os.environ["PROBE_DESIGN"] == "ddd":
+    from app.infrastructure.application.middlewares import database
+    from app.infrastructure.database import transaction
+    from app.infrastructure.database.services.session import CTX_UNIT_OF_WORK
+else:
+    from app.middlewares import database
+    from app.models.database import CTX_UNIT_OF_WORK, transaction
+
+app = Robyn(__file__)
+database.register(app)
+seen = []
+
+
+async def select_one(session):
+    if hasattr(session, "execute_query"):
+        await session.execute_query("SELECT 1")
+    else:
+        from sqlalchemy import text
+
+        await session.execute(text("SELECT 1"))
+
+
+@app.get("/probe")
+async def probe(request: Request):
+    async with transaction() as first:
+        await select_one(first)
+    async with transaction() as second:
+        await select_one(second)
+    seen.append(CTX_UNIT_OF_WORK.get())
+    return json.dumps({"same": first is second, "scoped": bool(seen[-1])})
+
+
+@app.get("/released")
+def released(request: Request):
+    unit_of_work = seen[0]
+    held = getattr(unit_of_work, "_session", None) or getattr(
+        unit_of_work, "_connection", None
+    )
+    return json.dumps({"released": held is None})
+
+
+app.start(host="127.0.0.1", port=int(os.environ["PROBE_PORT"]))
@@ -16,6 +16,7 @@ from tests.integration.conftest import (
     COMBINATIONS,
     create_fake_package_managers,
     run_cli_create,
+    run_probe,
 )
 
 
@@ -274,6 +275,68 @@ def test_add_command_uid_templates_follow_project_primary_key_type(
     assert "id_ = parse_primary_key(request.path_params[\"id\"])" in rest_content
 
 
+def _run_product_probe(
+    tmp_path: Path, design: str, orm: str, script: str
+) -> dict:
+    """Scaffold a project with a product entity and run ``script``."""
+    pytest.importorskip(orm)
+    pytest.importorskip("aiosqlite")
+    env = {"SETTINGS__DATABASE__NAME": str(tmp_path / "probe")}
+    return run_probe(tmp_path, design, orm, script, env, add=["product"])
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("design,orm", COMBINATIONS)
+def test_add_command_repository_paginates_by_cursor(
+    tmp_path: Path, design: str, orm: str
+) -> None:
+    """Keyset pages and streamed rows come back in primary key order."""
+    seen = _run_product_probe(tmp_path, design, orm, "product_pagination.py")
+
+    assert seen == {
+        "pages": [["p0", "p1"], ["p2", "p3"], ["p4"]],
+        "streamed": ["p0", "p1", "p2", "p3", "p4"],
+    }
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("design,orm", COMBINATIONS)
+def test_add_command_repository_bulk_writes(
+    tmp_path: Path, design: str, orm: str
+) -> None:
+    """Bulk create, update, upsert and delete round-trip through SQLite."""
+    seen = _run_product_probe(tmp_path, design, orm, "product_bulk.py")
+
+    assert seen == {
+        "created": ["p0", "p1", "p2", "p3"],
+        "updated": ["u0", "u1", "u2", "u3"],
+        "upserted": ["upserted", "u1", "u2", "u3", "inserted"],
+        "deleted": 2,
+        "remaining": ["u2", "u3", "inserted"],
+        "returned": 4,
+    }
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("design,orm", COMBINATIONS)
+def test_add_command_repository_writes_in_one_round_trip(
+    tmp_path: Path, design: str, orm: str
+) -> None:
+    """Create returns the stored row without a follow-up query.
+
+    SQLAlchemy updates with RETURNING; Tortoise reads the row back once.
+    """
+    seen = _run_product_probe(tmp_path, design, orm, "product_round_trip.py")
+
+    assert seen == {
+        "insert_statements": 1,
+        "update_statements": 1 if orm == "sqlalchemy" else 2,
+        "created": [True, True],
+        "updated": [True, "second"],
+        "stored": ["second"],
+    }
+
+
 @pytest.mark.integration
 def test_add_command_fails_without_robyn_config(tmp_path: Path) -> None:
     """Test that add command fails if pyproject.toml doesn't have robyn-config section."""
@@ -14,6 +14,8 @@ from tests.integration.conftest import (
     ROOT,
     COMBINATIONS,
     create_fake_package_managers,
+    run_probe,
+    serve_probe,
 )
 
 
@@ -295,6 +297,301 @@ def test_create_project_structure(tmp_path, design, orm):
     assert f'orm = "{orm}"' in pyproject_content
 
 
+@pytest.mark.parametrize("design,orm", COMBINATIONS)
+def test_create_database_middleware_shares_one_session_per_request(
+    tmp_path, design, orm
+):
+    """Drive real Robyn requests through the unit-of-work middleware."""
+    pytest.importorskip(orm)
+    with serve_probe(tmp_path, design, orm, "unit_of_work.py") as client:
+        probe = client.get("/probe")
+        released = client.get("/released")
+
+    assert probe.status_code == 200, probe.text
+    assert probe.json() == {"same": True, "scoped": True}
+    assert released.json() == {"released": True}
+
+
+@pytest.mark.parametrize("design,orm", COMBINATIONS)
+def test_create_routes_readonly_transactions_to_replicas(
+    tmp_path, design, orm
+):
+    """Read-only blocks use a replica until the request writes."""
+    pytest.importorskip(orm)
+    pytest.importorskip("aiosqlite")
+    primary = tmp_path / "primary"
+    replica = tmp_path / "replica.db"
+    env = {
+        "PROBE_PRIMARY": f"{primary}.db",
+        "PROBE_REPLICA": str(replica),
+        "SETTINGS__DATABASE__NAME": str(primary),
+        "SETTINGS__DATABASE__REPLICAS": json.dumps(
+            [f"sqlite+aiosqlite:///{replica}"]
+        ),
+    }
+
+    seen = run_probe(tmp_path, design, orm, "replica_routing.py", env)
+
+    assert seen == {
+        "standalone_read": "replica",
+        "request_read": "replica",
+        "request_write": "primary",
+        "read_after_write": "primary",
+    }
+
+
+@pytest.mark.parametrize("design,orm", COMBINATIONS)
+def test_create_users_repository_projects_login_columns(tmp_path, design, orm):
+    """The login lookup selects only the credential columns."""
+    pytest.importorskip(orm)
+    pytest.importorskip("aiosqlite")
+    env = {"SETTINGS__DATABASE__NAME": str(tmp_path / "projection")}
+
+    seen = run_probe(tmp_path, design, orm, "projection.py", env)
+
+    assert seen == {
+        "credentials": {
+            "username": "ada",
+            "email": "ada@example.com",
+            "password": "hashed",
+            "is_active": True,
+        },
+        "same_id": True,
+        "timestamps": True,
+        "credentials_sql": [True, True, False, False],
+        "missing": "NotFoundError",
+    }
+
+
+@pytest.mark.parametrize("design,orm", COMBINATIONS)
+def test_create_caches_lookup_statements(tmp_path, design, orm):
+    """Lookups reuse built statements and asyncpg caches prepared ones."""
+    pytest.importorskip(orm)
+    pytest.importorskip("aiosqlite")
+    if orm == "sqlalchemy":
+        pytest.importorskip("asyncpg")
+    env = {"SETTINGS__DATABASE__STATEMENT_CACHE_SIZE": "64"}
+    if orm == "tortoise":
+        env["SETTINGS__DATABASE__DRIVER"] = "postgresql+asyncpg"
+    else:
+        env["SETTINGS__DATABASE__NAME"] = str(tmp_path / "statements")
+
+    seen = run_probe(tmp_path, design, orm, "statement_cache.py", env)
+
+    if orm == "tortoise":
+        assert seen == {"statement_cache_size": 64}
+        return
+    assert seen == {
+        "prepared_statement_cache_size": 64,
+        "statement_cache_size": 64,
+        "found": ["ada", "ada@example.com"],
+        "rebuilt": 0,
+    }
+
+
+@pytest.mark.parametrize("design,orm", COMBINATIONS)
+def test_create_users_repository_reads_through_entity_cache(
+    tmp_path, design, orm
+):
+    """User lookups are cached and dropped again when the user changes."""
+    pytest.importorskip(orm)
+    pytest.importorskip("aiosqlite")
+    pytest.importorskip("fakeredis")
+    env = {
+        "SETTINGS__DATABASE__NAME": str(tmp_path / "entity_cache"),
+        "SETTINGS__CACHE__USE_FAKE": "true",
+    }
+
+    seen = run_probe(tmp_path, design, orm, "entity_cache.py", env)
+
+    # [SELECT statements issued, username read]
+    assert seen == {
+        "get": [[1, "ada"], [0, "ada"]],
+        "get_from_redis": [0, "ada"],
+        "login": [[1, "ada"], [0, "ada"]],
+        "own_write": "grace",
+        "after_update": [1, "grace"],
+        "old_login": [1 if design == "ddd" else 2, None],
+        "new_login": [1, "grace"],
+        "after_delete": [1, None],
+    }
+
+
+@pytest.mark.parametrize("design,orm", COMBINATIONS)
+def test_create_entity_cache_invalidates_after_commit(tmp_path, design, orm):
+    """Writes in a request drop cached entries only once it commits."""
+    pytest.importorskip(orm)
+    pytest.importorskip("aiosqlite")
+    pytest.importorskip("fakeredis")
+    env = {
+        "SETTINGS__DATABASE__NAME": str(tmp_path / "entity_cache_rollback"),
+        "SETTINGS__CACHE__USE_FAKE": "true",
+    }
+
+    seen = run_probe(tmp_path, design, orm, "entity_cache_rollback.py", env)
+
+    # [read in the request, cached during it, cached after it, read after]
+    assert seen == {
+        "rolled_back": ["grace", "ada", "ada", "ada"],
+        "committed": ["grace", "ada", None, "grace"],
+    }
+
+
+@pytest.mark.parametrize("design", ["ddd", "mvc"])
+def test_create_cache_repositories_share_a_pooled_client(tmp_path, design):
+    """Cache blocks borrow one pooled client per event loop."""
+    pytest.importorskip("fakeredis")
+    env = {
+        "SETTINGS__CACHE__USE_FAKE": "true",
+        "SETTINGS__CACHE__POOL__MAX_CONNECTIONS": "7",
+        "SETTINGS__CACHE__POOL__HEALTH_CHECK_INTERVAL": "15",
+    }
+
+    seen = run_probe(tmp_path, design, "sqlalchemy", "cache_pool.py", env)
+
+    assert seen == {
+        "clients": 1,
+        "pools": 1,
+        "connections": 1,
+        "closed": 0,
+        "renamed": [0, 1],
+        "pool": "BlockingConnectionPool",
+        "max_connections": 7,
+        "timeout": 5.0,
+        "health_check_interval": 15,
+        "socket_keepalive": True,
+    }
+
+
+@pytest.mark.parametrize("design", ["ddd", "mvc"])
+def test_create_cache_repository_pipelines_writes(tmp_path, design):
+    """Cache writes are queued and sent in one round trip per block."""
+    pytest.importorskip("fakeredis")
+    env = {"SETTINGS__CACHE__USE_FAKE": "true"}
+
+    seen = run_probe(tmp_path, design, "sqlalchemy", "cache_pipeline.py", env)
+
+    assert seen == {
+        "queued": 0,
+        "own_read": 1,
+        "flushed": 3,
+        "ttl": True,
+        "discarded": 2,
+        "many": {"1": 1, "2": 2},
+        "deleted": 0,
+        "executions": [3, 1],
+    }
+
+
+@pytest.mark.parametrize("design", ["ddd", "mvc"])
+def test_create_cache_repository_codecs(tmp_path, design):
+    """Cache entries round-trip through every codec, trusted or not."""
+    for module in ("fakeredis", "orjson", "msgpack", "zstandard"):
+        pytest.importorskip(module)
+    env = {"SETTINGS__CACHE__USE_FAKE": "true"}
+
+    seen = run_probe(tmp_path, design, "sqlalchemy", "cache_codecs.py", env)
+
+    validated = {"equal": True, "created_at": "datetime", "zstd": False}
+    trusted = {"equal": True, "created_at": "datetime", "zstd": True}
+    assert seen == {
+        "same_class": True,
+        "entity": "UserFlat",
+        "json": [validated, trusted],
+        "orjson": [validated, trusted],
+        "msgpack": [validated, trusted],
+        "broken": ["json"],
+    }
+
+
+@pytest.mark.parametrize("design", ["ddd", "mvc"])
+def test_create_cached_operations_coalesce_and_invalidate(tmp_path, design):
+    """Concurrent misses load once; deletes reach every local tier."""
+    pytest.importorskip("aiosqlite")
+    pytest.importorskip("fakeredis")
+    env = {
+        "SETTINGS__DATABASE__NAME": str(tmp_path / "cache_stampede"),
+        "SETTINGS__CACHE__USE_FAKE": "true",
+    }
+
+    seen = run_probe(tmp_path, design, "sqlalchemy", "cache_stampede.py", env)
+
+    assert seen == {
+        "shared": True,
+        "coalesced": [1, ["ada"], 10],
+        "hit": 0,
+        "missing": [1, ["NotFoundError"] * 3],
+        "fresh": True,
+        "early": True,
+        "early_off": True,
+        "invalidated": [True, True],
+    }
+
+
+@pytest.mark.parametrize("design", ["ddd", "mvc"])
+@pytest.mark.parametrize("backend", ["cookie", "redis", "memory"])
+def test_create_sessions_middleware_backends(tmp_path, design, backend):
+    """Sessions round-trip through every backend; reads encode nothing."""
+    pytest.importorskip("fakeredis")
+    env = {
+        "SETTINGS__CACHE__USE_FAKE": "true",
+        "SETTINGS__AUTHENTICATION__SESSION_BACKEND": backend,
+        "SETTINGS__AUTHENTICATION__SESSION_MAX_AGE": "600",
+    }
+    with serve_probe(
+        tmp_path, design, "sqlalchemy", "sessions.py", env
+    ) as client:
+        first = client.get("/count")
+        second = client.get("/count")
+        cookie = client.cookies["robyn_session"]
+        peek = client.get("/peek")
+        stored = client.get("/stored").json()
+        logout = client.get("/logout")
+        after = client.get("/peek")
+
+    assert first.status_code == 200, first.text
+    assert [first.json(), second.json()] == [{"count": 1}, {"count": 2}]
+    assert "Max-Age=600" in second.headers["set-cookie"]
+    assert peek.json() == {"count": 2}
+    if backend == "cookie":
+        assert "set-cookie" not in peek.headers
+    else:
+        # Stored sessions slide on every request, and so does their cookie.
+        assert peek.headers["set-cookie"].startswith(f"robyn_session={cookie};")
+        assert "Max-Age=600" in peek.headers["set-cookie"]
+    assert ("." in cookie) == (backend == "cookie")
+    if backend == "redis":
+        assert stored["keys"] == 1
+        assert 590 < stored["ttls"][0] <= 600
+    else:
+        assert stored == {"keys": 0, "ttls": []}
+    assert "Max-Age=0" in logout.headers["set-cookie"]
+    assert after.json() == {"count": None}
+
+
+@pytest.mark.parametrize("design", ["ddd", "mvc"])
+@pytest.mark.parametrize("backend", ["redis", "memory"])
+def test_create_sessions_never_adopt_client_ids(tmp_path, design, backend):
+    """A cookie naming no stored session is never used as a session id."""
+    pytest.importorskip("fakeredis")
+    env = {
+        "SETTINGS__CACHE__USE_FAKE": "true",
+        "SETTINGS__AUTHENTICATION__SESSION_BACKEND": backend,
+    }
+    planted = {"cookie": "robyn_session=chosen-by-the-client"}
+    with serve_probe(
+        tmp_path, design, "sqlalchemy", "sessions.py", env
+    ) as client:
+        peek = client.get("/peek", headers=planted)
+        count = client.get("/count", headers=planted)
+
+    assert peek.headers["set-cookie"].startswith("robyn_session=;")
+    assert "Max-Age=0" in peek.headers["set-cookie"]
+    assert count.json() == {"count": 1}
+    assert count.headers["set-cookie"].startswith("robyn_session=")
+    assert "chosen-by-the-client" not in count.headers["set-cookie"]
+
+
 def test_create_with_poetry_package_manager(tmp_path):
     """Ensure the CLI can scaffold a project using poetry for dependency management."""
     project_dir = tmp_path / "poetry_project"
@@ -0,0 +1,74 @@
+"""Startup guards: importing the CLI must stay cheap."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[2] / "src"
+
+# Cumulative `python -X importtime` budget for `import cli`. The CLI imports
+# in about 110 ms on a developer laptop; Textual alone adds over 300 ms.
+CLI_IMPORT_BUDGET_MS = 300
+LAZY_MODULES = ("textual", "jinja2", "create.utils._interactive")
+
+
+def _run_python(*args: str) -> subprocess.CompletedProcess[str]:
+    env = os.environ.copy()
+    env["PYTHONPATH"] = str(SRC)
+    return subprocess.run(
+        [sys.executable, *args],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+
+
+def _import_times(stderr: str) -> dict[str, int]:
+    """Parse `-X importtime` output into cumulative times per module."""
+    times: dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_cli_import_skips_heavy_modules_and_stays_in_budget() -> None:
+    result = _run_python("-X", "importtime", "-c", "import cli")
+    times = _import_times(result.stderr)
+
+    heavy = sorted(
+        name
+        for name in times
+        if any(
+            name == lazy or name.startswith(f"{lazy}.")
+            for lazy in LAZY_MODULES
+        )
+    )
+    assert heavy == []
+    elapsed_ms = times["cli"] / 1000
+    assert elapsed_ms < CLI_IMPORT_BUDGET_MS, (
+        f"`import cli` took {elapsed_ms:.1f} ms "
+        f"(budget {CLI_IMPORT_BUDGET_MS} ms)"
+    )
+
+
+def test_cli_help_does_not_load_heavy_modules() -> None:
+    script = (
+        "import sys\n"
+        "import cli\n"
+        "try:\n"
+        "    cli.cli(['--help'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        f"loaded = [m for m in {LAZY_MODULES!r} if m in sys.modules]\n"
+        "print('loaded:', *loaded)\n"
+    )
+    result = _run_python("-c", script)
+
+    assert result.stdout.splitlines()[-1] == "loaded:"
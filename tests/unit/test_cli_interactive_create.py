@@ -8,7 +8,7 @@ import pytest
 from click.testing import CliRunner
 
 import cli as cli_module
-from create import InteractiveCreateConfig
+from create import InteractiveCreateConfig, ManifestResult
 
 
 def _stub_create_pipeline(monkeypatch) -> dict[str, object]:
@@ -43,6 +43,7 @@ def _stub_create_pipeline(monkeypatch) -> dict[str, object]:
         worker: str,
         worker_exp_mode: bool,
         scheduler: bool = False,
+        jobs: int | None = None,
     ) -> None:
         calls["copy_template"] = {
             "destination": destination,
@@ -56,14 +57,21 @@ def _stub_create_pipeline(monkeypatch) -> dict[str, object]:
             "worker": worker,
             "worker_exp_mode": worker_exp_mode,
             "scheduler": scheduler,
+            "jobs": jobs,
         }
 
     def fake_apply_package_manager(
-        destination: Path, package_manager: str
+        destination: Path,
+        package_manager: str,
+        *,
+        lock_cache: bool = True,
+        package_cache_dir: Path | None = None,
     ) -> None:
         calls["apply_package_manager"] = {
             "destination": destination,
             "package_manager": package_manager,
+            "lock_cache": lock_cache,
+            "package_cache_dir": package_cache_dir,
         }
 
     monkeypatch.setattr(
@@ -144,6 +152,7 @@ def test_create_interactive_uses_selected_values(
         "worker": "dramatiq",
         "worker_exp_mode": True,
         "scheduler": True,
+        "jobs": None,
     }
 
 
@@ -393,6 +402,307 @@ def test_create_propagates_scheduler_selection(monkeypatch, tmp_path) -> None:
     assert calls["copy_template"]["scheduler"] is True  # type: ignore[index]
 
 
+def test_create_propagates_jobs_selection(monkeypatch, tmp_path) -> None:
+    """The CLI should pass --jobs into file materialization."""
+    runner = CliRunner()
+    calls = _stub_create_pipeline(monkeypatch)
+
+    result = runner.invoke(
+        cli_module.cli,
+        ["create", "jobs-app", "--jobs", "4", str(tmp_path / "jobs")],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert calls["copy_template"]["jobs"] == 4  # type: ignore[index]
+
+
+def test_create_rejects_non_positive_jobs(monkeypatch, tmp_path) -> None:
+    runner = CliRunner()
+    calls = _stub_create_pipeline(monkeypatch)
+
+    result = runner.invoke(
+        cli_module.cli,
+        ["create", "jobs-app", "--jobs", "0", str(tmp_path / "jobs")],
+    )
+
+    assert result.exit_code != 0
+    assert "copy_template" not in calls
+
+
+def test_create_propagates_lock_cache_options(monkeypatch, tmp_path) -> None:
+    runner = CliRunner()
+    calls = _stub_create_pipeline(monkeypatch)
+
+    result = runner.invoke(
+        cli_module.cli,
+        [
+            "create",
+            "lock-app",
+            "--no-lock-cache",
+            "--package-cache-dir",
+            str(tmp_path / "packages"),
+            str(tmp_path / "lock"),
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert calls["apply_package_manager"] == {
+        "destination": tmp_path / "lock",
+        "package_manager": "uv",
+        "lock_cache": False,
+        "package_cache_dir": tmp_path / "packages",
+    }
+
+
+def test_create_defer_lock_skips_package_manager(
+    monkeypatch, tmp_path
+) -> None:
+    runner = CliRunner()
+    calls = _stub_create_pipeline(monkeypatch)
+    monkeypatch.setattr(
+        cli_module,
+        "defer_package_manager",
+        lambda destination: calls.setdefault("deferred", destination),
+    )
+
+    result = runner.invoke(
+        cli_module.cli,
+        ["create", "defer-app", "--lock", "defer", str(tmp_path / "defer")],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert calls["deferred"] == tmp_path / "defer"
+    assert "apply_package_manager" not in calls
+    assert "package_manager" not in calls
+    assert "robyn-config lock" in result.output
+
+
+def test_create_background_lock_reports_status_file(
+    monkeypatch, tmp_path
+) -> None:
+    runner = CliRunner()
+    calls = _stub_create_pipeline(monkeypatch)
+
+    def fake_start_background_lock(destination, package_manager, **kwargs):
+        calls["background"] = (destination, package_manager, kwargs)
+        return destination / ".robyn-config-lock.json"
+
+    monkeypatch.setattr(
+        cli_module, "start_background_lock", fake_start_background_lock
+    )
+
+    result = runner.invoke(
+        cli_module.cli,
+        ["create", "bg-app", "--lock", "background", str(tmp_path / "bg")],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert calls["background"] == (
+        tmp_path / "bg",
+        "uv",
+        {"lock_cache": True, "package_cache_dir": None},
+    )
+    assert "apply_package_manager" not in calls
+    assert ".robyn-config-lock.json" in result.output
+
+
+def test_lock_command_runs_pending_lock(monkeypatch, tmp_path) -> None:
+    runner = CliRunner()
+    (tmp_path / "pyproject.toml").write_text(
+        '[tool.robyn-config]\ndesign = "ddd"\npackage_manager = "poetry"\n'
+    )
+    calls: dict[str, object] = {}
+
+    def fake_run_pending_lock(project_path, package_manager, **kwargs):
+        calls.update(
+            project_path=project_path,
+            package_manager=package_manager,
+            **kwargs,
+        )
+
+    monkeypatch.setattr(cli_module, "run_pending_lock", fake_run_pending_lock)
+
+    result = runner.invoke(cli_module.cli, ["lock", str(tmp_path)])
+
+    assert result.exit_code == 0, result.output
+    assert calls == {
+        "project_path": tmp_path.resolve(),
+        "package_manager": "poetry",
+        "lock_cache": True,
+        "package_cache_dir": None,
+        "status_path": None,
+    }
+
+
+def _stub_add_batch(monkeypatch) -> dict[str, object]:
+    calls: dict[str, object] = {}
+
+    def fake_add_business_logic_batch(project_path, names):
+        calls.update(project_path=project_path, names=list(names))
+        return []
+
+    monkeypatch.setattr(
+        cli_module, "add_business_logic_batch", fake_add_business_logic_batch
+    )
+    return calls
+
+
+def _write_project_config(project_path: Path) -> None:
+    (project_path / "pyproject.toml").write_text(
+        '[tool.robyn-config]\ndesign = "ddd"\norm = "sqlalchemy"\n'
+    )
+
+
+def test_add_accepts_many_names_and_project_path(
+    monkeypatch, tmp_path
+) -> None:
+    runner = CliRunner()
+    calls = _stub_add_batch(monkeypatch)
+    _write_project_config(tmp_path)
+
+    result = runner.invoke(
+        cli_module.cli, ["add", "product", "order-item", str(tmp_path)]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert calls == {
+        "project_path": tmp_path.resolve(),
+        "names": ["product", "order-item"],
+    }
+    assert "'product', 'order-item'" in result.output
+
+
+def test_add_reads_names_from_file(monkeypatch, tmp_path) -> None:
+    runner = CliRunner()
+    calls = _stub_add_batch(monkeypatch)
+    _write_project_config(tmp_path)
+    names_file = tmp_path / "entities.txt"
+    names_file.write_text("# catalog\nproduct\n\ncategory  # tree\n")
+
+    result = runner.invoke(
+        cli_module.cli,
+        ["add", "--from-file", str(names_file), str(tmp_path)],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert calls == {
+        "project_path": tmp_path.resolve(),
+        "names": ["product", "category"],
+    }
+
+
+def test_add_treats_plain_directory_as_entity_name(
+    monkeypatch, tmp_path
+) -> None:
+    """A `tags/` folder inside the project is not the project path."""
+    runner = CliRunner()
+    calls = _stub_add_batch(monkeypatch)
+    _write_project_config(tmp_path)
+    (tmp_path / "tags").mkdir()
+    monkeypatch.chdir(tmp_path)
+
+    result = runner.invoke(cli_module.cli, ["add", "post", "tags"])
+
+    assert result.exit_code == 0, result.output
+    assert calls == {
+        "project_path": tmp_path.resolve(),
+        "names": ["post", "tags"],
+    }
+
+
+def test_add_project_option_makes_every_positional_a_name(
+    monkeypatch, tmp_path
+) -> None:
+    runner = CliRunner()
+    calls = _stub_add_batch(monkeypatch)
+    project = tmp_path / "project"
+    project.mkdir()
+    _write_project_config(project)
+    (tmp_path / "billing").mkdir()
+    _write_project_config(tmp_path / "billing")
+    monkeypatch.chdir(tmp_path)
+
+    result = runner.invoke(
+        cli_module.cli, ["add", "invoice", "billing", "-p", str(project)]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert calls == {
+        "project_path": project.resolve(),
+        "names": ["invoice", "billing"],
+    }
+
+
+def test_add_without_names_fails(tmp_path) -> None:
+    runner = CliRunner()
+
+    result = runner.invoke(cli_module.cli, ["add"])
+
+    assert result.exit_code != 0
+    assert "Provide at least one NAME" in result.output
+
+
+def test_create_from_manifest_reports_failures(monkeypatch, tmp_path) -> None:
+    runner = CliRunner()
+    manifest = tmp_path / "services.toml"
+    manifest.write_text(
+        "[[projects]]\nname = 'alpha'\n\n[[projects]]\nname = 'beta'\n"
+    )
+    calls: dict[str, object] = {}
+
+    def fake_create_from_manifest(
+        projects, processes, jobs, template_cache, **kwargs
+    ):
+        calls.update(
+            names=[project.name for project in projects],
+            processes=processes,
+            jobs=jobs,
+            template_cache=template_cache,
+            **kwargs,
+        )
+        return [
+            ManifestResult("alpha", tmp_path / "alpha"),
+            ManifestResult("beta", tmp_path / "beta", "boom"),
+        ]
+
+    monkeypatch.setattr(
+        cli_module, "create_from_manifest", fake_create_from_manifest
+    )
+
+    result = runner.invoke(
+        cli_module.cli,
+        ["create", "--from-manifest", str(manifest), "-P", "2", "-j", "3"],
+    )
+
+    assert result.exit_code != 0
+    assert calls == {
+        "names": ["alpha", "beta"],
+        "processes": 2,
+        "jobs": 3,
+        "template_cache": True,
+        "lock_mode": "sync",
+        "lock_cache": True,
+        "package_cache_dir": None,
+    }
+    assert "ok      alpha" in result.output
+    assert "failed  beta: boom" in result.output
+    assert "1 of 2 projects failed." in result.output
+
+
+def test_create_from_manifest_rejects_name(tmp_path) -> None:
+    runner = CliRunner()
+    manifest = tmp_path / "services.toml"
+    manifest.write_text("[[projects]]\nname = 'alpha'\n")
+
+    result = runner.invoke(
+        cli_module.cli,
+        ["create", "alpha", "--from-manifest", str(manifest)],
+    )
+
+    assert result.exit_code != 0
+    assert "--from-manifest cannot be combined" in result.output
+
+
 @pytest.mark.parametrize("worker", ("rq", "dramatiq"))
 def test_create_rejects_scheduler_experimental_mode_without_scheduler(
     monkeypatch, worker
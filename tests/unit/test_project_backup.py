@@ -0,0 +1,233 @@
+"""Unit tests for the journaled project backup used by mutating commands."""
+
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import backup
+
+
+def _make_project(root: Path) -> None:
+    (root / "src" / "app").mkdir(parents=True)
+    (root / "src" / "app" / "__init__.py").write_text("__all__ = []\n")
+    (root / "src" / "app" / "old.py").write_text("OLD = 1\n")
+    (root / "pyproject.toml").write_text("[tool.robyn-config]\n")
+    (root / "scripts").mkdir()
+    (root / "scripts" / "run.sh").write_text("echo run\n")
+
+
+def _snapshot(root: Path) -> dict[str, str | None]:
+    state: dict[str, str | None] = {}
+    for current, dirs, files in os.walk(root):
+        rel = Path(current).relative_to(root)
+        for name in dirs:
+            state[(rel / name).as_posix()] = None
+        for name in files:
+            state[(rel / name).as_posix()] = (Path(current) / name).read_text()
+    return state
+
+
+def test_project_backup_rolls_back_touched_paths(tmp_path) -> None:
+    project = tmp_path / "project"
+    _make_project(project)
+    before = _snapshot(project)
+
+    with pytest.raises(RuntimeError):
+        with backup.project_backup(project):
+            (project / "src" / "app" / "__init__.py").write_text("changed\n")
+            with open(project / "pyproject.toml", "a") as f:
+                f.write("design = 'ddd'\n")
+            (project / "src" / "app" / "old.py").unlink()
+            new_dir = project / "src" / "app" / "domain" / "order"
+            new_dir.mkdir(parents=True)
+            (new_dir / "entity.py").write_text("class Order: ...\n")
+            shutil.rmtree(project / "scripts")
+            raise RuntimeError("boom")
+
+    assert _snapshot(project) == before
+
+
+def test_project_backup_journals_rmtree_audited_without_dir_fd(
+    tmp_path,
+) -> None:
+    """Python 3.10 audits ``shutil.rmtree`` with ``(path,)`` only."""
+    project = tmp_path / "project"
+    _make_project(project)
+    before = _snapshot(project)
+
+    with pytest.raises(RuntimeError):
+        with backup.project_backup(project):
+            scripts = project / "scripts"
+            backup._journal_audit_hook("shutil.rmtree", (str(scripts),))
+            # Hide the events this interpreter raises itself.
+            backup._JOURNAL_STATE.busy = True
+            try:
+                shutil.rmtree(scripts)
+            finally:
+                backup._JOURNAL_STATE.busy = False
+            raise RuntimeError("boom")
+
+    assert _snapshot(project) == before
+
+
+def test_project_backup_restores_files_rewritten_by_subprocesses(
+    tmp_path,
+) -> None:
+    """Package managers run as child processes, outside the audit hook."""
+    project = tmp_path / "project"
+    _make_project(project)
+    before = _snapshot(project)
+    package_manager = (
+        "from pathlib import Path\n"
+        "Path('pyproject.toml').write_text('[project]\\nname = \"x\"\\n')\n"
+        "Path('uv.lock').write_text('version = 1\\n')\n"
+    )
+
+    with pytest.raises(RuntimeError):
+        with backup.project_backup(project):
+            subprocess.run(
+                [sys.executable, "-c", package_manager],
+                cwd=project,
+                check=True,
+            )
+            with open(project / "pyproject.toml", "a") as f:
+                f.write("design = 'ddd'\n")
+            raise RuntimeError("boom")
+
+    assert _snapshot(project) == before
+
+
+def test_project_backup_only_snapshots_modified_files(
+    tmp_path, monkeypatch
+) -> None:
+    project = tmp_path / "project"
+    _make_project(project)
+    (project / ".venv").mkdir()
+    (project / ".venv" / "big.bin").write_bytes(b"0" * 1024)
+    cloned: list[Path] = []
+    original_clone = backup._clone_file
+
+    def tracking_clone(source: Path, target: Path) -> None:
+        cloned.append(Path(source))
+        original_clone(source, target)
+
+    monkeypatch.setattr(backup, "_clone_file", tracking_clone)
+
+    with backup.project_backup(project):
+        (project / "src" / "app" / "__init__.py").read_text()
+        (project / "src" / "app" / "__init__.py").write_text("one\n")
+        (project / "src" / "app" / "__init__.py").write_text("two\n")
+
+    assert cloned == [project / "src" / "app" / "__init__.py"]
+    assert (project / "src" / "app" / "__init__.py").read_text() == "two\n"
+
+
+def test_project_backup_ignores_paths_outside_project(tmp_path) -> None:
+    project = tmp_path / "project"
+    _make_project(project)
+    outside = tmp_path / "outside.txt"
+
+    with pytest.raises(RuntimeError):
+        with backup.project_backup(project):
+            outside.write_text("kept\n")
+            raise RuntimeError("boom")
+
+    assert outside.read_text() == "kept\n"
+
+
+@pytest.mark.parametrize(
+    ("rel_path", "is_dir", "expected"),
+    (
+        (".venv", True, True),
+        (".venv/lib/site.py", False, True),
+        ("src/app/__pycache__/mod.pyc", False, True),
+        ("logs/app.log", False, True),
+        ("db.sqlite3", False, True),
+        ("src/app/logs.py", False, False),
+        ("src/app/models.py", False, False),
+        ("build", False, False),
+        ("build/out.txt", False, True),
+        ("docs/_build/index.html", False, True),
+        ("src/docs/_build/index.html", False, False),
+        ("keep.log", False, False),
+    ),
+)
+def test_backup_scope_matches_gitignore_style_patterns(
+    rel_path, is_dir, expected
+) -> None:
+    scope = backup._BackupScope(
+        (
+            *backup.DEFAULT_BACKUP_EXCLUDE,
+            "build/",
+            "docs/_build/",
+            "!keep.log",
+        )
+    )
+
+    assert scope.excludes(Path(rel_path), is_dir) is expected
+
+
+def test_backup_scope_reads_gitignore_and_project_config(tmp_path) -> None:
+    (tmp_path / ".gitignore").write_text("# generated\nsecrets/\n")
+    (tmp_path / "pyproject.toml").write_text(
+        "[tool.robyn-config]\n"
+        'design = "ddd"\n'
+        "\n"
+        "[tool.robyn-config.backup]\n"
+        'exclude = ["data/"]\n'
+        'extend_exclude = ["*.bin"]\n'
+    )
+
+    scope = backup._BackupScope.for_project(tmp_path)
+
+    assert scope.excludes(Path("data"), True)
+    assert scope.excludes(Path("secrets/key.pem"), False)
+    assert scope.excludes(Path("model.bin"), False)
+    assert not scope.excludes(Path(".venv"), True)
+
+    (tmp_path / "pyproject.toml").write_text(
+        "[tool.robyn-config]\n"
+        'design = "ddd"\n'
+        "\n"
+        "[tool.robyn-config.backup]\n"
+        "respect_gitignore = false\n"
+    )
+
+    scope = backup._BackupScope.for_project(tmp_path)
+
+    assert scope.excludes(Path(".venv"), True)
+    assert not scope.excludes(Path("secrets/key.pem"), False)
+
+
+def test_project_backup_skips_excluded_paths(tmp_path, monkeypatch) -> None:
+    project = tmp_path / "project"
+    _make_project(project)
+    (project / ".venv" / "lib").mkdir(parents=True)
+    (project / ".venv" / "lib" / "site.py").write_text("venv\n")
+    (project / "src" / "app" / "__pycache__").mkdir()
+    (project / "src" / "app" / "__pycache__" / "old.pyc").write_text("pyc\n")
+    cloned: list[Path] = []
+    original_clone = backup._clone_file
+
+    def tracking_clone(source, target) -> None:
+        cloned.append(Path(source))
+        original_clone(source, target)
+
+    monkeypatch.setattr(backup, "_clone_file", tracking_clone)
+
+    with pytest.raises(RuntimeError):
+        with backup.project_backup(project):
+            (project / ".venv" / "lib" / "site.py").write_text("changed\n")
+            shutil.rmtree(project / "src")
+            raise RuntimeError("boom")
+
+    assert project / ".venv" / "lib" / "site.py" not in cloned
+    assert not any("__pycache__" in path.parts for path in cloned)
+    assert (project / "src" / "app" / "old.py").read_text() == "OLD = 1\n"
+    assert (project / ".venv" / "lib" / "site.py").read_text() == "changed\n"
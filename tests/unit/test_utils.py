@@ -1,3 +1,8 @@
+import json
+import os
+import subprocess
+import time
+
 import pytest
 from itertools import product
 from pathlib import Path
@@ -7,6 +12,9 @@ import src.create as create_module
 import src.create.utils as create_utils
 from src.create.utils import _config as create_config
 from src.create.utils import _filesystem as create_filesystem
+from src.create.utils import _manifest as create_manifest
+from src.create.utils import _package_manager as create_package_manager
+from src.create.utils import _template_cache as template_cache
 from src.add import utils as add_utils
 from src.add.utils import _injection as add_injection
 from src.add.utils import _paths as add_paths
@@ -551,7 +559,7 @@ def test_get_template_config_nosql_defaults_to_none():
     assert config["nosql"] == ()
 
 
-def test_copy_nosql_files_merges_selected_overlays(tmp_path, monkeypatch):
+def test_plan_nosql_files_merges_selected_overlays(tmp_path, monkeypatch):
     """Selected NoSQL overlays should merge without provider collisions."""
     nosql_dir = tmp_path / "nosql"
     (nosql_dir / "common").mkdir(parents=True)
@@ -568,11 +576,10 @@ def test_copy_nosql_files_merges_selected_overlays(tmp_path, monkeypatch):
         create_filesystem, "NOSQL_DIR", nosql_dir, raising=False
     )
 
-    create_filesystem._copy_nosql_files(
-        destination,
-        "ddd",
-        ("mongodb", "neo4j"),
-        {"nosql": ("mongodb", "neo4j")},
+    plan = {}
+    create_filesystem._plan_nosql_files(plan, "ddd", ("mongodb", "neo4j"))
+    create_filesystem._write_plan(
+        destination, plan, {"nosql": ("mongodb", "neo4j")}
     )
 
     generated = destination / "src" / "app" / "config" / "nosql"
@@ -580,27 +587,25 @@ def test_copy_nosql_files_merges_selected_overlays(tmp_path, monkeypatch):
     assert (generated / "neo4j.py").read_text() == 'PROVIDER = "neo4j"\n'
 
 
-def test_copy_nosql_files_none_is_noop(tmp_path):
-    """The none provider should not create application files."""
-    destination = tmp_path / "generated"
+def test_plan_nosql_files_none_is_noop():
+    """The none provider should not plan application files."""
+    plan = {}
 
-    create_filesystem._copy_nosql_files(destination, "ddd", (), {"nosql": ()})
+    create_filesystem._plan_nosql_files(plan, "ddd", ())
 
-    assert not destination.exists()
+    assert plan == {}
 
 
-def test_copy_worker_files_none_is_noop(tmp_path):
-    """The none worker should not create application files."""
-    destination = tmp_path / "generated"
+def test_plan_worker_files_none_is_noop():
+    """The none worker should not plan application files."""
+    plan = {}
 
-    create_filesystem._copy_worker_files(
-        destination, "ddd", "none", {"worker": "none"}
-    )
+    create_filesystem._plan_worker_files(plan, "ddd", "none")
 
-    assert not destination.exists()
+    assert plan == {}
 
 
-def test_copy_worker_files_renders_selected_overlay(tmp_path, monkeypatch):
+def test_plan_worker_files_renders_selected_overlay(tmp_path, monkeypatch):
     """The selected worker overlay should be copied and rendered."""
     workers_dir = tmp_path / "workers"
     config_dir = workers_dir / "ddd" / "celery" / "config"
@@ -614,10 +619,11 @@ def test_copy_worker_files_renders_selected_overlay(tmp_path, monkeypatch):
         create_filesystem, "WORKERS_DIR", workers_dir, raising=False
     )
 
-    create_filesystem._copy_worker_files(
+    plan = {}
+    create_filesystem._plan_worker_files(plan, "ddd", "celery")
+    create_filesystem._write_plan(
         destination,
-        "ddd",
-        "celery",
+        plan,
         {"worker": "celery", "worker_queue": "app.workers"},
     )
 
@@ -635,7 +641,7 @@ def test_copy_worker_files_renders_selected_overlay(tmp_path, monkeypatch):
         ("mvc", "rabbitmq", "RabbitmqBroker", "RedisBroker"),
     ],
 )
-def test_copy_worker_files_renders_only_selected_dramatiq_broker(
+def test_plan_worker_files_renders_only_selected_dramatiq_broker(
     tmp_path, design, backend, selected_broker, excluded_broker
 ):
     """Dramatiq overlays should not import an unused optional backend."""
@@ -648,12 +654,9 @@ def test_copy_worker_files_renders_only_selected_dramatiq_broker(
         "worker_redis_db": 1,
     }
 
-    create_filesystem._copy_worker_files(
-        destination,
-        design,
-        "dramatiq",
-        context,
-    )
+    plan = {}
+    create_filesystem._plan_worker_files(plan, design, "dramatiq")
+    create_filesystem._write_plan(destination, plan, context)
 
     relative_broker = (
         Path("infrastructure/worker/broker.py")
@@ -670,19 +673,16 @@ def test_copy_worker_files_renders_only_selected_dramatiq_broker(
     assert "dramatiq.set_broker(broker)" in broker_content
 
 
-def test_copy_worker_files_raises_for_missing_overlay(tmp_path, monkeypatch):
+def test_plan_worker_files_raises_for_missing_overlay(tmp_path, monkeypatch):
     """A selected worker without templates should fail with a clear error."""
     workers_dir = tmp_path / "workers"
-    destination = tmp_path / "generated"
 
     monkeypatch.setattr(
         create_filesystem, "WORKERS_DIR", workers_dir, raising=False
     )
 
     with pytest.raises(FileNotFoundError) as exc_info:
-        create_filesystem._copy_worker_files(
-            destination, "ddd", "celery", {"worker": "celery"}
-        )
+        create_filesystem._plan_worker_files({}, "ddd", "celery")
 
     assert str(exc_info.value) == (
         "Could not find worker template for 'ddd/celery'."
@@ -732,30 +732,398 @@ def test_copy_template_renders_selected_worker_settings(
     assert worker_content == 'WORKER = "rq"\nEXPERIMENTAL = True\n'
 
 
-def test_render_jinja2_in_tree(tmp_path):
-    """_render_jinja2_in_tree renders .jinja2 files and deletes them."""
-    sub_dir = tmp_path / "sub"
-    sub_dir.mkdir()
-    jinja_file = sub_dir / "base.py.jinja2"
-    jinja_file.write_text("id = {{ uid }}")
+def test_plan_tree_renders_templates_from_source(tmp_path):
+    """Planned *.jinja2 files are rendered from the packaged source."""
+    source = tmp_path / "source"
+    (source / "sub").mkdir(parents=True)
+    (source / "sub" / "base.py.jinja2").write_text("id = {{ uid }}")
+    (source / "file.py").write_text("class Foo: {{ not_rendered }}")
+    (source / "__pycache__").mkdir()
+    (source / "__pycache__" / "file.cpython-311.pyc").write_bytes(b"")
+    target = tmp_path / "target"
+
+    plan = {}
+    create_filesystem._plan_tree(plan, source, Path("app"))
+    create_filesystem._write_plan(target, plan, {"uid": "sparkid"})
+
+    assert (target / "app" / "sub" / "base.py").read_text() == "id = sparkid"
+    assert (target / "app" / "file.py").read_text() == (
+        "class Foo: {{ not_rendered }}"
+    )
+    assert not list(target.rglob("*.jinja2"))
+    assert not (target / "app" / "__pycache__").exists()
+    assert (source / "sub" / "base.py.jinja2").exists()
+
+
+def test_plan_tree_later_overlays_replace_earlier_entries(tmp_path):
+    """An overlay file replaces a base file planned for the same path."""
+    base = tmp_path / "base"
+    overlay = tmp_path / "overlay"
+    base.mkdir()
+    overlay.mkdir()
+    (base / "settings.py").write_text("BASE = True\n")
+    (overlay / "settings.py.jinja2").write_text("NAME = '{{ name }}'\n")
+    (base / "skipped").mkdir()
+    (base / "skipped" / "ignored.py").write_text("")
+
+    plan = {}
+    create_filesystem._plan_tree(
+        plan, base, Path("app"), {base.resolve(): {"skipped"}}
+    )
+    create_filesystem._plan_tree(plan, overlay, Path("app"))
+    create_filesystem._write_plan(tmp_path / "out", plan, {"name": "svc"})
 
-    create_filesystem._render_jinja2_in_tree(tmp_path, {"uid": "sparkid"})
+    assert set(plan) == {Path("app/settings.py")}
+    assert (tmp_path / "out" / "app" / "settings.py").read_text() == (
+        "NAME = 'svc'\n"
+    )
 
-    rendered = sub_dir / "base.py"
-    assert rendered.exists()
-    assert rendered.read_text() == "id = sparkid"
-    assert not jinja_file.exists()
 
+@pytest.mark.parametrize("jobs", (1, 4))
+def test_write_plan_materializes_files_with_jobs(tmp_path, jobs):
+    """Sequential and threaded writers produce the same tree."""
+    source = tmp_path / "source"
+    for index in range(12):
+        package = source / f"pkg{index % 3}" / "nested"
+        package.mkdir(parents=True, exist_ok=True)
+        (package / f"module{index}.py.jinja2").write_text(
+            f"VALUE = {index}  # {{{{ name }}}}\n"
+        )
+    target = tmp_path / "target"
 
-def test_render_jinja2_in_tree_noop_when_no_templates(tmp_path):
-    """_render_jinja2_in_tree is a no-op when no .jinja2 files exist."""
-    regular_file = tmp_path / "file.py"
-    regular_file.write_text("class Foo: pass")
+    plan = {}
+    create_filesystem._plan_tree(plan, source, Path("app"))
+    create_filesystem._write_plan(target, plan, {"name": "svc"}, jobs=jobs)
 
-    create_filesystem._render_jinja2_in_tree(tmp_path, {"uid": "none"})
+    for index in range(12):
+        module = (
+            target / "app" / f"pkg{index % 3}" / "nested" / f"module{index}.py"
+        )
+        assert module.read_text() == f"VALUE = {index}  # svc\n"
 
-    assert regular_file.exists()
-    assert regular_file.read_text() == "class Foo: pass"
+
+def test_plan_directories_returns_only_leaf_directories(tmp_path):
+    plan = {
+        Path("a/b/c/file.py"): None,
+        Path("a/b/other.py"): None,
+        Path("a/d/file.py"): None,
+    }
+
+    directories = create_filesystem._plan_directories(tmp_path, plan)
+
+    assert directories == {tmp_path / "a/b/c", tmp_path / "a/d"}
+
+
+def test_load_manifest_merges_defaults_and_resolves_destinations(tmp_path):
+    manifest = tmp_path / "services.toml"
+    manifest.write_text("""
+[defaults]
+orm = "tortoise"
+package-manager = "poetry"
+
+[[projects]]
+name = "billing"
+destination = "services/billing"
+broker = "redis"
+worker = "celery"
+nosql = ["mongodb", "neo4j"]
+
+[[projects]]
+name = "search"
+design = "MVC"
+""")
+
+    billing, search = create_manifest.load_manifest(manifest)
+
+    assert billing.destination == tmp_path / "services" / "billing"
+    assert billing.orm == "tortoise"
+    assert billing.package_manager == "poetry"
+    assert billing.nosql == ("mongodb", "neo4j")
+    assert billing.worker == "celery"
+    assert search.destination == tmp_path / "search"
+    assert search.design == "mvc"
+    assert search.nosql == ()
+
+
+@pytest.mark.parametrize(
+    ("body", "message"),
+    (
+        ("[defaults]\norm = 'sqlalchemy'\n", "at least one"),
+        ("[[projects]]\ndesign = 'ddd'\n", "'name' is required"),
+        ("[[projects]]\nname = 'a'\norm = 'peewee'\n", "unsupported orm"),
+        ("[[projects]]\nname = 'a'\ncolour = 'red'\n", "unknown keys"),
+        ("[[projects]]\nname = 'a'\nscheduler = true\n", "--scheduler"),
+        ("projects = [1]\n", r"projects\[0\]: must be a table"),
+        ("defaults = 1\n[[projects]]\nname = 'a'\n", "must be a table"),
+        (
+            "[[projects]]\nname = 'a'\nnosql = 5\n",
+            r"projects\[0\]: 'nosql' must be",
+        ),
+        (
+            "[[projects]]\nname = 'a'\nnosql = [1]\n",
+            r"projects\[0\]: 'nosql' must be",
+        ),
+        (
+            "[[projects]]\nname = 'a'\n[[projects]]\nname = 'a'\n",
+            "Duplicate",
+        ),
+    ),
+)
+def test_load_manifest_rejects_invalid_entries(tmp_path, body, message):
+    manifest = tmp_path / "services.toml"
+    manifest.write_text(body)
+
+    with pytest.raises(ValueError, match=message):
+        create_manifest.load_manifest(manifest)
+
+
+def test_create_from_manifest_reports_each_project(tmp_path, monkeypatch):
+    """A failing project is cleaned up without stopping the others."""
+    locked: list[Path] = []
+    monkeypatch.setattr(
+        create_manifest, "ensure_package_manager_available", lambda _: None
+    )
+    monkeypatch.setattr(
+        create_manifest,
+        "apply_package_manager",
+        lambda destination, _, **__: locked.append(destination),
+    )
+    occupied = tmp_path / "occupied"
+    occupied.mkdir()
+    (occupied / "Makefile").write_text("keep\n")
+    projects = [
+        create_manifest.ManifestProject("alpha", tmp_path / "alpha"),
+        create_manifest.ManifestProject("occupied", occupied),
+    ]
+
+    alpha, failed = create_manifest.create_from_manifest(projects, 1, jobs=1)
+
+    assert alpha.ok
+    assert (tmp_path / "alpha" / "pyproject.toml").exists()
+    assert locked == [tmp_path / "alpha"]
+    assert not failed.ok
+    assert "Makefile" in failed.error
+    assert sorted(p.name for p in occupied.iterdir()) == ["Makefile"]
+    assert (occupied / "Makefile").read_text() == "keep\n"
+
+
+def _stub_uv_lock(monkeypatch, tmp_path) -> list[dict[str, str]]:
+    """Stub `uv lock` so it records its environment and writes uv.lock."""
+    runs: list[dict[str, str]] = []
+
+    def fake_run(command, cwd=None, env=None, **kwargs):
+        if command[-1] == "--version":
+            return subprocess.CompletedProcess(command, 0, "uv 0.5.0\n", "")
+        runs.append(env)
+        (Path(cwd) / "uv.lock").write_text(f"# lock {len(runs)}\n")
+        return subprocess.CompletedProcess(command, 0, "", "")
+
+    monkeypatch.setenv(template_cache.CACHE_DIR_ENV_VAR, str(tmp_path / "c"))
+    monkeypatch.delenv("UV_CACHE_DIR", raising=False)
+    monkeypatch.setattr(
+        create_package_manager,
+        "ensure_package_manager_available",
+        lambda _: None,
+    )
+    monkeypatch.setattr(create_package_manager.subprocess, "run", fake_run)
+    create_package_manager._package_manager_version.cache_clear()
+    return runs
+
+
+def test_apply_package_manager_reuses_cached_lock(tmp_path, monkeypatch):
+    """Identical pyproject.toml files are only resolved once."""
+    runs = _stub_uv_lock(monkeypatch, tmp_path)
+    first, second, other = (tmp_path / name for name in ("a", "b", "c"))
+    for project, content in ((first, "x"), (second, "x"), (other, "y")):
+        project.mkdir()
+        (project / "pyproject.toml").write_text(f"name = '{content}'\n")
+
+    create_package_manager.apply_package_manager(first, "uv")
+    create_package_manager.apply_package_manager(second, "uv")
+    create_package_manager.apply_package_manager(other, "uv")
+    create_package_manager.apply_package_manager(
+        second, "uv", lock_cache=False
+    )
+
+    assert len(runs) == 3
+    assert (first / "uv.lock").read_text() == "# lock 1\n"
+    assert (other / "uv.lock").read_text() == "# lock 2\n"
+    assert (second / "uv.lock").read_text() == "# lock 3\n"
+
+
+def test_apply_package_manager_uses_shared_package_cache(
+    tmp_path, monkeypatch
+):
+    runs = _stub_uv_lock(monkeypatch, tmp_path)
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "pyproject.toml").write_text("name = 'x'\n")
+
+    create_package_manager.apply_package_manager(
+        project, "uv", lock_cache=False
+    )
+    create_package_manager.apply_package_manager(
+        project,
+        "uv",
+        lock_cache=False,
+        package_cache_dir=tmp_path / "packages",
+    )
+
+    assert runs[0]["UV_CACHE_DIR"] == str(project / ".uv-cache")
+    assert runs[1]["UV_CACHE_DIR"] == str(tmp_path / "packages")
+
+
+def test_lock_pending_marker_round_trips(tmp_path):
+    pyproject = tmp_path / "pyproject.toml"
+    original = (
+        "[tool.robyn-config]\n"
+        'design = "ddd"\n'
+        "\n"
+        "[tool.robyn-config.add]\n"
+        'domain_path = "src/app/domain"\n'
+    )
+    pyproject.write_text(original)
+
+    create_package_manager.defer_package_manager(tmp_path)
+    create_package_manager.defer_package_manager(tmp_path)
+
+    assert create_package_manager.is_lock_pending(tmp_path)
+    assert pyproject.read_text().count('lock = "pending"') == 1
+    assert add_paths.read_project_config(tmp_path)["lock"] == "pending"
+
+    create_package_manager._set_lock_pending(pyproject, False)
+
+    assert not create_package_manager.is_lock_pending(tmp_path)
+    assert pyproject.read_text() == original
+
+
+def test_run_pending_lock_clears_marker_and_records_status(
+    tmp_path, monkeypatch
+):
+    _stub_uv_lock(monkeypatch, tmp_path)
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "pyproject.toml").write_text('[tool.robyn-config]\norm = "x"\n')
+    create_package_manager.defer_package_manager(project)
+    status_path = project / create_package_manager.LOCK_STATUS_FILE
+
+    create_package_manager.run_pending_lock(
+        project, "uv", status_path=status_path
+    )
+
+    assert (project / "uv.lock").exists()
+    assert not create_package_manager.is_lock_pending(project)
+    assert json.loads(status_path.read_text())["status"] == "succeeded"
+
+
+def test_run_pending_lock_keeps_marker_on_failure(tmp_path, monkeypatch):
+    def failing_apply(*args, **kwargs):
+        raise RuntimeError("resolution failed")
+
+    monkeypatch.setattr(
+        create_package_manager, "apply_package_manager", failing_apply
+    )
+    (tmp_path / "pyproject.toml").write_text(
+        '[tool.robyn-config]\norm = "x"\n'
+    )
+    create_package_manager.defer_package_manager(tmp_path)
+    status_path = tmp_path / "status.json"
+
+    with pytest.raises(RuntimeError):
+        create_package_manager.run_pending_lock(
+            tmp_path, "uv", status_path=status_path
+        )
+
+    assert create_package_manager.is_lock_pending(tmp_path)
+    status = json.loads(status_path.read_text())
+    assert status["status"] == "failed"
+    assert status["error"] == "resolution failed"
+
+
+def test_start_background_lock_runs_detached_locker(tmp_path, monkeypatch):
+    """The spawned ``cli lock`` process resolves and records success."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    uv = bin_dir / "uv"
+    uv.write_text(
+        "#!/usr/bin/env bash\n"
+        'if [ "$1" = "lock" ]; then touch "$PWD/uv.lock"; exit 0; fi\n'
+        "exit 1\n"
+    )
+    uv.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "pyproject.toml").write_text(
+        '[tool.robyn-config]\npackage_manager = "uv"\n'
+    )
+
+    status_path = create_package_manager.start_background_lock(
+        project, "uv", lock_cache=False
+    )
+
+    assert create_package_manager.is_lock_pending(project)
+    deadline = time.monotonic() + 30
+    status = "running"
+    while status == "running" and time.monotonic() < deadline:
+        time.sleep(0.1)
+        status = json.loads(status_path.read_text())["status"]
+    assert status == "succeeded"
+    assert (project / "uv.lock").exists()
+    assert not create_package_manager.is_lock_pending(project)
+
+
+def test_template_cache_persists_compiled_templates(tmp_path, monkeypatch):
+    """Rendering stores compiled bytecode under the user cache dir."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv(template_cache.CACHE_DIR_ENV_VAR, str(cache_dir))
+    template_cache._template_environment.cache_clear()
+    template = tmp_path / "greeting.txt.jinja2"
+    template.write_text("Hello {{ name }}\n")
+
+    try:
+        rendered = template_cache._render_template_path(
+            template, {"name": "robyn"}, keep_trailing_newline=True
+        )
+    finally:
+        template_cache._template_environment.cache_clear()
+
+    assert rendered == "Hello robyn\n"
+    assert list((cache_dir / "templates").rglob("*.cache"))
+
+
+def test_template_cache_can_be_disabled(tmp_path, monkeypatch):
+    """configure_template_cache(False) skips the persistent bytecode cache."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv(template_cache.CACHE_DIR_ENV_VAR, str(cache_dir))
+    template = tmp_path / "greeting.txt.jinja2"
+    template.write_text("Hello {{ name }}")
+
+    template_cache.configure_template_cache(False)
+    try:
+        rendered = template_cache._render_template_path(
+            template, {"name": "robyn"}
+        )
+    finally:
+        template_cache.configure_template_cache(True)
+
+    assert rendered == "Hello robyn"
+    assert not cache_dir.exists()
+
+
+def test_template_cache_reloads_changed_templates(tmp_path, monkeypatch):
+    """A modified template source is recompiled instead of served stale."""
+    monkeypatch.setenv(
+        template_cache.CACHE_DIR_ENV_VAR, str(tmp_path / "cache")
+    )
+    template = tmp_path / "value.txt.jinja2"
+    template.write_text("first")
+    assert template_cache._render_template_path(template, {}) == "first"
+
+    template.write_text("second")
+    os.utime(template, ns=(0, 0))
+
+    assert template_cache._render_template_path(template, {}) == "second"
 
 
 def _generated_base_path(destination: Path, design: str) -> Path:
@@ -864,6 +1232,38 @@ def test_copy_template_renders_uid_base_templates(
     assert not list(destination.rglob("*.jinja2"))
 
 
+@pytest.mark.parametrize("design", ("ddd", "mvc"))
+@pytest.mark.parametrize(
+    ("orm", "expected_fields", "unexpected_fields"),
+    [
+        (
+            "sqlalchemy",
+            ['kind: Literal["queue", "null"] = "queue"', "max_overflow: int"],
+            ["max_size: int"],
+        ),
+        ("tortoise", ["min_size: int", "max_size: int"], ["max_overflow"]),
+    ],
+)
+def test_copy_template_renders_per_orm_pool_settings(
+    tmp_path, design, orm, expected_fields, unexpected_fields
+):
+    create_filesystem.copy_template(
+        tmp_path, orm, design, "pool-project", "uv", jobs=1
+    )
+
+    config = (tmp_path / "src/app/config/database.py").read_text()
+    prod = (tmp_path / "compose/app/prod.py").read_text()
+
+    compile(config, "database.py", "exec")
+    assert "pool: PoolSettings = PoolSettings()" in config
+    for field in expected_fields:
+        assert field in config
+    for field in unexpected_fields:
+        assert field not in config
+    assert "def _pool_defaults(processes: int, workers: int)" in prod
+    assert "str(PROCESSES)" in prod
+
+
 @pytest.mark.parametrize(
     ("package_manager", "uid", "expected_dependency"),
     [
@@ -1004,6 +1404,141 @@ def test_add_to_all_list(tmp_path):
     assert content.count("__all__") == 1
 
 
+def test_injection_session_batches_edits_into_one_write(tmp_path, monkeypatch):
+    init_path = tmp_path / "__init__.py"
+    init_path.write_text(
+        '"""Views."""\n'
+        "\n"
+        "from .users import register as register_users  # noqa: F401\n"
+        "\n"
+        '__all__ = ("register_users",)\n'
+    )
+    writes: list[Path] = []
+    original_write_text = Path.write_text
+
+    def tracking_write_text(self, *args, **kwargs):
+        writes.append(self)
+        return original_write_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "write_text", tracking_write_text)
+
+    with add_injection.injection_session():
+        for name in ("product", "order"):
+            add_injection._update_init_file(
+                init_path,
+                f"from .{name} import register as register_{name}",
+                f"register_{name}",
+            )
+        add_injection._update_init_file(
+            init_path,
+            "from .product import register as register_product",
+            "register_product",
+        )
+        assert writes == []
+
+    assert writes == [init_path]
+    assert init_path.read_text() == (
+        '"""Views."""\n'
+        "\n"
+        "from .users import register as register_users  # noqa: F401\n"
+        "from .product import register as register_product\n"
+        "from .order import register as register_order\n"
+        "\n"
+        '__all__ = ("register_users", "register_product", "register_order")\n'
+    )
+
+
+def test_injection_session_applies_mixed_edits_from_one_parse(tmp_path):
+    urls_path = tmp_path / "urls.py"
+    urls_path.write_text(
+        "from .views import (\n"
+        "    users,\n"
+        ")\n"
+        "\n"
+        "\n"
+        "def register(app):\n"
+        "    users.register(app)\n"
+    )
+
+    with add_injection.injection_session():
+        add_injection._register_routes_mvc(urls_path, "product")
+        add_injection._register_routes_mvc(urls_path, "order")
+
+    assert urls_path.read_text() == (
+        "from .views import (\n"
+        "    users,\n"
+        "    product,\n"
+        "    order,\n"
+        ")\n"
+        "\n"
+        "\n"
+        "def register(app):\n"
+        "    users.register(app)\n"
+        "    product.register(app)\n"
+        "    order.register(app)\n"
+    )
+
+
+def test_injection_session_rejects_invalid_python_without_writing(
+    tmp_path,
+):
+    valid = tmp_path / "valid.py"
+    valid.write_text("from .models import User\n")
+    broken = tmp_path / "broken.py"
+    broken.write_text("from .models import (\n")
+
+    with pytest.raises(ValueError, match="broken.py"):
+        with add_injection.injection_session():
+            add_injection._ensure_import_from(valid, ".models", "Product")
+            add_injection._ensure_import_from(broken, ".models", "Product")
+
+    assert valid.read_text() == "from .models import User\n"
+    assert broken.read_text() == "from .models import (\n"
+
+
+@pytest.mark.parametrize("design", ("ddd", "mvc"))
+def test_add_business_logic_batch_writes_shared_files_once(
+    tmp_path, monkeypatch, design
+):
+    create_filesystem.copy_template(
+        tmp_path, "sqlalchemy", design, "demo", "uv", jobs=1
+    )
+    writes: list[Path] = []
+    original_write_text = Path.write_text
+
+    def tracking_write_text(self, *args, **kwargs):
+        writes.append(self)
+        return original_write_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "write_text", tracking_write_text)
+
+    created = add_utils.add_business_logic_batch(
+        tmp_path, ["product", "order-item", "Product"]
+    )
+
+    assert len(writes) == len(set(writes))
+    assert len(created) == len(set(created))
+    routes = (
+        tmp_path / "src/app/presentation/__init__.py"
+        if design == "ddd"
+        else tmp_path / "src/app/urls.py"
+    ).read_text()
+    assert routes.count("product.register(app)") == 1
+    assert routes.count("order_item.register(app)") == 1
+
+
+def test_add_business_logic_batch_rejects_invalid_names(tmp_path):
+    (tmp_path / "pyproject.toml").write_text(
+        "[tool.robyn-config]\ndesign = 'ddd'\norm = 'sqlalchemy'\n"
+    )
+
+    with pytest.raises(ValueError, match="Invalid entity name 'class'"):
+        add_utils.add_business_logic_batch(tmp_path, ["product", "class"])
+
+    with pytest.raises(ValueError, match="No entity names"):
+        add_utils.add_business_logic_batch(tmp_path, [])
+
+
 @pytest.mark.parametrize(
     ("design", "uid_line", "expected_uid"),
     [